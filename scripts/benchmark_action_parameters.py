@@ -0,0 +1,91 @@
+"""
+Measure the cost of casting the parameters of event actions.
+
+Every action class is loaded, and for each one the parameters are cast as
+many times as --repeat, first resolving the type hints on every call like
+before the casters were cached, then with the cached caster.  The mean
+cost per action is printed for both.
+
+Run from the root folder:
+
+    python scripts/benchmark_action_parameters.py --repeat 2000
+
+"""
+import argparse
+import os
+import sys
+import time
+import typing
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tuxemon import plugin  # noqa: E402
+from tuxemon.constants import paths  # noqa: E402
+from tuxemon.event.eventaction import EventAction  # noqa: E402
+from tuxemon.tools import (  # noqa: E402
+    cast_parameters_to_namedtuple,
+    cast_values,
+    get_types_tuple,
+)
+
+
+def cast_uncached(parameters, namedtuple_class):
+    valid_parameters = [
+        (get_types_tuple(typing.get_type_hints(namedtuple_class)[f]), f)
+        for f in namedtuple_class._fields
+    ]
+    return namedtuple_class(*cast_values(parameters, valid_parameters))
+
+
+def example_parameters(namedtuple_class):
+    """Make string parameters which can be cast to every field."""
+    parameters = []
+    for name in namedtuple_class._fields:
+        types = get_types_tuple(typing.get_type_hints(namedtuple_class)[name])
+        if int in types or float in types:
+            parameters.append("1")
+        else:
+            parameters.append("value")
+    return parameters
+
+
+def time_cast(cast, cases, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for parameters, namedtuple_class in cases:
+            cast(parameters, namedtuple_class)
+    return (time.perf_counter() - start) / (repeat * len(cases))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    actions = plugin.load_plugins(
+        paths.ACTIONS_PATH,
+        "actions",
+        interface=EventAction,
+    )
+    cases = []
+    for action in actions.values():
+        namedtuple_class = action.param_class
+        if not namedtuple_class._fields:
+            continue
+        parameters = example_parameters(namedtuple_class)
+        try:
+            cast_uncached(parameters, namedtuple_class)
+        except ValueError:
+            continue
+        cases.append((parameters, namedtuple_class))
+
+    before = time_cast(cast_uncached, cases, args.repeat)
+    after = time_cast(cast_parameters_to_namedtuple, cases, args.repeat)
+    print(f"{len(cases)} actions with parameters")
+    print(f"type hints resolved per call: {before * 1e6:8.2f} us per action")
+    print(f"cached caster:                {after * 1e6:8.2f} us per action")
+    print(f"speedup: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Compare serial and parallel loading of the game database.
+
+Loads every table under mods/tuxemon/db several times, serially and with a
+pool of threads and a pool of processes, and prints the best time of each.
+The snapshot cache is not used, so every run parses all the JSON files.
+
+Run from the root folder:
+
+    python scripts/benchmark_db_load.py --workers 4 --repeat 5
+
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tuxemon.db import JSONDatabase  # noqa: E402
+
+
+def time_load(repeat, workers=0, use_processes=False):
+    best = None
+    for _ in range(repeat):
+        db = JSONDatabase()
+        start = time.perf_counter()
+        db.load(workers=workers, use_processes=use_processes)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    serial = time_load(args.repeat)
+    threads = time_load(args.repeat, args.workers)
+    processes = time_load(args.repeat, args.workers, use_processes=True)
+
+    print(f"serial:              {serial * 1000:8.1f} ms")
+    print(f"{args.workers:2d} threads:          {threads * 1000:8.1f} ms")
+    print(f"{args.workers:2d} processes:        {processes * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""
+Load every map of every mod without a display, and report problems.
+
+Every .tmx file under mods/*/maps is loaded through TMXMapLoader, together
+with its .yaml events, in a pool of worker processes.  Tileset images are
+not loaded.  For each map the load time, the number of tiles, the number of
+events and the size of the collision map are printed.
+
+Then these problems are reported:
+* teleports to maps which don't exist
+* teleports to tiles outside the target map or on a blocked tile
+* player spawns and teleport destinations from which no teleport of the
+  map can be reached
+
+The exit status is non-zero when a map fails to load, has a problem, or
+takes longer to load than --budget milliseconds, so the script can be used
+as a regression check.
+
+Run from the root folder:
+
+    python scripts/validate_maps.py --workers 4 --budget 250
+
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pytmx.pytmx import default_image_loader  # noqa: E402
+
+from tuxemon.map import exit_bits  # noqa: E402
+from tuxemon.map_cache import TELEPORT_ACTIONS  # noqa: E402
+from tuxemon.map_loader import TMXMapLoader  # noqa: E402
+
+
+def load_map(path):
+    """Load a map in a worker process, and return what the checks need."""
+    yaml_path = path[:-4] + ".yaml"
+    if not os.path.exists(yaml_path):
+        yaml_path = None
+
+    start = time.perf_counter()
+    try:
+        map_data = TMXMapLoader(image_loader=default_image_loader).load(
+            path,
+            yaml_path,
+        )
+    except Exception as e:
+        return {"path": path, "error": f"{type(e).__name__}: {e}"}
+    elapsed = time.perf_counter() - start
+
+    events = list(map_data.events) + list(map_data.inits) + list(map_data.interacts)
+    teleports = []
+    exits = []
+    spawns = []
+    problems = []
+    for event in events:
+        if event.name and event.name.lower() == "player spawn":
+            spawns.append((event.x, event.y))
+        for act in event.acts:
+            if act.type in TELEPORT_ACTIONS and len(act.parameters) >= 3:
+                event_name = event.name or "teleport"
+                target, x, y = act.parameters[:3]
+                exits.append((event.x, event.y, event.w or 1, event.h or 1))
+                try:
+                    teleports.append((event_name, target, int(x), int(y)))
+                except (TypeError, ValueError):
+                    problems.append(
+                        f"{event_name} teleports to {target} ({x}, {y}), "
+                        f"which are not tile coordinates"
+                    )
+
+    return {
+        "path": path,
+        "time": elapsed,
+        "size": map_data.size,
+        "events": len(events),
+        "collisions": len(map_data.collision_map),
+        "blocked": {
+            position
+            for position, properties in map_data.collision_map.items()
+            if properties is None
+        },
+        "exit_masks": bytes(map_data.exit_masks),
+        "teleports": teleports,
+        "exits": exits,
+        "spawns": spawns,
+        "problems": problems,
+    }
+
+
+def reaches_exit(report, start):
+    """Whether a teleport of the map can be reached from a tile."""
+    width, height = report["size"]
+    masks = report["exit_masks"]
+    goals = set()
+    for x, y, w, h in report["exits"]:
+        # doors are often used from the tile next to them
+        for goal_y in range(y - 1, y + h + 1):
+            for goal_x in range(x - 1, x + w + 1):
+                goals.add((goal_x, goal_y))
+
+    seen = {start}
+    queue = deque([start])
+    while queue:
+        position = queue.popleft()
+        if position in goals:
+            return True
+        mask = masks[position[1] * width + position[0]]
+        for direction, bit, dx, dy in exit_bits:
+            neighbor = (position[0] + dx, position[1] + dy)
+            if mask & bit and neighbor not in seen:
+                seen.add(neighbor)
+                queue.append(neighbor)
+    return False
+
+
+def check_arrival(report, position):
+    """Check a tile the player can appear on, and return the problem."""
+    width, height = report["size"]
+    x, y = position
+    if not (0 <= x < width and 0 <= y < height):
+        return "is outside the map"
+    if position in report["blocked"]:
+        return "is on a blocked tile"
+    if report["exits"] and not reaches_exit(report, position):
+        return "cannot reach any teleport"
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=None,
+        help="maximum load time of a map, in milliseconds",
+    )
+    args = parser.parse_args()
+
+    paths = sorted(glob.glob(os.path.join("mods", "*", "maps", "*.tmx")))
+    with ProcessPoolExecutor(args.workers) as executor:
+        reports = list(executor.map(load_map, paths, chunksize=4))
+
+    by_name = {}
+    for report in reports:
+        by_name.setdefault(os.path.basename(report["path"]), report)
+
+    problems = []
+    print(f"{'map':40} {'ms':>8} {'tiles':>7} {'events':>6} {'collisions':>10}")
+    for report in reports:
+        path = report["path"]
+        if "error" in report:
+            problems.append(f"{path}: failed to load: {report['error']}")
+            continue
+
+        width, height = report["size"]
+        elapsed = report["time"] * 1000
+        print(
+            f"{os.path.basename(path):40} {elapsed:8.1f} {width * height:7d} "
+            f"{report['events']:6d} {report['collisions']:10d}"
+        )
+        if args.budget is not None and elapsed > args.budget:
+            problems.append(f"{path}: loaded in {elapsed:.1f} ms")
+
+        for problem in report["problems"]:
+            problems.append(f"{path}: {problem}")
+
+        for position in report["spawns"]:
+            problem = check_arrival(report, position)
+            if problem:
+                problems.append(f"{path}: player spawn {position} {problem}")
+
+        for event_name, target, x, y in report["teleports"]:
+            target_report = by_name.get(target)
+            if target_report is None:
+                problems.append(f"{path}: {event_name} teleports to missing map {target}")
+            elif "error" not in target_report:
+                problem = check_arrival(target_report, (x, y))
+                if problem:
+                    problems.append(
+                        f"{path}: {event_name} teleports to {target} ({x}, {y}), "
+                        f"which {problem}"
+                    )
+
+    total = sum(report.get("time", 0) for report in reports)
+    print(f"\n{len(reports)} maps loaded in {total * 1000:.1f} ms of worker time")
+    for problem in problems:
+        print(problem)
+    if problems:
+        print(f"\n{len(problems)} problems")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+import unittest
+
+from tuxemon.event.changes import ChangeLog, GameVariables, PARTY, variable_key
+
+
+class TestChangeLog(unittest.TestCase):
+    def test_changed_since(self):
+        changes = ChangeLog()
+        changes.notify(PARTY)
+        count = changes.count
+        self.assertFalse(changes.changed_since([PARTY], count))
+        changes.notify(variable_key("a"))
+        self.assertFalse(changes.changed_since([PARTY], count))
+        self.assertTrue(changes.changed_since([PARTY, variable_key("a")], count))
+
+    def test_notify_all(self):
+        changes = ChangeLog()
+        count = changes.count
+        changes.notify_all()
+        self.assertTrue(changes.changed_since([], count))
+
+
+class TestGameVariables(unittest.TestCase):
+    def setUp(self):
+        self.changed = []
+        self.variables = GameVariables({"a": 1}, self.changed.append)
+
+    def test_set_and_delete(self):
+        self.variables["b"] = 2
+        del self.variables["a"]
+        self.assertEqual(["b", "a"], self.changed)
+        self.assertEqual({"b": 2}, self.variables)
+
+    def test_pop_missing_is_not_a_change(self):
+        self.assertIsNone(self.variables.pop("missing", None))
+        self.assertEqual(1, self.variables.pop("a"))
+        self.assertEqual(["a"], self.changed)
+
+    def test_update_and_clear(self):
+        self.variables.update(b=2)
+        self.variables.setdefault("b", 3)
+        self.variables.clear()
+        self.assertEqual(["b", "a", "b"], self.changed)
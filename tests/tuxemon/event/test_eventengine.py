@@ -1,7 +1,68 @@
 import unittest
-from unittest.mock import Mock
+from typing import NamedTuple
+from unittest.mock import Mock, patch
 
-from tuxemon.event.eventengine import EventEngine, RunningEvent
+from tuxemon.event import EventObject, MapAction, MapCondition
+from tuxemon.event.changes import variable_key
+from tuxemon.event.eventaction import EventAction
+from tuxemon.event.eventcondition import EventCondition
+from tuxemon.event.eventengine import (
+    CompiledAction,
+    EventEngine,
+    RunningEvent,
+)
+from tuxemon.event.eventprofiler import EventProfiler
+
+
+class FlagCondition(EventCondition):
+    name = "flag"
+    tests = 0
+
+    def get_dependencies(self, condition):
+        return {variable_key(condition.parameters[0])}
+
+    def test(self, session, condition):
+        FlagCondition.tests += 1
+        return condition.parameters[0] == "on"
+
+
+class WaitParameters(NamedTuple):
+    seconds: float
+
+
+class WaitAction(EventAction[WaitParameters]):
+    name = "wait"
+    param_class = WaitParameters
+
+    def start(self):
+        pass
+
+
+def make_engine():
+    def load_plugins(path, category, interface):
+        if category == "conditions":
+            return {"flag": FlagCondition}
+        return {"wait": WaitAction}
+
+    with patch("tuxemon.event.eventengine.plugin.load_plugins", load_plugins):
+        return EventEngine(Mock())
+
+
+def make_event(event_id, *conds, acts=()):
+    return EventObject(
+        event_id,
+        "event",
+        0,
+        0,
+        1,
+        1,
+        [MapCondition("flag", [value], 0, 0, 1, 1, operator, "") for value, operator in conds],
+        [MapAction("wait", [seconds], "") for seconds in acts],
+    )
+
+
+def make_map(events):
+    return Mock(events=events, inits=[], interacts=[])
 
 
 class TestRunningEvent(unittest.TestCase):
@@ -15,6 +76,151 @@ class TestRunningEvent(unittest.TestCase):
         self.assertIsNone(event.get_next_action())
 
 
+class TestCompiledEvents(unittest.TestCase):
+    def setUp(self):
+        self.engine = make_engine()
+
+    def test_compiled_once(self):
+        event = make_event(1, ("on", "is"))
+        compiled = self.engine.compile_event(event)
+        self.assertIs(compiled, self.engine.compile_event(event))
+
+    def test_conditions_are_shared(self):
+        first = self.engine.compile_event(make_event(1, ("on", "is")))
+        second = self.engine.compile_event(make_event(2, ("off", "is")))
+        self.assertIs(first.conditions[0].condition, second.conditions[0].condition)
+
+    def test_condition_operator(self):
+        session = self.engine.session
+        compiled = self.engine.compile_event(make_event(1, ("on", "is"), ("on", "is_not")))
+        self.assertTrue(compiled.conditions[0].check(session))
+        self.assertFalse(compiled.conditions[1].check(session))
+
+    def test_missing_condition_fails(self):
+        event = make_event(1)._replace(
+            conds=[MapCondition("unknown", [], 0, 0, 1, 1, "is", "")],
+        )
+        compiled = self.engine.compile_event(event)
+        self.assertFalse(compiled.conditions[0].check(self.engine.session))
+
+    def test_actions_parsed_once(self):
+        compiled = self.engine.compile_event(make_event(1, acts=["1.5"]))
+        action = compiled.actions[0]
+        self.assertEqual(WaitParameters(1.5), action.parameters)
+        first = action.create(self.engine.session)
+        second = action.create(self.engine.session)
+        self.assertIsNot(first, second)
+        self.assertEqual(1.5, first.parameters.seconds)
+
+    def test_process_map_event_starts_event(self):
+        self.engine.process_map_event(make_event(1, ("on", "is"), acts=["0"]))
+        self.engine.process_map_event(make_event(2, ("off", "is"), acts=["0"]))
+        self.assertEqual({1}, set(self.engine.running_events))
+        running = self.engine.running_events[1]
+        self.assertIsInstance(running.get_next_action(), CompiledAction)
+
+    def test_load_map_resets_area_conditions_of_previous_map(self):
+        left = make_event(1, ("on", "is"))
+        entered = make_event(2, ("on", "is"))
+        self.engine.load_map(make_map([left]))
+        with patch.object(FlagCondition, "area", True), \
+                patch.object(FlagCondition, "reset") as reset:
+            self.engine.load_map(make_map([entered]))
+        reset.assert_called_once_with(self.engine.session, left.conds[0])
+        self.assertIn(id(entered), self.engine.compiled_events)
+
+    def test_reset_resets_area_conditions_not_compiled(self):
+        event = make_event(1, ("on", "is"))
+        self.engine.load_map(make_map([event]))
+        # the compiled events are forgotten when profiling starts
+        self.engine.set_profiler(EventProfiler())
+        with patch.object(FlagCondition, "area", True), \
+                patch.object(FlagCondition, "reset") as reset:
+            self.engine.reset()
+        reset.assert_called_once_with(self.engine.session, event.conds[0])
+
+    def test_reset_clears_compiled_events(self):
+        self.engine.compile_event(make_event(1))
+        self.engine.reset()
+        self.assertEqual({}, self.engine.compiled_events)
+
+
+class TestWaitingEvents(unittest.TestCase):
+    def setUp(self):
+        self.engine = make_engine()
+        FlagCondition.tests = 0
+
+    def test_failed_event_waits_for_changes(self):
+        event = make_event(1, ("off", "is"))
+        self.engine.process_map_event(event)
+        self.engine.process_map_event(event)
+        self.assertEqual(1, FlagCondition.tests)
+
+        self.engine.changes.notify(variable_key("other"))
+        self.engine.process_map_event(event)
+        self.assertEqual(1, FlagCondition.tests)
+
+        self.engine.changes.notify(variable_key("off"))
+        self.engine.process_map_event(event)
+        self.assertEqual(2, FlagCondition.tests)
+
+    def test_event_waits_on_failed_condition(self):
+        event = make_event(1, ("on", "is"), ("off", "is"))
+        self.engine.process_map_event(event)
+        self.engine.changes.notify(variable_key("on"))
+        self.engine.process_map_event(event)
+        self.assertEqual(2, FlagCondition.tests)
+
+    def test_passed_event_is_tested_again(self):
+        event = make_event(1, ("on", "is"))
+        self.engine.process_map_event(event)
+        self.engine.process_map_event(event)
+        self.assertEqual(2, FlagCondition.tests)
+
+    def test_reset_wakes_events(self):
+        event = make_event(1, ("off", "is"))
+        self.engine.process_map_event(event)
+        self.engine.reset()
+        self.engine.process_map_event(event)
+        self.assertEqual(2, FlagCondition.tests)
+
+
+class TestProfiling(unittest.TestCase):
+    def setUp(self):
+        self.engine = make_engine()
+        self.profiler = EventProfiler()
+
+    def get_names(self):
+        return {
+            (entry["category"], entry["name"])
+            for entry in self.profiler.get_report()
+        }
+
+    def test_records_conditions_actions_and_events(self):
+        self.engine.set_profiler(self.profiler)
+        self.engine.process_map_events([make_event(1, ("on", "is"), acts=["0"])])
+        self.engine.update_running_events(0)
+        self.assertEqual(
+            {
+                ("condition", "flag"),
+                ("event", "event"),
+                ("action.start", "wait"),
+                ("action.update", "wait"),
+                ("action.cleanup", "wait"),
+            },
+            self.get_names(),
+        )
+
+    def test_stop(self):
+        event = make_event(1, ("on", "is"))
+        self.engine.set_profiler(self.profiler)
+        self.engine.process_map_events([event])
+        self.engine.set_profiler(None)
+        self.profiler.reset()
+        self.engine.process_map_events([event])
+        self.assertEqual(set(), self.get_names())
+
+
 class TestEventEngine(unittest.TestCase):
     def test_(self):
         eng = EventEngine(None)
@@ -0,0 +1,33 @@
+import unittest
+
+from tuxemon.event import EventObject, MapCondition
+from tuxemon.event.eventindex import EventIndex
+
+
+def make_event(cond_type, x, y, w=1, h=1, operator="is"):
+    cond = MapCondition(cond_type, [], x, y, w, h, operator, None)
+    return EventObject(None, cond_type, x, y, w, h, [cond], [])
+
+
+class TestEventIndex(unittest.TestCase):
+    def setUp(self):
+        self.events = [
+            make_event("player_at", 2, 2),
+            make_event("variable_set", 0, 0),
+            make_event("player_at", 30, 30, 2, 2),
+            make_event("player_at", 4, 4, operator="not"),
+        ]
+        self.index = EventIndex(self.events, {"player_at"})
+
+    def test_events_without_area_condition_are_always_returned(self):
+        self.assertEqual(self.index.query((20, 20)), [1, 3])
+
+    def test_nearby_area_events_are_returned_in_map_order(self):
+        self.assertEqual(self.index.query((3, 3)), [0, 1, 3])
+
+    def test_area_event_is_returned_next_to_its_area(self):
+        self.assertIn(2, self.index.query((32, 31)))
+        self.assertNotIn(2, self.index.query((33, 31)))
+
+    def test_no_position_returns_every_event(self):
+        self.assertEqual(self.index.query(None), [0, 1, 2, 3])
@@ -0,0 +1,58 @@
+import json
+import os
+import tempfile
+import unittest
+
+from tuxemon.event.eventprofiler import EventProfiler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestEventProfiler(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.profiler = EventProfiler(self.clock)
+
+    def test_wrap_records_calls(self):
+        def slow(value):
+            self.clock.now += 0.002
+            return value * 2
+
+        timed = self.profiler.wrap("condition", "slow", slow)
+        self.assertEqual(4, timed(2))
+        self.assertEqual(6, timed(3))
+        entry, = self.profiler.get_report()
+        self.assertEqual("condition", entry["category"])
+        self.assertEqual(2, entry["count"])
+        self.assertAlmostEqual(4.0, entry["total_ms"])
+        self.assertAlmostEqual(2.0, entry["mean_ms"])
+
+    def test_report_is_sorted_and_filtered(self):
+        self.profiler.record("condition", "fast", 0.001)
+        self.profiler.record("event", "slow", 0.005)
+        report = self.profiler.get_report()
+        self.assertEqual(["slow", "fast"], [entry["name"] for entry in report])
+        report = self.profiler.get_report("condition")
+        self.assertEqual(["fast"], [entry["name"] for entry in report])
+
+    def test_p95(self):
+        for index in range(100):
+            self.profiler.record("action.update", "wait", index / 1000)
+        entry, = self.profiler.get_report()
+        self.assertAlmostEqual(95.0, entry["p95_ms"])
+        self.assertAlmostEqual(99.0, entry["max_ms"])
+
+    def test_dump(self):
+        self.profiler.record("event", "door", 0.001)
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "profile.json")
+            self.profiler.dump(path)
+            with open(path) as fp:
+                data = json.load(fp)
+        self.assertEqual("door", data[0]["name"])
@@ -0,0 +1,53 @@
+import unittest
+from unittest.mock import Mock
+
+from tuxemon.event import MapCondition
+from tuxemon.event.conditions.player_moved import (
+    PlayerMovedCondition,
+    get_legacy_key,
+)
+
+
+class TestPlayerMovedCondition(unittest.TestCase):
+    def setUp(self):
+        self.session = Mock()
+        self.session.client.event_persist = {}
+        self.condition = PlayerMovedCondition()
+        self.map_condition = MapCondition(
+            "player_moved", [], 2, 2, 1, 1, "is", "cond1", 7,
+        )
+
+    def move(self, tile_pos, move_destination):
+        self.session.player = Mock(
+            tile_pos=tile_pos,
+            move_destination=move_destination,
+        )
+        return self.condition.test(self.session, self.map_condition)
+
+    def test_true_once_after_moving_in(self):
+        self.assertFalse(self.move((1, 2), None))
+        self.assertFalse(self.move((1, 2), (2, 2)))
+        self.assertTrue(self.move((2, 2), None))
+        self.assertFalse(self.move((2, 2), None))
+
+    def test_state_is_keyed_by_id(self):
+        self.move((1, 2), None)
+        persist = self.session.client.event_persist["player_moved"]
+        self.assertEqual([7], list(persist))
+
+    def test_legacy_key_is_migrated(self):
+        legacy_key = get_legacy_key(self.map_condition)
+        self.assertEqual(
+            legacy_key,
+            "MapCondition(type='player_moved', parameters=[], x=2, y=2, "
+            "width=1, height=1, operator='is', name='cond1')",
+        )
+        self.session.client.event_persist["player_moved"] = {legacy_key: (1, 2)}
+        self.assertTrue(self.move((2, 2), None))
+        persist = self.session.client.event_persist["player_moved"]
+        self.assertEqual({7: None}, persist)
+
+    def test_reset(self):
+        self.move((1, 2), None)
+        self.condition.reset(self.session, self.map_condition)
+        self.assertEqual({}, self.session.client.event_persist["player_moved"])
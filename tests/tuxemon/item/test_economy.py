@@ -47,3 +47,45 @@ class GetDefaultPriceAndCost(EconomyTestBase):
         economy = self.economy
         with self.assertRaises(RuntimeError):
             cost = economy.lookup_item_cost("revive")
+
+
+class LookupManyItems(EconomyTestBase):
+    def setUp(self):
+        self.economy = Economy()
+        self.economy.slug = "test_economy"
+        self.economy.items = [
+          {
+            "item_name": "potion",
+            "price": 20,
+            "cost": 5
+          },
+          {
+            "item_name": "revive",
+            "price": 100
+          },
+          {
+            "item_name": "capture_device",
+            "cost": 10
+          }
+        ]
+
+    def test_prices_of_inventory(self):
+        economy = self.economy
+        prices = economy.lookup_item_prices(["potion", "revive"])
+        self.assertEqual(prices, {"potion": 20, "revive": 100})
+
+    def test_items_without_price_are_left_out(self):
+        economy = self.economy
+        prices = economy.lookup_item_prices(["potion", "capture_device"])
+        self.assertEqual(prices, {"potion": 20})
+
+    def test_costs_of_inventory(self):
+        economy = self.economy
+        costs = economy.lookup_item_costs(["potion", "capture_device"])
+        self.assertEqual(costs, {"potion": 5, "capture_device": 10})
+
+    def test_replacing_items_updates_lookups(self):
+        economy = self.economy
+        economy.items = [{"item_name": "potion", "price": 30}]
+        price = economy.lookup_item_price("potion")
+        self.assertEqual(price, 30)
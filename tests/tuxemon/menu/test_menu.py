@@ -0,0 +1,72 @@
+import unittest
+
+import pygame
+from pygame.rect import Rect
+
+from tuxemon.menu.menu import Menu
+from tuxemon.sprite import Sprite, SpriteGroup
+
+
+def make_menu(rect):
+    # the layout is tracked without the graphics loaded by startup
+    menu = Menu.__new__(Menu)
+    menu.rect = rect
+    menu._show_contents = False
+    menu._needs_refresh = False
+    menu._drawn_layout = None
+    menu.menu_items = SpriteGroup()
+    menu.menu_sprites = SpriteGroup()
+    menu.sprites = SpriteGroup()
+    return menu
+
+
+class TestMenuDirtyRects(unittest.TestCase):
+    def setUp(self):
+        self.menu = make_menu(Rect(10, 10, 100, 50))
+        self.assertEqual([Rect(10, 10, 100, 50)], self.menu.get_dirty_rects())
+
+    def test_unchanged(self):
+        self.assertEqual([], self.menu.get_dirty_rects())
+
+    def test_moved(self):
+        self.menu.rect = Rect(20, 20, 100, 50)
+        self.assertEqual(
+            [Rect(10, 10, 100, 50), Rect(20, 20, 100, 50)],
+            self.menu.get_dirty_rects(),
+        )
+        self.assertEqual([], self.menu.get_dirty_rects())
+
+    def test_resized_in_place(self):
+        self.menu.rect.width = 120
+        self.assertEqual(
+            [Rect(10, 10, 100, 50), Rect(10, 10, 120, 50)],
+            self.menu.get_dirty_rects(),
+        )
+
+    def test_contents_shown(self):
+        self.menu._show_contents = True
+        self.assertEqual(
+            [Rect(10, 10, 100, 50), Rect(10, 10, 100, 50)],
+            self.menu.get_dirty_rects(),
+        )
+
+    def test_needs_refresh(self):
+        self.menu._needs_refresh = True
+        self.assertEqual(
+            [Rect(10, 10, 100, 50), Rect(10, 10, 100, 50)],
+            self.menu.get_dirty_rects(),
+        )
+
+    def test_sprites(self):
+        sprite = Sprite(image=pygame.Surface((8, 8)))
+        sprite.rect = Rect(0, 0, 8, 8)
+        self.menu.sprites.add(sprite)
+        self.assertEqual([Rect(0, 0, 8, 8)], self.menu.get_dirty_rects())
+
+    def test_custom_draw(self):
+        class CustomMenu(Menu):
+            def draw(self, surface):
+                pass
+
+        menu = CustomMenu.__new__(CustomMenu)
+        self.assertIsNone(menu.get_dirty_rects())
@@ -0,0 +1,101 @@
+import unittest
+
+from tuxemon.clock import Clock, FramePacer
+
+
+class FakeTime:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, duration):
+        self.sleeps.append(duration)
+        self.now += duration
+
+
+class TestClockSleep(unittest.TestCase):
+    def test_oversleep_is_corrected(self):
+        fake = FakeTime()
+
+        def late_sleep(duration):
+            fake.now += duration + 0.002
+
+        clock = Clock(fake.time, late_sleep)
+        for _ in range(5):
+            start = fake.now
+            clock.sleep(0.010)
+        self.assertAlmostEqual(fake.now - start, 0.010)
+
+    def test_bad_fit_is_corrected(self):
+        fake = FakeTime()
+        lateness = 0.050
+
+        def late_sleep(duration):
+            fake.sleeps.append(duration)
+            fake.now += duration + lateness
+
+        clock = Clock(fake.time, late_sleep)
+        for duration in (0.010, 0.020, 0.030):
+            clock.sleep(duration)
+        lateness = 0.0
+        for _ in range(40):
+            start = fake.now
+            clock.sleep(0.010)
+        self.assertEqual(len(fake.sleeps), 43)
+        self.assertAlmostEqual(fake.now - start, 0.010)
+
+    def test_no_sleep_for_past_deadline(self):
+        fake = FakeTime()
+        clock = Clock(fake.time, fake.sleep)
+        clock.sleep(-1.0)
+        self.assertEqual(fake.sleeps, [])
+
+
+class TestFramePacer(unittest.TestCase):
+    def setUp(self):
+        self.fake = FakeTime()
+        self.updates = []
+        self.draws = []
+        self.pacer = FramePacer(
+            self.updates.append,
+            self.draws.append,
+            step=0.010,
+            fps=50,
+            clock=Clock(self.fake.time, self.fake.sleep),
+        )
+
+    def run_for(self, seconds):
+        end = self.fake.now + seconds
+        while self.fake.now < end - 1e-9:
+            self.pacer.tick()
+
+    def test_updates_use_fixed_steps(self):
+        self.run_for(1.0)
+        self.assertEqual(set(self.updates), {0.010})
+        self.assertAlmostEqual(len(self.updates), 100, delta=1)
+
+    def test_draws_are_limited_to_fps(self):
+        self.run_for(1.0)
+        self.assertAlmostEqual(len(self.draws), 50, delta=1)
+        self.assertEqual(self.pacer.dropped_frames, 0)
+
+    def test_loop_sleeps_between_frames(self):
+        self.run_for(1.0)
+        self.assertGreater(len(self.fake.sleeps), 0)
+        self.assertLessEqual(len(self.fake.sleeps), 160)
+
+    def test_interpolation_is_a_fraction_of_a_step(self):
+        self.run_for(0.5)
+        for interpolation in self.draws:
+            self.assertGreaterEqual(interpolation, 0.0)
+            self.assertLessEqual(interpolation, 1.0)
+
+    def test_slow_frame_is_dropped_and_caught_up(self):
+        self.run_for(0.1)
+        self.fake.now += 0.1
+        self.pacer.tick()
+        self.assertGreaterEqual(self.pacer.dropped_frames, 4)
+        self.assertLessEqual(len(self.updates), 10 + self.pacer.max_steps)
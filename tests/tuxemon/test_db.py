@@ -0,0 +1,247 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from tuxemon.db import JSONDatabase, Record, file_signature, set_defaults
+
+
+class DatabaseTestBase(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.path = self.tempdir.name
+        self.snapshot_path = os.path.join(self.path, "cache", "db.snapshot")
+        os.makedirs(os.path.join(self.path, "sounds"))
+        self.write_record("sounds", "beep.json", {"slug": "beep", "file": "beep.ogg"})
+        patcher = patch("tuxemon.db.prepare.fetch", return_value=self.path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.tempdir.cleanup)
+
+    def write_record(self, table, name, record):
+        with open(os.path.join(self.path, table, name), "w") as fp:
+            json.dump(record, fp)
+
+
+class TestJSONDatabaseSnapshot(DatabaseTestBase):
+    def test_load_writes_snapshot(self):
+        db = JSONDatabase()
+        db.load("sounds", snapshot_path=self.snapshot_path)
+        self.assertTrue(os.path.exists(self.snapshot_path))
+
+    def test_warm_load_reads_records_from_snapshot(self):
+        JSONDatabase().load("sounds", snapshot_path=self.snapshot_path)
+        db = JSONDatabase()
+        with patch.object(JSONDatabase, "load_json") as load_json:
+            db.load("sounds", snapshot_path=self.snapshot_path)
+        load_json.assert_not_called()
+        self.assertEqual(db.lookup_file("sounds", "beep"), "beep.ogg")
+
+    def test_changed_file_is_parsed_again(self):
+        JSONDatabase().load("sounds", snapshot_path=self.snapshot_path)
+        self.write_record("sounds", "beep.json", {"slug": "beep", "file": "boop.ogg"})
+        db = JSONDatabase()
+        db.load("sounds", snapshot_path=self.snapshot_path)
+        self.assertEqual(db.lookup_file("sounds", "beep"), "boop.ogg")
+
+    def test_new_file_is_parsed(self):
+        JSONDatabase().load("sounds", snapshot_path=self.snapshot_path)
+        self.write_record("sounds", "ding.json", {"slug": "ding", "file": "ding.ogg"})
+        db = JSONDatabase()
+        db.load("sounds", snapshot_path=self.snapshot_path)
+        self.assertEqual(db.lookup_file("sounds", "ding"), "ding.ogg")
+
+    def test_touched_file_is_not_parsed_again(self):
+        JSONDatabase().load("sounds", snapshot_path=self.snapshot_path)
+        path = os.path.join(self.path, "sounds", "beep.json")
+        os.utime(path, ns=(0, 0))
+        db = JSONDatabase()
+        with patch.object(JSONDatabase, "load_json") as load_json:
+            db.load("sounds", snapshot_path=self.snapshot_path)
+        load_json.assert_not_called()
+
+    def test_corrupt_snapshot_is_ignored(self):
+        os.makedirs(os.path.dirname(self.snapshot_path))
+        with open(self.snapshot_path, "wb") as fp:
+            fp.write(b"garbage")
+        db = JSONDatabase()
+        db.load("sounds", snapshot_path=self.snapshot_path)
+        self.assertEqual(db.lookup_file("sounds", "beep"), "beep.ogg")
+
+    def test_load_records_table_timings(self):
+        db = JSONDatabase()
+        db.load("sounds")
+        self.assertIn("sounds", db.load_times)
+
+
+class TestJSONDatabaseLazyLoad(DatabaseTestBase):
+    def setUp(self):
+        super().setUp()
+        self.write_record("sounds", "ding.json", {"slug": "ding", "file": "ding.ogg"})
+        self.write_record(
+            "sounds",
+            "interface.json",
+            [{"slug": "click", "file": "click.ogg"}],
+        )
+
+    def test_lazy_load_parses_nothing(self):
+        db = JSONDatabase()
+        db.load("sounds", lazy=True)
+        self.assertEqual(db.database["sounds"], {})
+
+    def test_lookup_parses_only_the_file_named_after_the_slug(self):
+        db = JSONDatabase()
+        db.load("sounds", lazy=True)
+        db.lookup_file("sounds", "beep")
+        self.assertEqual(list(db.database["sounds"]), ["beep"])
+
+    def test_lookup_of_unindexed_slug_parses_the_table(self):
+        db = JSONDatabase()
+        db.load("sounds", lazy=True)
+        filename = db.lookup_file("sounds", "click")
+        self.assertEqual(filename, "click.ogg")
+        self.assertEqual(len(db.database["sounds"]), 3)
+
+    def test_lookup_records_file_of_slug(self):
+        db = JSONDatabase()
+        db.load("sounds", lazy=True)
+        db.lookup_file("sounds", "click")
+        self.assertEqual(db.slug_files["sounds"]["click"], "interface.json")
+
+    def test_lookup_of_missing_slug_raises_key_error(self):
+        db = JSONDatabase()
+        db.load("sounds", lazy=True)
+        with self.assertRaises(KeyError):
+            db.lookup_file("sounds", "missing")
+
+
+class TestRecord(unittest.TestCase):
+    def test_record_behaves_like_a_mapping(self):
+        record = Record({"slug": "beep", "file": "beep.ogg"})
+        self.assertEqual(record["file"], "beep.ogg")
+        self.assertEqual(record.get("missing", "default"), "default")
+
+    def test_record_cannot_be_modified(self):
+        record = Record({"slug": "beep"})
+        with self.assertRaises(TypeError):
+            record["slug"] = "boop"
+
+    def test_nested_lists_become_tuples(self):
+        record = Record({"slug": "bigfin", "types": ["water"]})
+        self.assertEqual(record["types"], ("water",))
+
+    def test_nested_mappings_become_records(self):
+        record = Record({"slug": "potion", "target": {"enemy": 1}})
+        self.assertIsInstance(record["target"], Record)
+
+
+class TestSetDefaults(unittest.TestCase):
+    def test_monster_sprites_are_derived_from_slug(self):
+        record = set_defaults({"slug": "bigfin"}, "monster")
+        self.assertEqual(record["sprites"]["battle1"], "gfx/sprites/battle/bigfin-front")
+
+    def test_monster_shape_defaults_to_landrace(self):
+        record = set_defaults({"slug": "bigfin"}, "monster")
+        self.assertEqual(record["shape"], "landrace")
+
+    def test_source_object_is_not_modified(self):
+        item = {"slug": "bigfin"}
+        set_defaults(item, "monster")
+        self.assertEqual(item, {"slug": "bigfin"})
+
+    def test_lookup_returns_the_same_record_every_time(self):
+        db = JSONDatabase()
+        db.load_dict({"slug": "bigfin"}, "monster")
+        self.assertIs(db.lookup("bigfin"), db.lookup("bigfin"))
+
+
+class TestJSONDatabaseIndexes(unittest.TestCase):
+    def setUp(self):
+        self.db = JSONDatabase()
+        self.db.load_dict(
+            {
+                "slug": "bigfin",
+                "types": ["Water"],
+                "shape": "leviathan",
+                "moveset": [
+                    {"level_learned": 10, "technique": "splash"},
+                    {"level_learned": 2, "technique": "ram"},
+                    {"level_learned": 5, "technique": "flow"},
+                ],
+                "evolutions": [
+                    {"path": "standard", "at_level": 20, "monster_slug": "dolfin"},
+                ],
+            },
+            "monster",
+        )
+        self.db.load_dict({"slug": "dolfin", "types": ["water"]}, "monster")
+        self.db.load_dict({"slug": "rockitten", "types": ["earth"]}, "monster")
+
+    def test_monsters_by_type(self):
+        self.assertEqual(self.db.monsters_by_type("water"), ("bigfin", "dolfin"))
+
+    def test_monsters_by_type_with_no_match(self):
+        self.assertEqual(self.db.monsters_by_type("fire"), ())
+
+    def test_monsters_by_shape(self):
+        self.assertEqual(self.db.monsters_by_shape("leviathan"), ("bigfin",))
+
+    def test_evolution_sources(self):
+        self.assertEqual(self.db.evolution_sources("dolfin"), ("bigfin",))
+
+    def test_learnset_is_ordered_by_level(self):
+        moves = [move["technique"] for move in self.db.learnset("bigfin")]
+        self.assertEqual(moves, ["ram", "flow", "splash"])
+
+    def test_learnset_within_levels(self):
+        moves = self.db.learnset("bigfin", min_level=5, max_level=10)
+        self.assertEqual([move["technique"] for move in moves], ["flow", "splash"])
+
+    def test_learnset_does_not_make_a_partial_index(self):
+        self.db.learnset("bigfin")
+        self.assertEqual(
+            set(self.db.index("monster", "learnset")),
+            {"bigfin", "dolfin", "rockitten"},
+        )
+
+    def test_index_is_rebuilt_after_table_changes(self):
+        self.db.monsters_by_type("water")
+        self.db.load_dict({"slug": "nut", "types": ["water"]}, "monster")
+        self.assertIn("nut", self.db.monsters_by_type("water"))
+
+
+class TestJSONDatabaseParallelLoad(DatabaseTestBase):
+    def setUp(self):
+        super().setUp()
+        self.write_record("sounds", "ding.json", {"slug": "ding", "file": "ding.ogg"})
+        self.write_record("sounds", "again.json", {"slug": "beep", "file": "again.ogg"})
+
+    def test_parallel_load_matches_serial_load(self):
+        serial = JSONDatabase()
+        serial.load("sounds")
+        parallel = JSONDatabase()
+        parallel.load("sounds", workers=2)
+        self.assertEqual(parallel.database, serial.database)
+
+    def test_parallel_load_warns_about_duplicate_slugs(self):
+        db = JSONDatabase()
+        with self.assertLogs("tuxemon.db", level="WARNING"):
+            db.load("sounds", workers=2)
+
+
+class TestFileSignature(DatabaseTestBase):
+    def setUp(self):
+        super().setUp()
+        self.file_path = os.path.join(self.path, "sounds", "beep.json")
+
+    def test_signature_of_same_contents_has_same_digest(self):
+        first = file_signature(self.file_path)
+        self.write_record("sounds", "beep.json", {"slug": "beep", "file": "beep.ogg"})
+        self.assertEqual(file_signature(self.file_path)[2], first[2])
+
+    def test_known_signature_is_reused_when_file_is_unchanged(self):
+        known = file_signature(self.file_path)
+        with patch("tuxemon.db.hashlib.sha1") as sha1:
+            self.assertIs(file_signature(self.file_path, known), known)
+        sha1.assert_not_called()
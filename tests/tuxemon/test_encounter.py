@@ -0,0 +1,42 @@
+import unittest
+
+from tuxemon.encounter import EncounterDistribution
+
+
+class TestEncounterDistribution(unittest.TestCase):
+    def setUp(self):
+        self.bigfin = {"monster": "bigfin", "encounter_rate": 10, "level_range": [1]}
+        self.dollfin = {"monster": "dollfin", "encounter_rate": 20, "level_range": [1]}
+        self.distribution = EncounterDistribution([self.bigfin, self.dollfin])
+
+    def test_low_roll_picks_first_encounter(self):
+        encounter = self.distribution.choose(roll=5)
+        self.assertIs(encounter, self.bigfin)
+
+    def test_roll_equal_to_rate_picks_that_encounter(self):
+        encounter = self.distribution.choose(roll=10)
+        self.assertIs(encounter, self.bigfin)
+
+    def test_roll_past_first_rate_picks_second_encounter(self):
+        encounter = self.distribution.choose(roll=25)
+        self.assertIs(encounter, self.dollfin)
+
+    def test_roll_past_all_rates_picks_nothing(self):
+        encounter = self.distribution.choose(roll=50)
+        self.assertIsNone(encounter)
+
+    def test_total_prob_scales_rates(self):
+        encounter = self.distribution.choose(total_prob=100, roll=90)
+        self.assertIs(encounter, self.dollfin)
+
+    def test_sample_returns_requested_amount(self):
+        encounters = self.distribution.sample(1000)
+        self.assertEqual(len(encounters), 1000)
+
+    def test_sample_with_full_total_prob_always_picks_an_encounter(self):
+        encounters = self.distribution.sample(1000, total_prob=100)
+        self.assertNotIn(None, encounters)
+
+    def test_sample_of_empty_table_picks_nothing(self):
+        distribution = EncounterDistribution([])
+        self.assertEqual(distribution.sample(3), [None, None, None])
@@ -0,0 +1,20 @@
+import unittest
+from unittest.mock import Mock
+
+from tuxemon.entity import Entity
+from tuxemon.event.changes import npc_key
+
+
+class TestEntityTilePos(unittest.TestCase):
+    def setUp(self):
+        self.world = Mock()
+        self.entity = Entity(slug="npc_maple", world=self.world)
+
+    def test_move_is_reported(self):
+        self.entity.tile_pos = (1, 2)
+        self.world.collision_grid.move_entity.assert_called_once_with(self.entity, (1, 2))
+        self.world.notify_change.assert_called_once_with(npc_key("npc_maple"))
+
+    def test_same_tile_is_not_reported(self):
+        self.entity.tile_pos = (0, 0)
+        self.world.notify_change.assert_not_called()
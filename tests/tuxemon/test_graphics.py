@@ -0,0 +1,87 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import pygame
+
+from tuxemon import prepare
+from tuxemon.graphics import TilesetCache, surface_bytes
+
+
+class TestTilesetCache(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tempdir.cleanup)
+        # tiles are converted for the display, which the tests don't have
+        patcher = patch(
+            "tuxemon.graphics.smart_convert",
+            side_effect=lambda tile, colorkey, pixelalpha: tile,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def make_image(self, name, size=(16, 16)):
+        path = os.path.join(self.tempdir.name, name)
+        pygame.image.save(pygame.Surface(size), path)
+        return path
+
+    def get_size(self, path):
+        return TilesetCache(10 ** 9).get_tileset(path, None, True).size
+
+    def test_hit(self):
+        path = self.make_image("a.png")
+        cache = TilesetCache(10 ** 9)
+        tileset = cache.get_tileset(path, None, True)
+        self.assertIs(tileset, cache.get_tileset(path, None, True))
+        tile = cache.get_tile(tileset, (0, 0, 8, 8), None)
+        self.assertIs(tile, cache.get_tile(tileset, (0, 0, 8, 8), None))
+        self.assertEqual(tileset.size, cache.size)
+
+    def test_key(self):
+        path = self.make_image("a.png")
+        cache = TilesetCache(10 ** 9)
+        tileset = cache.get_tileset(path, None, True)
+        self.assertIsNot(tileset, cache.get_tileset(path, (255, 0, 255), True))
+        with patch.object(prepare, "SCALE", prepare.SCALE + 1):
+            self.assertIsNot(tileset, cache.get_tileset(path, None, True))
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        self.assertIsNot(tileset, cache.get_tileset(path, None, True))
+        self.assertEqual(4, len(cache.tilesets))
+
+    def test_least_recently_used_is_evicted(self):
+        paths = [self.make_image(f"{name}.png") for name in "abc"]
+        cache = TilesetCache(self.get_size(paths[0]) * 2)
+        a = cache.get_tileset(paths[0], None, True)
+        b = cache.get_tileset(paths[1], None, True)
+        cache.get_tileset(paths[0], None, True)
+        cache.get_tileset(paths[2], None, True)
+        self.assertEqual(
+            [a.filename, os.path.abspath(paths[2])],
+            list(cache.memory_usage()),
+        )
+        self.assertIsNone(b.cache_key)
+        self.assertLessEqual(cache.size, cache.budget)
+
+    def test_tileset_in_use_is_not_evicted(self):
+        paths = [self.make_image(f"{name}.png") for name in "ab"]
+        cache = TilesetCache(self.get_size(paths[0]) * 2)
+        a = cache.get_tileset(paths[0], None, True)
+        b = cache.get_tileset(paths[1], None, True)
+        # converting tiles of a goes over the budget
+        tile = cache.get_tile(a, (0, 0, 8, 8), None)
+        self.assertIsNotNone(a.cache_key)
+        self.assertIsNone(b.cache_key)
+        self.assertEqual(a.size, cache.size)
+        self.assertEqual(surface_bytes(a.image) + surface_bytes(tile), a.size)
+
+    def test_clear(self):
+        path = self.make_image("a.png")
+        cache = TilesetCache(10 ** 9)
+        tileset = cache.get_tileset(path, None, True)
+        cache.clear()
+        self.assertEqual(0, cache.size)
+        self.assertEqual({}, cache.memory_usage())
+        self.assertIsNone(tileset.cache_key)
+        self.assertIsNot(tileset, cache.get_tileset(path, None, True))
@@ -1,7 +1,9 @@
 import unittest
+from unittest.mock import Mock
 
 from tuxemon.compat import Rect
-from tuxemon.map import snap_interval, snap_point, snap_rect, tiles_inside_rect, point_to_grid
+from tuxemon.entity import Entity
+from tuxemon.map import CollisionGrid, Reachability, compute_exit_masks, direction_bits, snap_interval, snap_point, snap_rect, tiles_inside_rect, point_to_grid
 
 
 class TestSnapInterval(unittest.TestCase):
@@ -113,3 +115,182 @@ class TestTilesInsideRect(unittest.TestCase):
         expected = [(0, 1), (1, 1), (0, 2), (1, 2), (0, 3), (1, 3)]
         result = list(tiles_inside_rect(rect, grid_size))
         self.assertEqual(expected, result)
+
+
+class TestCollisionGrid(unittest.TestCase):
+    def setUp(self):
+        self.wall = (1, 1)
+        self.grid = CollisionGrid((4, 4), {self.wall: None})
+        self.npc = Mock(spec=Entity)
+        self.npc.tile_pos = (2, 2)
+
+    def test_static_tile_is_in_grid(self):
+        self.assertIn(self.wall, self.grid)
+        self.assertIsNone(self.grid[self.wall])
+
+    def test_free_tile_is_not_in_grid(self):
+        self.assertNotIn((0, 0), self.grid)
+
+    def test_added_entity_occupies_its_tile(self):
+        self.grid.add_entity(self.npc)
+        self.assertEqual(self.grid[(2, 2)], {"entity": self.npc})
+        self.assertTrue(self.grid.is_occupied((2, 2)))
+
+    def test_moved_entity_leaves_its_old_tile(self):
+        self.grid.add_entity(self.npc)
+        self.grid.move_entity(self.npc, (3, 2))
+        self.assertNotIn((2, 2), self.grid)
+        self.assertFalse(self.grid.is_occupied((2, 2)))
+        self.assertTrue(self.grid.is_occupied((3, 2)))
+
+    def test_removed_entity_frees_its_tile(self):
+        self.grid.add_entity(self.npc)
+        self.grid.remove_entity(self.npc)
+        self.assertNotIn((2, 2), self.grid)
+
+    def test_untracked_entity_is_not_moved(self):
+        self.grid.move_entity(self.npc, (3, 2))
+        self.assertNotIn((3, 2), self.grid)
+
+    def test_static_tile_takes_precedence_over_entity(self):
+        self.npc.tile_pos = self.wall
+        self.grid.add_entity(self.npc)
+        self.assertIsNone(self.grid[self.wall])
+
+    def test_tile_keeps_remaining_entity(self):
+        other = Mock(spec=Entity)
+        other.tile_pos = (2, 2)
+        self.grid.add_entity(self.npc)
+        self.grid.add_entity(other)
+        self.grid.remove_entity(other)
+        self.assertEqual(self.grid[(2, 2)], {"entity": self.npc})
+
+    def test_version_changes_when_tile_is_taken_or_freed(self):
+        self.grid.add_entity(self.npc)
+        taken = self.grid.version
+        self.grid.move_entity(self.npc, (3, 2))
+        self.assertGreater(self.grid.version, taken)
+
+    def test_version_is_kept_when_tile_stays_taken(self):
+        other = Mock(spec=Entity)
+        other.tile_pos = (2, 2)
+        self.grid.add_entity(self.npc)
+        version = self.grid.version
+        self.grid.add_entity(other)
+        self.assertEqual(self.grid.version, version)
+
+
+class TestComputeExitMasks(unittest.TestCase):
+    def mask(self, position, collision_map=None, lines=None):
+        masks = compute_exit_masks((3, 3), collision_map or {}, lines or set())
+        return masks[position[1] * 3 + position[0]]
+
+    def test_open_tile_exits_everywhere(self):
+        self.assertEqual(self.mask((1, 1)), 15)
+
+    def test_corner_tile_does_not_exit_the_map(self):
+        expected = direction_bits["down"] | direction_bits["right"]
+        self.assertEqual(self.mask((0, 0)), expected)
+
+    def test_blocked_neighbor_is_not_an_exit(self):
+        mask = self.mask((1, 1), {(1, 2): None})
+        self.assertFalse(mask & direction_bits["down"])
+
+    def test_wall_is_not_an_exit(self):
+        mask = self.mask((1, 1), lines={((1, 1), "up")})
+        self.assertEqual(mask, 15 & ~direction_bits["up"])
+
+    def test_neighbor_must_be_enterable_from_this_side(self):
+        mask = self.mask((1, 1), {(2, 1): {"enter": ["up"]}})
+        self.assertFalse(mask & direction_bits["right"])
+        mask = self.mask((1, 1), {(2, 1): {"enter": ["left"]}})
+        self.assertTrue(mask & direction_bits["right"])
+
+    def test_continue_is_the_only_exit(self):
+        mask = self.mask((1, 1), {(1, 1): {"continue": "left"}})
+        self.assertEqual(mask, direction_bits["left"])
+
+    def test_exit_which_is_not_a_direction_allows_all_directions(self):
+        mask = self.mask((1, 1), {(1, 1): {"exit": ["up", "same"]}})
+        self.assertEqual(mask, 15)
+        mask = self.mask((1, 1), {(1, 1): {"exit": ["same"]}})
+        self.assertEqual(mask, 15)
+
+
+class TestCollisionGridExitMask(unittest.TestCase):
+    def setUp(self):
+        self.masks = compute_exit_masks((3, 3), {}, set())
+        self.grid = CollisionGrid((3, 3), {}, self.masks)
+        self.npc = Mock(spec=Entity)
+        self.npc.tile_pos = (1, 2)
+
+    def test_exit_mask_without_entities(self):
+        self.assertEqual(self.grid.get_exit_mask((1, 1)), 15)
+
+    def test_entity_blocks_its_tile(self):
+        self.grid.add_entity(self.npc)
+        mask = self.grid.get_exit_mask((1, 1))
+        self.assertEqual(mask, 15 & ~direction_bits["down"])
+
+    def test_moved_entity_frees_its_old_tile(self):
+        self.grid.add_entity(self.npc)
+        self.grid.move_entity(self.npc, (0, 1))
+        mask = self.grid.get_exit_mask((1, 1))
+        self.assertEqual(mask, 15 & ~direction_bits["left"])
+
+
+class TestCollisionSnapshot(unittest.TestCase):
+    def setUp(self):
+        masks = compute_exit_masks((3, 3), {}, set())
+        self.grid = CollisionGrid((3, 3), {}, masks)
+        self.npc = Mock(spec=Entity)
+        self.npc.tile_pos = (1, 0)
+        self.grid.add_entity(self.npc)
+
+    def test_exits_skip_taken_tiles(self):
+        exits = self.grid.snapshot().get_exits((1, 1))
+        self.assertEqual(sorted(exits), [(0, 1), (1, 2), (2, 1)])
+
+    def test_snapshot_ignores_later_moves(self):
+        snapshot = self.grid.snapshot()
+        self.grid.move_entity(self.npc, (0, 1))
+        self.assertNotIn((1, 0), snapshot.get_exits((1, 1)))
+        self.assertIn((1, 0), self.grid.snapshot().get_exits((1, 1)))
+
+    def test_snapshot_is_reused_until_version_changes(self):
+        snapshot = self.grid.snapshot()
+        self.assertIs(self.grid.snapshot(), snapshot)
+        self.grid.move_entity(self.npc, (0, 1))
+        self.assertIsNot(self.grid.snapshot(), snapshot)
+
+    def test_path_goes_around_entity(self):
+        path = self.grid.snapshot().find_path((0, 0), (2, 0))
+        self.assertEqual(len(path), 4)
+        self.assertNotIn((1, 0), path)
+
+
+class TestReachability(unittest.TestCase):
+    def make(self, collision_map):
+        masks = compute_exit_masks((3, 3), collision_map, set())
+        return Reachability((3, 3), masks)
+
+    def test_open_tiles_reach_each_other(self):
+        reachability = self.make({})
+        self.assertTrue(reachability.can_reach((0, 0), (2, 2)))
+
+    def test_walled_off_tile_is_not_reachable(self):
+        # (0, 0) is cut off from the rest by a wall of blocked tiles
+        reachability = self.make({(1, 0): None, (0, 1): None, (1, 1): None})
+        self.assertFalse(reachability.can_reach((2, 2), (0, 0)))
+        self.assertFalse(reachability.can_reach((0, 0), (2, 2)))
+
+    def test_one_way_tile_is_honored(self):
+        # the middle row can only be crossed going down
+        row = {"enter": ["up"], "exit": ["down"]}
+        reachability = self.make({(0, 1): row, (1, 1): row, (2, 1): row})
+        self.assertTrue(reachability.can_reach((1, 0), (1, 2)))
+        self.assertFalse(reachability.can_reach((1, 2), (1, 0)))
+
+    def test_tile_outside_map_is_not_reachable(self):
+        reachability = self.make({})
+        self.assertFalse(reachability.can_reach((0, 0), (3, 0)))
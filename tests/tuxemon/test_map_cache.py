@@ -0,0 +1,89 @@
+import threading
+import unittest
+from unittest.mock import Mock
+
+from tuxemon.event import EventObject, MapAction
+from tuxemon.map_cache import MapCache, get_teleport_targets
+
+
+def make_event(*acts):
+    return EventObject(None, "event", 0, 0, 1, 1, [], list(acts))
+
+
+class TestGetTeleportTargets(unittest.TestCase):
+    def test_teleport_actions_are_targets(self):
+        events = [
+            make_event(MapAction("teleport", ["house.tmx", "1", "2"], None)),
+            make_event(
+                MapAction("transition_teleport", ["shop.tmx", "1", "2", "0.3"], None),
+                MapAction("play_sound", ["door"], None),
+            ),
+        ]
+        self.assertEqual(get_teleport_targets(events), ["house.tmx", "shop.tmx"])
+
+    def test_targets_are_not_repeated(self):
+        act = MapAction("delayed_teleport", ["house.tmx", "1", "2"], None)
+        events = [make_event(act), make_event(act)]
+        self.assertEqual(get_teleport_targets(events), ["house.tmx"])
+
+
+class TestMapCache(unittest.TestCase):
+    def setUp(self):
+        self.load_map = Mock(side_effect=lambda path: Mock(filename=path))
+        self.cache = MapCache(self.load_map, size=2)
+        self.addCleanup(self.cache.shutdown)
+
+    def test_cached_map_is_not_loaded_again(self):
+        first = self.cache.get("a.tmx")
+        self.assertIs(self.cache.get("a.tmx"), first)
+        self.load_map.assert_called_once_with("a.tmx")
+
+    def test_least_recently_used_map_is_evicted(self):
+        self.cache.get("a.tmx")
+        self.cache.get("b.tmx")
+        self.cache.get("a.tmx")
+        self.cache.get("c.tmx")
+        self.assertIn("a.tmx", self.cache)
+        self.assertNotIn("b.tmx", self.cache)
+
+    def test_disabled_cache_keeps_nothing(self):
+        cache = MapCache(self.load_map, size=0)
+        cache.get("a.tmx")
+        self.assertEqual(len(cache), 0)
+        self.assertIsNone(cache.preload("b.tmx"))
+
+    def test_preloaded_map_is_cached(self):
+        self.cache.preload("a.tmx").result()
+        self.assertIn("a.tmx", self.cache)
+        self.cache.get("a.tmx")
+        self.load_map.assert_called_once_with("a.tmx")
+
+    def test_images_are_loaded_on_the_thread_getting_the_map(self):
+        map_data = self.cache.preload("a.tmx").result()
+        map_data.load_images.assert_not_called()
+        threads = []
+        map_data.load_images.side_effect = lambda: threads.append(threading.current_thread())
+        self.cache.get("a.tmx")
+        self.assertEqual(threads, [threading.current_thread()])
+
+    def test_map_being_preloaded_is_waited_for(self):
+        release = threading.Event()
+
+        def load_map(path):
+            release.wait(5)
+            return Mock(filename=path)
+
+        self.cache.load_map = Mock(side_effect=load_map)
+        self.cache.preload("a.tmx")
+        threading.Timer(0.05, release.set).start()
+        self.cache.get("a.tmx")
+        self.cache.load_map.assert_called_once_with("a.tmx")
+
+    def test_failed_preload_is_loaded_again(self):
+        self.load_map.side_effect = [OSError("missing"), Mock()]
+        with self.assertLogs("tuxemon.map_cache", level="ERROR"):
+            future = self.cache.preload("a.tmx")
+            with self.assertRaises(OSError):
+                future.result()
+        self.cache.get("a.tmx")
+        self.assertEqual(self.load_map.call_count, 2)
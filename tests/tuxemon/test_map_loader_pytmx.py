@@ -1,9 +1,13 @@
+import os
+import tempfile
 import unittest
 from itertools import combinations
 from operator import is_not
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
-from tuxemon.map_loader import TMXMapLoader
+from tuxemon.event import EventObject, MapCondition
+from tuxemon.map import Reachability
+from tuxemon.map_loader import CompiledMap, TMXMapLoader, assign_condition_ids
 
 
 class TestTMXMapLoaderRegionTiles(unittest.TestCase):
@@ -46,3 +50,74 @@ class TestTMXMapLoaderRegionTiles(unittest.TestCase):
             ],
             self.result
         )
+
+
+class TestTMXMapLoaderCompiledCache(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tempdir.cleanup)
+        self.cache_dir = os.path.join(self.tempdir.name, "cache")
+        self.filename = os.path.join(self.tempdir.name, "town.tmx")
+        with open(self.filename, "w") as fp:
+            fp.write("<map/>")
+        exit_masks = bytearray(4)
+        reachability = Reachability((2, 2), exit_masks)
+        self.compiled = CompiledMap([], [], [], {(1, 1): None}, set(), exit_masks, reachability)
+        tiled_map = Mock(width=2, height=2, tilewidth=16, tileheight=16, properties={})
+        patcher = patch("tuxemon.map_loader.pytmx.TiledMap", return_value=tiled_map)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def load(self):
+        loader = TMXMapLoader(self.cache_dir)
+        with patch.object(TMXMapLoader, "compile", return_value=self.compiled) as compile:
+            map_data = loader.load(self.filename)
+        return map_data, compile
+
+    def test_compiled_map_is_reused(self):
+        self.load()
+        map_data, compile = self.load()
+        compile.assert_not_called()
+        self.assertEqual(map_data.collision_map, {(1, 1): None})
+
+    def test_changed_map_is_compiled_again(self):
+        self.load()
+        with open(self.filename, "w") as fp:
+            fp.write("<map></map>")
+        map_data, compile = self.load()
+        compile.assert_called_once()
+
+    def test_changed_tileset_is_compiled_again(self):
+        tileset = os.path.join(self.tempdir.name, "tiles.tsx")
+        with open(tileset, "w") as fp:
+            fp.write('<tileset><tile id="0"/></tileset>')
+        with open(self.filename, "w") as fp:
+            fp.write('<map><tileset firstgid="1" source="tiles.tsx"/></map>')
+        self.load()
+        with open(tileset, "w") as fp:
+            fp.write('<tileset><tile id="0"><properties/></tile></tileset>')
+        map_data, compile = self.load()
+        compile.assert_called_once()
+
+    def test_no_cache_directory_always_compiles(self):
+        loader = TMXMapLoader()
+        with patch.object(TMXMapLoader, "compile", return_value=self.compiled) as compile:
+            loader.load(self.filename)
+            loader.load(self.filename)
+        self.assertEqual(compile.call_count, 2)
+
+
+class TestAssignConditionIds(unittest.TestCase):
+    def make_event(self, count):
+        conds = [
+            MapCondition("player_moved", [], 0, 0, 1, 1, "is", None)
+            for _ in range(count)
+        ]
+        return EventObject(1, "event", 0, 0, 1, 1, conds, [])
+
+    def test_conditions_are_numbered_in_map_order(self):
+        events = [self.make_event(2), self.make_event(1)]
+        inits = [self.make_event(1)]
+        assign_condition_ids(events, inits)
+        ids = [cond.id for event in events + inits for cond in event.conds]
+        self.assertEqual(ids, [0, 1, 2, 3])
@@ -0,0 +1,181 @@
+import threading
+import unittest
+
+from tuxemon.pathfinding import FlowField, PathfindingService, find_path
+
+
+def open_grid_exits(size, walls=()):
+    def get_exits(position):
+        x, y = position
+        exits = []
+        for neighbor in ((x, y + 1), (x + 1, y), (x, y - 1), (x - 1, y)):
+            if not (0 <= neighbor[0] < size[0] and 0 <= neighbor[1] < size[1]):
+                continue
+            if neighbor in walls:
+                continue
+            exits.append(neighbor)
+        return exits
+
+    return get_exits
+
+
+class TestFindPath(unittest.TestCase):
+    def test_path_is_ordered_from_destination_to_first_step(self):
+        size = (3, 1)
+        path = find_path((0, 0), (2, 0), size, open_grid_exits(size))
+        self.assertEqual(path, [(2, 0), (1, 0)])
+
+    def test_path_to_start_is_empty(self):
+        size = (3, 3)
+        path = find_path((1, 1), (1, 1), size, open_grid_exits(size))
+        self.assertEqual(path, [])
+
+    def test_path_goes_around_walls(self):
+        size = (3, 3)
+        walls = {(1, 0), (1, 1)}
+        path = find_path((0, 0), (2, 0), size, open_grid_exits(size, walls))
+        self.assertEqual(len(path), 6)
+        self.assertNotIn((1, 0), path)
+        self.assertNotIn((1, 1), path)
+
+    def test_unreachable_destination_returns_none(self):
+        size = (3, 3)
+        walls = {(1, 0), (1, 1), (1, 2)}
+        path = find_path((0, 0), (2, 0), size, open_grid_exits(size, walls))
+        self.assertIsNone(path)
+
+    def test_destination_out_of_bounds_returns_none(self):
+        size = (3, 3)
+        path = find_path((0, 0), (5, 5), size, open_grid_exits(size))
+        self.assertIsNone(path)
+
+    def test_one_way_tile_can_be_crossed_in_its_direction(self):
+        size = (3, 1)
+
+        def get_exits(position):
+            if position == (1, 0):
+                return [(0, 0)]
+            return open_grid_exits(size)(position)
+
+        path = find_path((2, 0), (0, 0), size, get_exits)
+        self.assertEqual(path, [(0, 0), (1, 0)])
+
+    def test_one_way_tile_cannot_be_crossed_against_its_direction(self):
+        size = (3, 1)
+
+        def get_exits(position):
+            if position == (1, 0):
+                return [(0, 0)]
+            return open_grid_exits(size)(position)
+
+        path = find_path((0, 0), (2, 0), size, get_exits)
+        self.assertIsNone(path)
+
+
+class TestFlowField(unittest.TestCase):
+    def test_path_matches_find_path(self):
+        size = (5, 4)
+        walls = {(1, 0), (1, 1), (1, 2), (3, 1), (3, 2), (3, 3)}
+        get_exits = open_grid_exits(size, walls)
+        field = FlowField((4, 0), size, get_exits)
+        for start in ((0, 0), (2, 3), (0, 3), (4, 3)):
+            expected = find_path(start, (4, 0), size, get_exits)
+            path = field.find_path(start)
+            self.assertEqual(len(path), len(expected))
+            self.assertEqual(path[0], (4, 0))
+
+    def test_reached_tiles_are_not_searched_again(self):
+        size = (4, 1)
+        calls = []
+
+        def get_exits(position):
+            calls.append(position)
+            return open_grid_exits(size)(position)
+
+        field = FlowField((3, 0), size, get_exits)
+        field.find_path((0, 0))
+        count = len(calls)
+        self.assertEqual(field.find_path((1, 0)), [(3, 0), (2, 0)])
+        self.assertEqual(len(calls), count)
+
+    def test_next_step_of_reached_tile(self):
+        size = (3, 1)
+        field = FlowField((2, 0), size, open_grid_exits(size))
+        field.find_path((0, 0))
+        self.assertEqual(field.next_step((0, 0)), (1, 0))
+        self.assertIsNone(field.next_step((2, 0)))
+
+    def test_search_resumes_behind_reached_start(self):
+        size = (4, 1)
+        field = FlowField((3, 0), size, open_grid_exits(size, {(1, 0)}))
+        self.assertEqual(field.find_path((2, 0)), [(3, 0)])
+        self.assertIsNone(field.find_path((0, 0)))
+        # the wall itself can still be left
+        self.assertEqual(field.find_path((1, 0)), [(3, 0), (2, 0)])
+
+    def test_one_way_tile_cannot_be_crossed_against_its_direction(self):
+        size = (3, 1)
+
+        def get_exits(position):
+            if position == (1, 0):
+                return [(0, 0)]
+            return open_grid_exits(size)(position)
+
+        self.assertIsNone(FlowField((2, 0), size, get_exits).find_path((0, 0)))
+        self.assertEqual(
+            FlowField((0, 0), size, get_exits).find_path((2, 0)),
+            [(0, 0), (1, 0)],
+        )
+
+
+class TestPathfindingService(unittest.TestCase):
+    def setUp(self):
+        self.service = PathfindingService(workers=1)
+        self.addCleanup(self.service.shutdown)
+        self.results = []
+
+    def apply(self, dest, path):
+        self.results.append((dest, path))
+
+    def wait(self, owner):
+        self.service.requests[owner].future.result(timeout=5)
+
+    def test_result_is_applied_by_deliver(self):
+        self.service.submit("npc", (2, 0), lambda: [(2, 0)], self.apply)
+        self.wait("npc")
+        self.assertEqual(self.results, [])
+        self.assertTrue(self.service.is_pending("npc"))
+        self.assertEqual(self.service.deliver(), 1)
+        self.assertEqual(self.results, [((2, 0), [(2, 0)])])
+        self.assertFalse(self.service.is_pending("npc"))
+
+    def test_unfinished_search_is_not_applied(self):
+        release = threading.Event()
+        self.addCleanup(release.set)
+        self.service.submit("npc", (2, 0), lambda: release.wait(5), self.apply)
+        self.assertEqual(self.service.deliver(), 0)
+        self.assertTrue(self.service.is_pending("npc"))
+
+    def test_cancelled_request_is_not_applied(self):
+        self.service.submit("npc", (2, 0), lambda: [(2, 0)], self.apply)
+        self.service.cancel("npc")
+        # the single worker runs the searches in order
+        self.service.executor.submit(lambda: None).result(timeout=5)
+        self.service.deliver()
+        self.assertEqual(self.results, [])
+
+    def test_new_request_replaces_the_old_one(self):
+        self.service.submit("npc", (2, 0), lambda: [(2, 0)], self.apply)
+        self.service.submit("npc", (3, 0), lambda: [(3, 0)], self.apply)
+        self.wait("npc")
+        self.service.deliver()
+        self.assertEqual(self.results, [((3, 0), [(3, 0)])])
+
+    def test_budget_limits_results_per_frame(self):
+        self.service.budget = -1
+        for owner in ("a", "b"):
+            self.service.submit(owner, (1, 0), lambda: [], self.apply)
+            self.wait(owner)
+        self.assertEqual(self.service.deliver(), 1)
+        self.assertEqual(self.service.deliver(), 1)
+        self.assertEqual(len(self.results), 2)
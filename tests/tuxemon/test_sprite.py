@@ -0,0 +1,82 @@
+import unittest
+
+import pygame
+from pygame.rect import Rect
+
+import tuxemon.graphics  # noqa: F401 (imported before sprite, which it uses)
+from tuxemon.sprite import RelativeGroup, Sprite, SpriteGroup
+
+
+def make_sprite(topleft=(0, 0), size=(8, 8)):
+    sprite = Sprite(image=pygame.Surface(size))
+    sprite.rect = Rect(topleft, size)
+    return sprite
+
+
+class TestSpriteGroupDirtyRects(unittest.TestCase):
+    def setUp(self):
+        self.group = SpriteGroup()
+        self.sprite = make_sprite((10, 10))
+        self.group.add(self.sprite)
+        self.group.get_dirty_rects()
+
+    def test_unchanged(self):
+        self.assertEqual([], self.group.get_dirty_rects())
+
+    def test_added(self):
+        other = make_sprite((40, 40))
+        self.group.add(other)
+        self.assertEqual([Rect(40, 40, 8, 8)], self.group.get_dirty_rects())
+        self.assertEqual([], self.group.get_dirty_rects())
+
+    def test_removed(self):
+        self.group.remove(self.sprite)
+        self.assertEqual([Rect(10, 10, 8, 8)], self.group.get_dirty_rects())
+        self.assertEqual([], self.group.get_dirty_rects())
+
+    def test_moved(self):
+        self.sprite.rect = Rect(20, 10, 8, 8)
+        self.assertEqual(
+            [Rect(10, 10, 8, 8), Rect(20, 10, 8, 8)],
+            self.group.get_dirty_rects(),
+        )
+        self.assertEqual([], self.group.get_dirty_rects())
+
+    def test_new_image(self):
+        self.sprite.image = pygame.Surface((8, 8))
+        self.assertEqual(
+            [Rect(10, 10, 8, 8), Rect(10, 10, 8, 8)],
+            self.group.get_dirty_rects(),
+        )
+        self.assertEqual([], self.group.get_dirty_rects())
+
+    def test_dirty_flag_is_cleared(self):
+        self.sprite.dirty = 1
+        self.assertEqual(2, len(self.group.get_dirty_rects()))
+        self.assertEqual(0, self.sprite.dirty)
+        self.assertEqual([], self.group.get_dirty_rects())
+
+    def test_dirty_flag_persists(self):
+        self.sprite.dirty = 2
+        self.assertEqual(2, len(self.group.get_dirty_rects()))
+        self.assertEqual(2, self.sprite.dirty)
+        self.assertEqual(2, len(self.group.get_dirty_rects()))
+
+
+class TestRelativeGroupDirtyRects(unittest.TestCase):
+    def test_screen_offset(self):
+        parent = Rect(100, 50, 200, 200)
+        group = RelativeGroup(parent=lambda: parent)
+        group.add(make_sprite((10, 10)))
+        self.assertEqual([Rect(110, 60, 8, 8)], group.get_dirty_rects())
+
+    def test_parent_moved(self):
+        parent = Rect(100, 50, 200, 200)
+        group = RelativeGroup(parent=lambda: parent)
+        group.add(make_sprite((10, 10)))
+        group.get_dirty_rects()
+        parent = Rect(0, 0, 200, 200)
+        self.assertEqual(
+            [Rect(110, 60, 8, 8), Rect(10, 10, 8, 8)],
+            group.get_dirty_rects(),
+        )
@@ -2,6 +2,8 @@ import unittest
 from unittest import skip
 from unittest.mock import Mock
 
+from pygame.rect import Rect
+
 from tuxemon.state import StateManager
 from tuxemon.state import State
 
@@ -303,3 +305,54 @@ class WhenEmpty(StateManagerTestBase):
 
     def test_no_states_current_state_is_none(self):
         self.assertEqual(self.sm.current_state, None)
+
+
+class DirtyRects(unittest.TestCase):
+    screen = Rect(0, 0, 100, 100)
+
+    def setUp(self):
+        self.sm = StateManager("head.tail")
+        self.a = self.create_state([Rect(10, 10, 5, 5)])
+        self.b = self.create_state([])
+        self.assertIsNone(self.get_dirty_rects([self.a, self.b]))
+
+    def create_state(self, dirty):
+        state = create_state("dirty")
+        state.get_dirty_rects.return_value = dirty
+        return state
+
+    def get_dirty_rects(self, states):
+        return self.sm.get_dirty_rects(states, self.screen)
+
+    def test_same_states(self):
+        self.assertEqual(
+            [Rect(10, 10, 5, 5)],
+            self.get_dirty_rects([self.a, self.b]),
+        )
+
+    def test_clipped_to_screen(self):
+        self.a.get_dirty_rects.return_value = [
+            Rect(90, 90, 20, 20),
+            Rect(200, 200, 5, 5),
+        ]
+        self.assertEqual(
+            [Rect(90, 90, 10, 10)],
+            self.get_dirty_rects([self.a, self.b]),
+        )
+
+    def test_state_pushed(self):
+        c = self.create_state([])
+        self.assertIsNone(self.get_dirty_rects([c, self.a, self.b]))
+        self.assertEqual(
+            [Rect(10, 10, 5, 5)],
+            self.get_dirty_rects([c, self.a, self.b]),
+        )
+
+    def test_state_popped(self):
+        self.assertIsNone(self.get_dirty_rects([self.b]))
+
+    def test_state_not_tracked(self):
+        self.b.get_dirty_rects.return_value = None
+        self.assertIsNone(self.get_dirty_rects([self.a, self.b]))
+        # every state was still asked, so they remember what they drew
+        self.assertEqual(2, self.a.get_dirty_rects.call_count)
@@ -1,6 +1,19 @@
 import unittest
+from typing import NamedTuple, Optional, Union
 
-from tuxemon.tools import round_to_divisible, copy_dict_with_keys
+from tuxemon.tools import (
+    cast_parameters_to_namedtuple,
+    copy_dict_with_keys,
+    get_parameter_caster,
+    round_to_divisible,
+)
+
+
+class ExampleParameters(NamedTuple):
+    name: str
+    amount: int
+    rate: Optional[float]
+    target: Union[int, str]
 
 
 class TestRoundToDivisible(unittest.TestCase):
@@ -32,3 +45,33 @@ class TestCopyDictWithKeys(unittest.TestCase):
         expected = {"a": 1, "c": 3}
         result = copy_dict_with_keys(source, keys)
         self.assertEqual(result, expected)
+
+
+class TestCastParametersToNamedtuple(unittest.TestCase):
+    def test_cast(self):
+        result = cast_parameters_to_namedtuple(
+            ["potion", "3", "0.5", "7"],
+            ExampleParameters,
+        )
+        self.assertEqual(result, ExampleParameters("potion", 3, 0.5, 7))
+
+    def test_optional_and_missing(self):
+        result = cast_parameters_to_namedtuple(["potion", "3", ""], ExampleParameters)
+        self.assertEqual(result, ExampleParameters("potion", 3, None, "None"))
+
+    def test_union_falls_back(self):
+        result = cast_parameters_to_namedtuple(
+            ["potion", "3", None, "player"],
+            ExampleParameters,
+        )
+        self.assertEqual(result.target, "player")
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            cast_parameters_to_namedtuple(["potion", "many"], ExampleParameters)
+
+    def test_caster_is_reused(self):
+        self.assertIs(
+            get_parameter_caster(ExampleParameters),
+            get_parameter_caster(ExampleParameters),
+        )
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from tuxemon.cli.clicommand import CLICommand
+from tuxemon.cli.context import InvokeContext
+from tuxemon.event.eventprofiler import EventProfiler
+
+class ProfileCommand(CLICommand):
+    """
+    Profile the conditions, actions and events of the map.
+
+    """
+
+    name = "profile"
+    description = (
+        "Time map conditions, actions and events. "
+        "Use start, stop, reset, show [category] [count] or dump <file>."
+    )
+    example = "profile show condition 10"
+
+    def invoke(self, ctx: InvokeContext, line: str) -> None:
+        """
+        Start, stop, show or save the profile of the event engine.
+
+        Parameters:
+            ctx: Contains references to parts of the game and CLI interface.
+            line: Complete text as entered into the prompt.
+
+        """
+        event_engine = ctx.session.client.event_engine
+        words = line.split()
+        command = words[0] if words else "show"
+        arguments = words[1:]
+
+        if command == "start":
+            if event_engine.profiler is None:
+                event_engine.set_profiler(EventProfiler())
+            print("Profiling the event engine.")
+            return
+
+        if command == "stop":
+            event_engine.set_profiler(None)
+            print("Stopped profiling the event engine.")
+            return
+
+        profiler = event_engine.profiler
+        if profiler is None:
+            print("The event engine is not profiled. Use 'profile start'.")
+            return
+
+        if command == "reset":
+            profiler.reset()
+        elif command == "dump" and len(arguments) == 1:
+            profiler.dump(arguments[0])
+            print(f"Profile saved to {arguments[0]}.")
+        elif command == "show":
+            category = None
+            count = 20
+            for argument in arguments:
+                if argument.isdigit():
+                    count = int(argument)
+                else:
+                    category = argument
+            print(
+                f"{'category':15} {'name':30} {'calls':>8} "
+                f"{'total ms':>10} {'mean ms':>9} {'p95 ms':>9}"
+            )
+            for entry in profiler.get_report(category)[:count]:
+                print(
+                    f"{entry['category']:15} {entry['name'][:30]:30} "
+                    f"{entry['count']:8d} {entry['total_ms']:10.2f} "
+                    f"{entry['mean_ms']:9.3f} {entry['p95_ms']:9.3f}"
+                )
+        else:
+            print(f"Unknown profile command: {line.strip()}")
@@ -26,11 +26,11 @@
 from __future__ import annotations
 import logging
 import os.path
-import time
 from threading import Thread
 
 import pygame as pg
 
+from tuxemon.clock import FramePacer
 from tuxemon.config import TuxemonConfig
 from tuxemon.platform.platform_pygame.events import (
     PygameEventQueueHandler,
@@ -49,7 +49,7 @@ from tuxemon.map import TuxemonMap
 from tuxemon.platform.events import PlayerInput
 
 from typing import Iterable, Generator, Optional, Tuple, Mapping, Any, Dict,\
-    overload, Type, TypeVar, Union, Sequence
+    overload, Type, TypeVar, Union, Sequence, List, Hashable
 from tuxemon.states.world.worldstate import WorldState
 from tuxemon.event import EventObject
 
@@ -84,7 +84,10 @@ class LocalPygameClient:
         self.done = False
         self.fps = config.fps
         self.show_fps = config.show_fps
+        self.dirty_rects = config.dirty_rects
         self.current_time = 0.0
+        self.interpolation = 0.0
+        self.pacer: Optional[FramePacer] = None
 
         # somehow this value is being patched somewhere
         self.events: Sequence[EventObject] = []
@@ -127,7 +130,7 @@ class LocalPygameClient:
         # Set up our game's event engine which executes actions based on
         # conditions defined in map files.
         self.event_engine = EventEngine(local_session)
-        self.event_persist: Dict[str, Dict[str, Any]] = {}
+        self.event_persist: Dict[str, Dict[Hashable, Any]] = {}
 
         # Set up a variable that will keep track of currently playing music.
         self.current_music = {
@@ -168,11 +171,11 @@ class LocalPygameClient:
             map_data: The map to load.
 
         """
+        # the event engine resets the events of the map being left
+        self.event_engine.load_map(map_data)
         self.events = map_data.events
         self.inits = map_data.inits
         self.interacts = map_data.interacts
-        self.event_engine.reset()
-        self.event_engine.current_map = map_data
 
     def draw_event_debug(self) -> None:
         """
@@ -287,32 +290,36 @@ class LocalPygameClient:
         This leaves the networking component responsible for the main loop.
 
         """
-        update = self.update
-        draw = self.draw
-        screen = self.screen
-        flip = pg.display.update
-        clock = time.time
-        frame_length = 1.0 / self.fps
-        time_since_draw = 0.0
-        last_update = clock()
+        pacer = self.pacer = FramePacer(
+            self.update,
+            self.draw_frame,
+            step=1.0 / self.config.update_rate,
+            fps=self.fps,
+        )
         fps_timer = 0.0
         frames = 0
 
         while not self.exit:
-            clock_tick = clock() - last_update
-            last_update = clock()
-            time_since_draw += clock_tick
-            update(clock_tick)
-            if time_since_draw >= frame_length:
-                time_since_draw -= frame_length
-                draw(screen)
-                if self.controller_overlay:
-                    self.controller_overlay.draw(screen)
-                flip()
-                frames += 1
-
+            drawn = pacer.frames
+            clock_tick = pacer.tick()
+            frames += pacer.frames - drawn
             fps_timer, frames = self.handle_fps(clock_tick, fps_timer, frames)
-            time.sleep(0.01)
+
+    def draw_frame(self, interpolation: float) -> None:
+        """
+        Draw the screen, and show it.
+
+        Parameters:
+            interpolation: Fraction of an update step elapsed since the
+                last update, for states which interpolate their drawing.
+
+        """
+        self.interpolation = interpolation
+        dirty = self.draw(self.screen)
+        if dirty is None:
+            pg.display.update()
+        elif dirty:
+            pg.display.update(dirty)
 
     def update(self, time_delta: float) -> None:
         """
@@ -380,13 +387,21 @@ class LocalPygameClient:
         if self.state_manager.current_state is None:
             self.exit = True
 
-    def draw(self, surface: pg.surface.Surface) -> None:
+    def draw(self, surface: pg.surface.Surface) -> Optional[List[pg.rect.Rect]]:
         """
         Draw all active states.
 
+        When drawing dirty rects, only the areas that the states report as
+        changed are drawn again.  The whole screen is drawn when a state
+        can't tell, or when other states are shown.
+
         Parameters:
             surface: Surface where the drawing takes place.
 
+        Returns:
+            The areas that were drawn, or ``None`` if it was the whole
+            surface.
+
         """
         # TODO: refactor into Widget
 
@@ -407,9 +422,21 @@ class LocalPygameClient:
             ):
                 break
 
-        # draw from bottom up for proper layering
-        for state in reversed(to_draw):
-            state.draw(surface)
+        dirty = None
+        if self.dirty_rects and not self.config.collision_map:
+            dirty = self.state_manager.get_dirty_rects(to_draw, full_screen)
+            if dirty:
+                surface.set_clip(dirty[0].unionall(dirty[1:]))
+
+        if dirty is None or dirty:
+            # draw from bottom up for proper layering
+            for state in reversed(to_draw):
+                state.draw(surface)
+
+            if self.controller_overlay:
+                self.controller_overlay.draw(surface)
+
+            surface.set_clip(None)
 
         if self.config.collision_map:
             self.draw_event_debug()
@@ -419,6 +446,8 @@ class LocalPygameClient:
             self.frame_number += 1
             pg.image.save(self.screen, filename)
 
+        return dirty
+
     def handle_fps(
         self,
         clock_tick: float,
@@ -451,6 +480,9 @@ class LocalPygameClient:
             fps_timer += clock_tick
             if fps_timer >= 1:
                 with_fps = f"{self.caption} - {frames / fps_timer:.2f} FPS"
+                if self.pacer is not None and self.pacer.dropped_frames:
+                    with_fps += f", {self.pacer.dropped_frames} dropped"
+                    self.pacer.dropped_frames = 0
                 pg.display.set_caption(with_fps)
                 return 0, 0
             return fps_timer, frames
@@ -492,6 +524,8 @@ class LocalPygameClient:
                     if sprite.slug in world.npcs:
                         del world.npcs[sprite]
 
+        world.collision_grid.reset_entities(world.get_all_entities())
+
     def get_map_filepath(self) -> Optional[str]:
         """
         Gets the filepath of the current map.
@@ -1,8 +1,20 @@
 import collections
+import logging
 import time
 from heapq import heappush, heapify, heappop, heappushpop
+from typing import Optional
 
-__all__ = ("ScheduledItem", "Scheduler", "Clock")
+__all__ = ("ScheduledItem", "Scheduler", "Clock", "FramePacer")
+
+logger = logging.getLogger(__name__)
+
+# Shortest sleep, as a fraction of the requested duration.
+MIN_SLEEP_FRACTION = 0.1
+# Range of the fitted ratio between the real and the requested sleep.
+MIN_SLEEP_GRADIENT = 0.5
+MAX_SLEEP_GRADIENT = 2.0
+# Number of recent sleeps fitted to predict the next one.
+SLEEP_SAMPLE_COUNT = 30
 
 
 class ScheduledItem:
@@ -365,6 +377,53 @@ class Clock(Scheduler):
     WIP
     """
 
+    def __init__(self, time_function=time.perf_counter, sleep_function=time.sleep):
+        """Initialise a Clock, with optional custom time and sleep functions.
+
+        Parameters:
+            time_function: Function to return the elapsed time of the
+                application, in seconds.
+            sleep_function: Function to wait for a number of seconds.
+        """
+        super().__init__(time_function)
+        self._sleep = sleep_function
+        # predicts how long a sleep really lasts from the requested time
+        self._sleep_model = self._least_squares()
+        self._sleep_gradient, self._sleep_offset = next(self._sleep_model)
+
+    def sleep(self, duration: float) -> None:
+        """
+        Wait for about a given time.
+
+        The operating system usually wakes up late.  The requested and the
+        real durations of the past sleeps are fitted to a line, and the
+        request is shortened so the real sleep ends on time.
+
+        Parameters:
+            duration: Seconds to wait.
+
+        """
+        if duration <= 0:
+            return
+
+        # the fit can be skewed by a few very late wake ups
+        gradient = min(
+            max(self._sleep_gradient, MIN_SLEEP_GRADIENT),
+            MAX_SLEEP_GRADIENT,
+        )
+        offset = max(self._sleep_offset, 0.0)
+        request = (duration - offset) / gradient
+        # sleep a little even when the fit predicts a late wake up, so the
+        # new sample can correct a bad fit instead of spinning until then
+        request = min(max(request, duration * MIN_SLEEP_FRACTION), duration)
+
+        start = self._time()
+        self._sleep(request)
+        actual = self._time() - start
+        self._sleep_gradient, self._sleep_offset = self._sleep_model.send(
+            (request, actual),
+        )
+
     @staticmethod
     def _least_squares(
         gradient: int = 1, 
@@ -391,6 +450,9 @@ class Clock(Scheduler):
         XY += x * y
         n += 1
 
+        # only the recent samples are fitted, so old outliers are forgotten
+        samples = collections.deque([(x, y)])
+
         while True:
             x, y = yield gradient, offset
             X += x
@@ -398,6 +460,14 @@ class Clock(Scheduler):
             XX += x * x
             XY += x * y
             n += 1
+            samples.append((x, y))
+            if n > SLEEP_SAMPLE_COUNT:
+                x, y = samples.popleft()
+                X -= x
+                Y -= y
+                XX -= x * x
+                XY -= x * y
+                n -= 1
 
             try:
                 gradient = (n * XY - X * Y) / (n * XX - X * X)
@@ -406,3 +476,94 @@ class Clock(Scheduler):
                 # Can happen in pathalogical case; keep current
                 # gradient/offset for now.
                 pass
+
+
+class FramePacer:
+    """
+    Run a game loop with fixed time steps, drawing at a limited rate.
+
+    The simulation is updated in steps of the same length, however long
+    the frames take.  Between two draws, as many steps are run as the
+    elapsed time allows, and the time elapsed since the last step is
+    passed to the draw function as a fraction of a step, for
+    interpolation.  When nothing is due, the loop sleeps until the next
+    update or draw.
+
+    Draws that come more than a frame late are counted as dropped.
+
+    Parameters:
+        update: Function called with the length of a step, for each step.
+        draw: Function called with the fraction of a step elapsed since
+            the last update.
+        step: Length of an update step, in seconds.
+        fps: Maximum number of draws per second.
+        max_steps: Maximum number of steps run per tick.  The simulation
+            skips the time it can't catch up with.
+        clock: Clock used to tell time, sleep and run scheduled functions.
+
+    """
+
+    def __init__(
+        self,
+        update,
+        draw,
+        step: float = 1 / 60,
+        fps: float = 60,
+        max_steps: int = 5,
+        clock: Optional[Clock] = None,
+    ) -> None:
+        self.update = update
+        self.draw = draw
+        self.step = step
+        self.frame_length = 1.0 / fps
+        self.max_steps = max_steps
+        self.clock = Clock() if clock is None else clock
+        # times when the next update and draw are due
+        self.next_update = None
+        self.next_frame = None
+        self.frames = 0
+        self.dropped_frames = 0
+
+    def tick(self) -> float:
+        """
+        Run the updates and the draw that are due, then wait for the next.
+
+        Returns:
+            Seconds elapsed since the last tick.
+
+        """
+        clock = self.clock
+        delta = clock.tick()
+        now = clock._time()
+        if self.next_update is None:
+            self.next_update = now + self.step
+            self.next_frame = now
+
+        steps = 0
+        while now >= self.next_update and steps < self.max_steps:
+            self.update(self.step)
+            self.next_update += self.step
+            steps += 1
+        if now >= self.next_update:
+            behind = now - self.next_update
+            logger.debug(f"Simulation behind, skipping {behind:.3f}s")
+            self.next_update = now + self.step
+
+        if now >= self.next_frame:
+            elapsed = self.step - (self.next_update - now)
+            self.draw(min(max(elapsed / self.step, 0.0), 1.0))
+            self.frames += 1
+            late = now - self.next_frame
+            if late >= self.frame_length:
+                # don't draw the missed frames in a rush, start again
+                self.dropped_frames += int(late / self.frame_length)
+                self.next_frame = now
+            self.next_frame += self.frame_length
+
+        # sleep until the next update or draw, whichever comes first
+        wake = min(self.next_frame, self.next_update)
+        idle = clock.get_idle_time()
+        if idle is not None:
+            wake = min(wake, now + idle)
+        clock.sleep(wake - clock._time())
+        return delta
@@ -67,6 +67,7 @@ class TuxemonConfig:
         self.fullscreen = cfg.getboolean("display", "fullscreen")
         self.fps = cfg.getfloat("display", "fps")
         self.show_fps = cfg.getboolean("display", "show_fps")
+        self.dirty_rects = cfg.getboolean("display", "dirty_rects")
         self.scaling = cfg.getboolean("display", "scaling")
         self.collision_map = cfg.getboolean("display", "collision_map")
         self.large_gui = cfg.getboolean("display", "large_gui")
@@ -88,6 +89,12 @@ class TuxemonConfig:
         self.dev_tools = cfg.getboolean("game", "dev_tools")
         self.recompile_translations = cfg.getboolean("game", "recompile_translations")
         self.skip_titlescreen = cfg.getboolean("game", "skip_titlescreen")
+        self.db_snapshot = cfg.getboolean("game", "db_snapshot")
+        self.map_cache_size = cfg.getint("game", "map_cache_size")
+        self.compiled_maps = cfg.getboolean("game", "compiled_maps")
+        self.pathfind_workers = cfg.getint("game", "pathfind_workers")
+        self.pathfind_budget = cfg.getfloat("game", "pathfind_budget")  # ms/frame
+        self.update_rate = cfg.getfloat("game", "update_rate")  # updates/second
         self.compress_save: Optional[str] = cfg.get("game", "compress_save")
         if self.compress_save == "None":
             self.compress_save = None
@@ -203,6 +210,7 @@ def get_defaults() -> Mapping[str, Any]:
                         ("fullscreen", False),
                         ("fps", 60),
                         ("show_fps", False),
+                        ("dirty_rects", False),
                         ("scaling", True),
                         ("collision_map", False),
                         ("large_gui", False),
@@ -235,6 +243,12 @@ def get_defaults() -> Mapping[str, Any]:
                         ("dev_tools", False),
                         ("recompile_translations", True),
                         ("compress_save", None),
+                        ("db_snapshot", True),
+                        ("map_cache_size", 8),
+                        ("compiled_maps", True),
+                        ("pathfind_workers", 2),
+                        ("pathfind_budget", 2.0),
+                        ("update_rate", 60.0),
                     )
                 ),
             ),
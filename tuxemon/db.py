@@ -28,17 +28,33 @@
 #
 
 from __future__ import annotations
+import hashlib
 import json
 import logging
 import os
+import pickle
+import time
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
 from operator import itemgetter
 
 from tuxemon import prepare
 from typing import Any, Mapping, Dict, Sequence, TypedDict, overload, Literal,\
-    Optional
+    Optional, Tuple, List, Set, Iterator, Callable, Iterable
 
 logger = logging.getLogger(__name__)
 
+# Bump this whenever the layout of the snapshot file changes.
+SNAPSHOT_VERSION = 3
+
+# Modification time (ns), size and sha1 digest of a source file.
+FileSignature = Tuple[int, int, str]
+
 
 JSONTarget = Mapping[str, int]
 
@@ -196,6 +212,72 @@ class JSONEconomy(TypedDict):
     slug: str
     items: Sequence[JSONEconomyItem]
 
+class Record(Mapping[str, Any]):
+    """
+    Immutable database record.
+
+    Records behave like read-only dictionaries.  Nested values are frozen
+    as well: mappings become records and lists become tuples, so callers
+    cannot corrupt the tables they were looked up from.
+
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: Mapping[str, Any]) -> None:
+        frozen = {key: freeze(value) for key, value in data.items()}
+        object.__setattr__(self, "_data", frozen)
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"Record({self._data!r})"
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("database records are read-only")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("database records are read-only")
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Values are already frozen, don't walk them again when unpickling.
+        return restore_record, (self._data,)
+
+
+def restore_record(data: Dict[str, Any]) -> Record:
+    """Rebuild a pickled record without freezing its values again."""
+    record = Record.__new__(Record)
+    object.__setattr__(record, "_data", data)
+    return record
+
+
+def freeze(value: Any) -> Any:
+    """
+    Return an immutable version of a JSON value.
+
+    Parameters:
+        value: Value decoded from JSON.
+
+    Returns:
+        The value, with mappings turned into records and lists into tuples.
+
+    """
+    if isinstance(value, Record):
+        return value
+    if isinstance(value, Mapping):
+        return Record(value)
+    if isinstance(value, list):
+        return tuple(freeze(i) for i in value)
+    return value
+
+
 def process_targets(json_targets: JSONTarget) -> Sequence[str]:
     """Return values in order of preference for targeting things.
 
@@ -245,72 +327,355 @@ class JSONDatabase:
             "music": {},
             "economy": {},
         }
+        # Seconds spent loading each table during the last load.
+        self.load_times: Dict[str, float] = {}
+        # In lazy mode, records are only parsed when first looked up.
+        self.lazy = False
+        # Tables whose directory has not been listed yet (lazy mode).
+        self.pending_tables: Set[str] = set()
+        # JSON files listed but not parsed yet, by table (lazy mode).
+        self.pending_files: Dict[str, Set[str]] = {}
+        # Name of the JSON file defining each slug, by table.
+        self.slug_files: Dict[str, Dict[str, str]] = {
+            table: {} for table in self.database
+        }
+        # Secondary indexes, by table and index name.  Built on first use
+        # and dropped whenever a record is added to their table.
+        self.indexes: Dict[str, Dict[str, Mapping[str, Any]]] = {}
+        # Learnsets of single monsters, found without the learnset index.
+        self.learnsets: Dict[str, Tuple[Tuple[int, ...], Tuple[Any, ...]]] = {}
         # self.load(dir)
 
-    def load(self, directory: str = "all") -> None:
+    def load(
+        self,
+        directory: str = "all",
+        snapshot_path: Optional[str] = None,
+        lazy: bool = False,
+        workers: int = 0,
+        use_processes: bool = False,
+    ) -> None:
         """
         Loads all data from JSON files located under our data path.
 
+        If a snapshot path is given, tables whose source files did not change
+        since the snapshot was written are read from it instead of being
+        parsed again, and the snapshot is refreshed for the tables that did.
+
+        In lazy mode nothing is parsed here. Each lookup parses the file that
+        defines the requested slug, and the rest of the table only when that
+        file cannot be found.  The snapshot is not used in lazy mode.
+
+        With workers, the files of the tables that must be parsed are read
+        and decoded by a pool of threads or processes.  Records are still
+        added in directory order, so the result is the same as a serial load.
+
         Parameters:
             directory: The directory under mods/tuxemon/db/ to load. Defaults
                 to "all".
+            snapshot_path: Path of the compiled snapshot file, or ``None``
+                to always parse the JSON files.
+            lazy: Whether to defer parsing until records are looked up.
+            workers: Number of parallel workers, or 0 to parse serially.
+            use_processes: Whether the workers are processes instead of
+                threads.
 
         """
+        start = time.perf_counter()
         self.path = prepare.fetch("db")
         if directory == "all":
-            self.load_json("item")
-            self.load_json("monster")
-            self.load_json("npc")
-            self.load_json("technique")
-            self.load_json("encounter")
-            self.load_json("inventory")
-            self.load_json("environment")
-            self.load_json("sounds")
-            self.load_json("music")
-            self.load_json("economy")
+            tables = list(self.database)
         else:
-            self.load_json(directory)
+            tables = [directory]
+
+        self.lazy = lazy
+        if lazy:
+            self.pending_tables.update(tables)
+            logger.info("db tables will be loaded on first lookup")
+            return
+
+        snapshot = self.read_snapshot(snapshot_path) if snapshot_path else {}
+        executor = make_executor(workers, use_processes)
+        dirty = False
+        cached_tables = 0
+        try:
+            for table in tables:
+                table_start = time.perf_counter()
+                cached = snapshot.get(table)
+                old_files = cached["files"] if cached else {}
+                files = {}
+                if snapshot_path:
+                    files = self.scan_table(table, old_files)
+                if cached and strip_mtimes(files) == strip_mtimes(old_files):
+                    slugs = cached["slugs"]
+                    for slug, item in cached["records"].items():
+                        self.load_dict(item, table, slugs.get(slug))
+                    cached_tables += 1
+                    dirty = dirty or files != old_files
+                else:
+                    self.load_json(table, executor)
+                    snapshot[table] = {
+                        "files": files,
+                        "records": self.database[table],
+                        "slugs": self.slug_files[table],
+                    }
+                    dirty = True
+                self.load_times[table] = time.perf_counter() - table_start
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        self.build_indexes(tables)
+
+        if snapshot_path and dirty:
+            self.write_snapshot(snapshot_path, snapshot)
+
+        logger.info(
+            "loaded %d db tables in %.1f ms (%d from snapshot)",
+            len(tables),
+            (time.perf_counter() - start) * 1000,
+            cached_tables,
+        )
+        for table in tables:
+            logger.debug(
+                "db table %s: %.1f ms",
+                table,
+                self.load_times[table] * 1000,
+            )
+
+    def read_snapshot(self, snapshot_path: str) -> Dict[str, Any]:
+        """
+        Read the tables stored in a snapshot file.
+
+        Missing, unreadable or outdated snapshots are treated as empty.
+
+        Parameters:
+            snapshot_path: Path of the snapshot file.
+
+        Returns:
+            Mapping of table names to their source signatures and records.
+
+        """
+        try:
+            with open(snapshot_path, "rb") as fp:
+                snapshot = pickle.load(fp)
+        except FileNotFoundError:
+            return {}
+        except Exception:
+            logger.warning("Ignoring unreadable db snapshot %s", snapshot_path)
+            return {}
+
+        if (
+            snapshot.get("version") != SNAPSHOT_VERSION
+            or snapshot.get("path") != self.path
+        ):
+            return {}
+
+        return snapshot["tables"]
+
+    def write_snapshot(
+        self,
+        snapshot_path: str,
+        tables: Mapping[str, Any],
+    ) -> None:
+        """
+        Write the given tables to a snapshot file.
+
+        The file is replaced atomically so a crash never leaves a partially
+        written snapshot behind.
+
+        Parameters:
+            snapshot_path: Path of the snapshot file.
+            tables: Mapping of table names to their source signatures and
+                records.
+
+        """
+        snapshot = {
+            "version": SNAPSHOT_VERSION,
+            "path": self.path,
+            "tables": dict(tables),
+        }
+        os.makedirs(os.path.dirname(snapshot_path), exist_ok=True)
+        temp_path = snapshot_path + ".tmp"
+        with open(temp_path, "wb") as fp:
+            pickle.dump(snapshot, fp, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, snapshot_path)
+        logger.debug("wrote db snapshot: %s", snapshot_path)
+
+    def scan_table(
+        self,
+        table: str,
+        known: Mapping[str, FileSignature],
+    ) -> Dict[str, FileSignature]:
+        """
+        Compute the signature of every JSON file of a table.
+
+        Files are only hashed again when their size or modification time
+        differ from the known signature.
+
+        Parameters:
+            table: The directory under mods/tuxemon/db/ to look in.
+            known: Previously computed signatures, by file name.
+
+        Returns:
+            The signatures of the current files, by file name.
 
-    def load_json(self, directory: str) -> None:
+        """
+        return {
+            json_item: file_signature(
+                os.path.join(self.path, table, json_item),
+                known.get(json_item),
+            )
+            for json_item in self.list_json(table)
+        }
+
+    def list_json(self, directory: str) -> List[str]:
+        """
+        List the JSON files under a specified path.
+
+        Parameters:
+            directory: The directory under mods/tuxemon/db/ to look in.
+
+        Returns:
+            Names of the JSON files, in directory order.
+
+        """
+        return [
+            json_item
+            for json_item in os.listdir(os.path.join(self.path, directory))
+            if json_item.endswith(".json")
+        ]
+
+    def load_json(
+        self,
+        directory: str,
+        executor: Optional[Executor] = None,
+    ) -> None:
         """
         Loads all JSON items under a specified path.
 
         Parameters:
             directory: The directory under mods/tuxemon/db/ to look in.
+            executor: Pool used to read and decode the files in parallel,
+                or ``None`` to do it serially.
+
+        """
+        json_items = self.list_json(directory)
+        if executor is None:
+            for json_item in json_items:
+                self.load_file(directory, json_item)
+            return
+
+        paths = [
+            os.path.join(self.path, directory, json_item)
+            for json_item in json_items
+        ]
+        # map keeps the order of its input, so records are merged in the
+        # same order as when loading serially.
+        for json_item, item in zip(json_items, executor.map(read_json, paths)):
+            self.load_items(item, directory, json_item)
+
+    def load_file(self, directory: str, json_item: str) -> None:
+        """
+        Loads the JSON items of a single file.
+
+        Parameters:
+            directory: The directory under mods/tuxemon/db/ to look in.
+            json_item: Name of the JSON file.
+
+        """
+        self.pending_files.get(directory, set()).discard(json_item)
+        item = read_json(os.path.join(self.path, directory, json_item))
+        self.load_items(item, directory, json_item)
+
+    def load_items(self, item: Any, directory: str, json_item: str) -> None:
+        """
+        Loads the decoded contents of a JSON file.
+
+        Parameters:
+            item: A json object, or a list of them.
+            directory: The db table to load the objects into.
+            json_item: Name of the JSON file.
 
         """
-        for json_item in os.listdir(os.path.join(self.path, directory)):
+        if type(item) is list:
+            for sub in item:
+                self.load_dict(sub, directory, json_item)
+        else:
+            self.load_dict(item, directory, json_item)
 
-            # Only load .json files.
-            if not json_item.endswith(".json"):
-                continue
+    def materialize(self, table: str, slug: str) -> None:
+        """
+        Make sure the record of a slug is loaded, when in lazy mode.
 
-            # Load our json as a dictionary.
-            with open(os.path.join(self.path, directory, json_item)) as fp:
-                try:
-                    item = json.load(fp)
-                except ValueError:
-                    logger.error("invalid JSON " + json_item)
-                    raise
+        The file known to define the slug is parsed first.  Records are
+        expected in a file named after their slug, so that file is tried
+        when the slug was never seen.  Only when it does not define the slug
+        are the remaining files of the table parsed.
 
-            if type(item) is list:
-                for sub in item:
-                    self.load_dict(sub, directory)
-            else:
-                self.load_dict(item, directory)
+        Parameters:
+            table: The db table to look in.
+            slug: The slug of the record.
 
-    def load_dict(self, item: Mapping[str, Any], table: str) -> None:
+        """
+        if not self.lazy or slug in self.database[table]:
+            return
+
+        if table in self.pending_tables:
+            self.pending_tables.discard(table)
+            self.pending_files[table] = set(self.list_json(table))
+
+        pending = self.pending_files.get(table)
+        if not pending:
+            return
+
+        json_item = self.slug_files[table].get(slug, slug + ".json")
+        if json_item in pending:
+            self.load_file(table, json_item)
+            if slug in self.database[table]:
+                return
+
+        logger.debug("slug %s not indexed, loading table %s", slug, table)
+        self.materialize_table(table)
+
+    def materialize_table(self, table: str) -> None:
+        """
+        Make sure every record of a table is loaded, when in lazy mode.
+
+        Parameters:
+            table: The db table to load.
+
+        """
+        if not self.lazy:
+            return
+
+        if table in self.pending_tables:
+            self.pending_tables.discard(table)
+            self.pending_files[table] = set(self.list_json(table))
+
+        for json_item in sorted(self.pending_files.get(table, ())):
+            self.load_file(table, json_item)
+
+    def load_dict(
+        self,
+        item: Mapping[str, Any],
+        table: str,
+        json_item: Optional[str] = None,
+    ) -> None:
         """
         Loads a single json object and adds it to the appropriate db table.
 
         Parameters:
             item: The json object to load in.
             table: The db table to load the object into.
+            json_item: Name of the JSON file defining the object, if any.
 
         """
 
         if item["slug"] not in self.database[table]:
-            self.database[table][item["slug"]] = item
+            if json_item is not None:
+                self.slug_files[table][item["slug"]] = json_item
+            self.indexes.pop(table, None)
+            self.database[table][item["slug"]] = set_defaults(item, table)
         else:
             logger.warning("Error: Item with slug %s was already loaded.", item)
 
@@ -365,10 +730,11 @@ class JSONDatabase:
                 "item", "npc", or "technique".
 
         Returns:
-            A dictionary from the resulting lookup.
+            The read-only record from the resulting lookup.
 
         """
-        return set_defaults(self.database[table][slug], table)
+        self.materialize(table, slug)
+        return self.database[table][slug]
 
     def lookup_file(self, table: str, slug: str) -> str:
         """
@@ -386,29 +752,336 @@ class JSONDatabase:
 
         """
 
+        self.materialize(table, slug)
         filename = self.database[table][slug]["file"] or slug
         if filename == slug:
             logger.debug(f"Could not find a file record for slug {slug}, did you remember to create a database record?")
 
         return filename
 
+    def index(self, table: str, name: str) -> Mapping[str, Any]:
+        """
+        Get a secondary index of a table, building it if needed.
 
-def set_defaults(results: Dict[str, Any], table: str) -> Mapping[str, Any]:
+        Parameters:
+            table: The db table the index is built over.
+            name: Name of the index, a key of ``INDEX_BUILDERS[table]``.
+
+        Returns:
+            The index.
+
+        """
+        table_indexes = self.indexes.setdefault(table, {})
+        index = table_indexes.get(name)
+        if index is None:
+            self.materialize_table(table)
+            build = INDEX_BUILDERS[table][name]
+            index = build(self.database[table].values())
+            # Loading the table may have dropped the indexes.
+            self.indexes.setdefault(table, {})[name] = index
+        return index
+
+    def build_indexes(self, tables: Iterable[str]) -> None:
+        """
+        Build every secondary index of the given tables.
+
+        Parameters:
+            tables: Names of the db tables.
+
+        """
+        for table in tables:
+            for name in INDEX_BUILDERS.get(table, ()):
+                self.index(table, name)
+
+    def monsters_by_type(self, type_slug: str) -> Sequence[str]:
+        """
+        Get the slugs of the monsters having a type.
+
+        Parameters:
+            type_slug: The type, such as "water".
+
+        Returns:
+            Slugs of the matching monsters.
+
+        """
+        return self.index("monster", "type").get(type_slug.lower(), ())
+
+    def monsters_by_shape(self, shape: str) -> Sequence[str]:
+        """
+        Get the slugs of the monsters having a shape.
+
+        Parameters:
+            shape: The shape, such as "aquatic".
+
+        Returns:
+            Slugs of the matching monsters.
+
+        """
+        return self.index("monster", "shape").get(shape.lower(), ())
+
+    def techniques_by_type(self, type_slug: str) -> Sequence[str]:
+        """
+        Get the slugs of the techniques having a type.
+
+        Parameters:
+            type_slug: The type, such as "water".
+
+        Returns:
+            Slugs of the matching techniques.
+
+        """
+        return self.index("technique", "type").get(type_slug.lower(), ())
+
+    def evolution_sources(self, monster_slug: str) -> Sequence[str]:
+        """
+        Get the slugs of the monsters evolving into a monster.
+
+        Parameters:
+            monster_slug: The slug of the evolved monster.
+
+        Returns:
+            Slugs of the monsters that can evolve into it.
+
+        """
+        return self.index("monster", "evolution_source").get(monster_slug, ())
+
+    def learnset(
+        self,
+        monster_slug: str,
+        min_level: int = 0,
+        max_level: Optional[int] = None,
+    ) -> Sequence[JSONMonsterMovesetItem]:
+        """
+        Get the techniques a monster learns within a range of levels.
+
+        Parameters:
+            monster_slug: The slug of the monster.
+            min_level: Lowest level, inclusive.
+            max_level: Highest level, inclusive.  ``None`` for no limit.
+
+        Returns:
+            The moveset items, ordered by level.
+
+        """
+        learnsets = self.indexes.get("monster", {}).get("learnset")
+        if learnsets is not None and monster_slug in learnsets:
+            entry = learnsets[monster_slug]
+        else:
+            entry = self.learnsets.get(monster_slug)
+            if entry is None:
+                # Only this monster is needed, don't load the whole table.
+                record = self.lookup(monster_slug, table="monster")
+                entry = learnset_entry(record)
+                self.learnsets[monster_slug] = entry
+
+        levels, moves = entry
+        start = bisect_left(levels, min_level)
+        if max_level is None:
+            return moves[start:]
+        return moves[start:bisect_right(levels, max_level)]
+
+
+def read_json(path: str) -> Any:
+    """
+    Read and decode a JSON file.
+
+    This is a module level function so it can run in worker processes.
+
+    Parameters:
+        path: Path of the file.
+
+    Returns:
+        The decoded contents.
+
+    """
+    with open(path) as fp:
+        try:
+            return json.load(fp)
+        except ValueError:
+            logger.error("invalid JSON " + os.path.basename(path))
+            raise
+
+
+def make_executor(workers: int, use_processes: bool) -> Optional[Executor]:
+    """
+    Create the pool used to parse JSON files in parallel.
+
+    Parameters:
+        workers: Number of workers, or 0 to parse serially.
+        use_processes: Whether the workers are processes instead of threads.
+
+    Returns:
+        The pool, or ``None`` when parsing serially.
+
+    """
+    if workers <= 0:
+        return None
+    if use_processes:
+        return ProcessPoolExecutor(max_workers=workers)
+    return ThreadPoolExecutor(max_workers=workers)
+
+
+def index_by_type(records: Iterable[Mapping[str, Any]]) -> Mapping[str, Any]:
+    """Index record slugs by each of their types."""
+    index = defaultdict(list)
+    for record in records:
+        for type_slug in record.get("types") or ():
+            index[type_slug.lower()].append(record["slug"])
+    return {key: tuple(value) for key, value in index.items()}
+
+
+def index_by_shape(records: Iterable[Mapping[str, Any]]) -> Mapping[str, Any]:
+    """Index record slugs by their shape."""
+    index = defaultdict(list)
+    for record in records:
+        index[record["shape"]].append(record["slug"])
+    return {key: tuple(value) for key, value in index.items()}
+
+
+def index_evolution_sources(
+    records: Iterable[Mapping[str, Any]],
+) -> Mapping[str, Any]:
+    """Index monster slugs by the slugs of the monsters they evolve into."""
+    index = defaultdict(list)
+    for record in records:
+        for evolution in record.get("evolutions") or ():
+            sources = index[evolution["monster_slug"]]
+            if record["slug"] not in sources:
+                sources.append(record["slug"])
+    return {key: tuple(value) for key, value in index.items()}
+
+
+def learnset_entry(
+    record: Mapping[str, Any],
+) -> Tuple[Tuple[int, ...], Tuple[Any, ...]]:
+    """Sort the moveset of a monster by level, for range queries."""
+    moves = sorted(
+        record.get("moveset") or (),
+        key=itemgetter("level_learned"),
+    )
+    levels = tuple(move["level_learned"] for move in moves)
+    return levels, tuple(moves)
+
+
+def index_learnset(records: Iterable[Mapping[str, Any]]) -> Mapping[str, Any]:
+    """Index monster movesets, sorted by level, by monster slug."""
+    return {record["slug"]: learnset_entry(record) for record in records}
+
+
+# Secondary indexes that can be built, by table and index name.
+INDEX_BUILDERS: Mapping[
+    str,
+    Mapping[str, Callable[[Iterable[Mapping[str, Any]]], Mapping[str, Any]]],
+] = {
+    "monster": {
+        "type": index_by_type,
+        "shape": index_by_shape,
+        "evolution_source": index_evolution_sources,
+        "learnset": index_learnset,
+    },
+    "technique": {
+        "type": index_by_type,
+    },
+}
+
+
+def file_signature(
+    path: str,
+    known: Optional[FileSignature] = None,
+) -> FileSignature:
+    """
+    Compute the signature of a file.
+
+    The file is only hashed again when its size or modification time
+    differ from the known signature.
+
+    Parameters:
+        path: Path of the file.
+        known: Previously computed signature of the file, if any.
+
+    Returns:
+        Modification time, size and SHA-1 digest of the file.
+
+    """
+    stat = os.stat(path)
+    if known is not None and known[:2] == (stat.st_mtime_ns, stat.st_size):
+        return known
+
+    with open(path, "rb") as fp:
+        digest = hashlib.sha1(fp.read()).hexdigest()
+    return (stat.st_mtime_ns, stat.st_size, digest)
+
+
+def strip_mtimes(
+    signatures: Mapping[str, FileSignature],
+) -> Dict[str, Tuple[int, str]]:
+    """
+    Drop modification times from file signatures.
+
+    Touching a file without changing its contents must not invalidate a
+    snapshot, so only sizes and digests are compared.
+
+    Parameters:
+        signatures: File signatures, by file name.
+
+    Returns:
+        Sizes and digests, by file name.
+
+    """
+    return {
+        name: (size, digest)
+        for name, (mtime, size, digest) in signatures.items()
+    }
+
+
+def set_defaults(item: Mapping[str, Any], table: str) -> Record:
+    """
+    Build the record stored in the database for a JSON object.
+
+    Defaults and derived fields are applied here once, at load time, so
+    lookups can return the stored record without any further work.
+
+    Parameters:
+        item: The json object to load in.
+        table: The db table the object belongs to.
+
+    Returns:
+        The frozen record.
+
+    """
+    if isinstance(item, Record):
+        return item
+
+    results = dict(item)
     if table == "monster":
         name = results["slug"]
 
-        sprites = results.setdefault("sprites", {})
-
+        sprites = dict(results.get("sprites", {}))
         for key, view in (
             ("battle1", "front"),
             ("battle2", "back"),
             ("menu1", "menu01"),
             ("menu2", "menu02"),
         ):
-            if not results.get(key):
+            if not sprites.get(key):
                 sprites[key] = f"gfx/sprites/battle/{name}-{view}"
+        results["sprites"] = sprites
+
+        results["shape"] = results.get("shape", "landrace").lower()
+        results.setdefault(
+            "catch_rate",
+            prepare.CONFIG.default_monster_catch_rate,
+        )
+        results.setdefault(
+            "upper_catch_resistance",
+            prepare.CONFIG.default_upper_monster_catch_resistance,
+        )
+        results.setdefault(
+            "lower_catch_resistance",
+            prepare.CONFIG.default_lower_monster_catch_resistance,
+        )
 
-    return results
+    return Record(results)
 
 
 # Global database container
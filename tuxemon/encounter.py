@@ -0,0 +1,206 @@
+#
+# Tuxemon
+# Copyright (C) 2014, William Edwards <shadowapex@gmail.com>,
+#                     Benjamin Bean <superman2k5@gmail.com>
+#
+# This file is part of Tuxemon.
+#
+# Tuxemon is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tuxemon is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tuxemon.  If not, see <http://www.gnu.org/licenses/>.
+#
+#
+# encounter Random encounter rolls.
+#
+#
+
+from __future__ import annotations
+import logging
+import random
+from bisect import bisect_left
+from itertools import accumulate
+from typing import Dict, List, Optional, Sequence
+
+from tuxemon import prepare
+from tuxemon.db import JSONEncounterItem, db
+
+logger = logging.getLogger(__name__)
+
+
+class EncounterDistribution:
+    """
+    Cumulative distribution of the encounter rates of an encounter table.
+
+    An encounter rate is the chance, out of 100, that walking on a tile
+    starts a battle with that monster.  A roll is a number between 0 and
+    100, and picks the first encounter whose cumulative rate reaches it.
+    Rolls past the sum of the rates don't start any battle.
+
+    Parameters:
+        encounters: Encounters of the table, in database order.
+
+    """
+
+    __slots__ = ("encounters", "cumulative", "total")
+
+    def __init__(self, encounters: Sequence[JSONEncounterItem]) -> None:
+        self.encounters = encounters
+        self.cumulative = list(
+            accumulate(encounter["encounter_rate"] for encounter in encounters)
+        )
+        self.total = self.cumulative[-1] if self.cumulative else 0.0
+
+    def get_scale(self, total_prob: Optional[float]) -> float:
+        """
+        Get the factor applied to the encounter rates.
+
+        Parameters:
+            total_prob: Optional override which scales the rates so that
+                their sum is equal to it.
+
+        Returns:
+            The scale of the rates, including the configured modifier.
+
+        """
+        if total_prob is not None and self.total:
+            scale = float(total_prob) / self.total
+        else:
+            scale = 1.0
+
+        return scale * prepare.CONFIG.encounter_rate_modifier
+
+    def choose(
+        self,
+        total_prob: Optional[float] = None,
+        roll: Optional[float] = None,
+    ) -> Optional[JSONEncounterItem]:
+        """
+        Roll for an encounter.
+
+        Parameters:
+            total_prob: Optional override which scales the rates so that
+                their sum is equal to it.
+            roll: Number between 0 and 100.  A random one if ``None``.
+
+        Returns:
+            The encounter, or ``None`` if no battle should start.
+
+        """
+        if roll is None:
+            roll = random.random() * 100
+
+        scale = self.get_scale(total_prob)
+        if not scale:
+            return None
+
+        index = bisect_left(self.cumulative, roll / scale)
+        if index < len(self.encounters):
+            return self.encounters[index]
+
+        return None
+
+    def sample(
+        self,
+        amount: int,
+        total_prob: Optional[float] = None,
+    ) -> List[Optional[JSONEncounterItem]]:
+        """
+        Roll for many encounters at once.
+
+        Parameters:
+            amount: Number of rolls.
+            total_prob: Optional override which scales the rates so that
+                their sum is equal to it.
+
+        Returns:
+            The result of each roll, ``None`` when no battle should start.
+
+        """
+        scale = self.get_scale(total_prob)
+        if not scale or not self.encounters:
+            return [None] * amount
+
+        # Rates past 100 can never be rolled, and the remainder up to 100 is
+        # the chance of not starting a battle.
+        cum_weights = [min(i * scale, 100.0) for i in self.cumulative]
+        cum_weights.append(100.0)
+        population = list(self.encounters) + [None]
+        return random.choices(population, cum_weights=cum_weights, k=amount)
+
+
+# Distributions of the encounter tables rolled so far, by slug.
+_distributions: Dict[str, EncounterDistribution] = {}
+
+
+def get_distribution(slug: str) -> EncounterDistribution:
+    """
+    Get the distribution of an encounter table.
+
+    Distributions are computed once and reused until the table is reloaded.
+
+    Parameters:
+        slug: Slug of the encounter table.
+
+    Returns:
+        The distribution of the table.
+
+    """
+    encounters = db.lookup(slug, table="encounter")["monsters"]
+    distribution = _distributions.get(slug)
+    if distribution is None or distribution.encounters is not encounters:
+        distribution = EncounterDistribution(encounters)
+        _distributions[slug] = distribution
+
+    return distribution
+
+
+def choose_encounter(
+    slug: str,
+    total_prob: Optional[float] = None,
+) -> Optional[JSONEncounterItem]:
+    """
+    Roll for an encounter of an encounter table.
+
+    Parameters:
+        slug: Slug of the encounter table.
+        total_prob: Optional override which scales the rates so that their
+            sum is equal to it.
+
+    Returns:
+        The encounter, or ``None`` if no battle should start.
+
+    """
+    return get_distribution(slug).choose(total_prob)
+
+
+def sample_encounters(
+    slug: str,
+    amount: int,
+    total_prob: Optional[float] = None,
+) -> List[Optional[JSONEncounterItem]]:
+    """
+    Roll for many encounters of an encounter table at once.
+
+    This is meant for balancing tools, which need a large number of rolls
+    without going through the event engine.
+
+    Parameters:
+        slug: Slug of the encounter table.
+        amount: Number of rolls.
+        total_prob: Optional override which scales the rates so that their
+            sum is equal to it.
+
+    Returns:
+        The result of each roll, ``None`` when no battle should start.
+
+    """
+    return get_distribution(slug).sample(amount, total_prob)
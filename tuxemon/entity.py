@@ -27,7 +27,8 @@ from __future__ import annotations
 from tuxemon.math import Vector3, Point3
 from tuxemon.map import proj
 from typing import Sequence, Mapping, TYPE_CHECKING, Any, TypeVar,\
-    Generic
+    Generic, Tuple, Hashable
+from tuxemon.event.changes import npc_key
 from tuxemon.session import Session
 from tuxemon.tools import vector2_to_tile_pos
 
@@ -59,14 +60,31 @@ class Entity(Generic[SaveDict]):
     ) -> None:
         self.slug = slug
         self.world = world
+        self._tile_pos = (0, 0)
         world.add_entity(self)
         self.instance_id = None
-        self.tile_pos = (0, 0)
         self.position3 = Point3(0, 0, 0)
         self.acceleration3 = Vector3(0, 0, 0)  # not used currently
         self.velocity3 = Vector3(0, 0, 0)
         self.update_location = False
 
+    @property
+    def tile_pos(self) -> Tuple[int, int]:
+        """Position of the tile the entity is on."""
+        return self._tile_pos
+
+    @tile_pos.setter
+    def tile_pos(self, tile_pos: Tuple[int, int]) -> None:
+        moved = tile_pos != self._tile_pos
+        self._tile_pos = tile_pos
+        self.world.collision_grid.move_entity(self, tile_pos)
+        if moved:
+            self.world.notify_change(*self.get_position_keys())
+
+    def get_position_keys(self) -> Tuple[Hashable, ...]:
+        """Keys of the changes to report when the entity changes tile."""
+        return (npc_key(self.slug),)
+
     # === PHYSICS START =======================================================
     def stop_moving(self) -> None:
         """
@@ -45,6 +45,8 @@ class MapCondition(NamedTuple):
     height: int
     operator: str
     name: str
+    # Number of the condition in its map, given when the map is loaded.
+    id: Optional[int] = None
 
 
 class MapAction(NamedTuple):
@@ -56,5 +56,5 @@ class PathfindAction(EventAction[PathfindActionParameters]):
         self.npc.pathfind((self.parameters.tile_pos_x, self.parameters.tile_pos_y))
 
     def update(self) -> None:
-        if not self.npc.moving and not self.npc.path:
+        if not self.npc.moving and not self.npc.path and not self.npc.pathfind_pending:
             self.stop()
@@ -23,12 +23,13 @@ from __future__ import annotations
 import logging
 import random
 
-from tuxemon import ai, monster, prepare
+from tuxemon import ai, monster
 from tuxemon.combat import check_battle_legal
 from tuxemon.db import db, JSONEncounterItem
+from tuxemon.encounter import choose_encounter
 from tuxemon.event.eventaction import EventAction
 from tuxemon.npc import NPC
-from typing import NamedTuple, Union, final, Sequence, Optional
+from typing import NamedTuple, Union, final
 from tuxemon.states.world.worldstate import WorldState
 from tuxemon.states.combat.combat import CombatState
 from tuxemon.states.transition.flash import FlashTransition
@@ -77,8 +78,7 @@ class RandomEncounterAction(EventAction[RandomEncounterActionParameters]):
             return
 
         slug = self.parameters.encounter_slug
-        encounters = db.lookup(slug, table="encounter")["monsters"]
-        encounter = _choose_encounter(encounters, self.parameters.total_prob)
+        encounter = choose_encounter(slug, self.parameters.total_prob)
 
         # If a random encounter was successfully rolled, look up the monster
         # and start the battle.
@@ -133,30 +133,6 @@ class RandomEncounterAction(EventAction[RandomEncounterActionParameters]):
         if self.world:
             self.world.remove_entity("random_encounter_dummy")
 
-def _choose_encounter(
-    encounters: Sequence[JSONEncounterItem],
-    total_prob: Optional[float],
-) -> Optional[JSONEncounterItem]:
-    total = 0.0
-    roll = random.random() * 100
-    if total_prob is not None:
-        current_total = sum(
-            encounter["encounter_rate"] for encounter in encounters
-        )
-        scale = float(total_prob) / current_total
-    else:
-        scale = 1
-
-    scale *= prepare.CONFIG.encounter_rate_modifier
-
-    for encounter in encounters:
-        total += encounter["encounter_rate"] * scale
-        if total >= roll:
-            return encounter
-
-    return None
-
-
 def _create_monster_npc(
     encounter: JSONEncounterItem,
     world: WorldState,
@@ -0,0 +1,161 @@
+#
+# Tuxemon
+# Copyright (C) 2014, William Edwards <shadowapex@gmail.com>,
+#                     Benjamin Bean <superman2k5@gmail.com>
+#
+# This file is part of Tuxemon.
+#
+# Tuxemon is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tuxemon is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tuxemon.  If not, see <http://www.gnu.org/licenses/>.
+#
+#
+# changes Changes of the game state read by event conditions.
+#
+#
+
+
+from __future__ import annotations
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Optional,
+    Tuple,
+)
+
+# Party of any NPC, when monsters are added or removed.
+PARTY = "party"
+
+
+def variable_key(name: str) -> Tuple[str, str]:
+    """Get the key of a game variable of the player."""
+    return ("variable", name)
+
+
+def npc_key(slug: str) -> Tuple[str, str]:
+    """Get the key of the presence and tile position of an NPC."""
+    return ("npc", slug)
+
+
+class ChangeLog:
+    """
+    Record when the inputs of the event conditions last changed.
+
+    Every change is numbered, so a reader can remember the number of the
+    last change it saw, and later ask if any of its inputs changed since.
+
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        # Number of the last change, by key.
+        self.changed_at: Dict[Hashable, int] = {}
+        # Number of the last change of everything.
+        self.cleared_at = 0
+
+    def notify(self, *keys: Hashable) -> None:
+        """
+        Record a change.
+
+        Parameters:
+            keys: Keys of the inputs which changed.
+
+        """
+        self.count += 1
+        for key in keys:
+            self.changed_at[key] = self.count
+
+    def notify_all(self) -> None:
+        """Record that any input may have changed."""
+        self.count += 1
+        self.cleared_at = self.count
+
+    def changed_since(self, keys: Iterable[Hashable], count: int) -> bool:
+        """
+        Check if some inputs changed after a change.
+
+        Parameters:
+            keys: Keys of the inputs.
+            count: Number of the change.
+
+        Returns:
+            Whether any of the inputs changed later.
+
+        """
+        if self.cleared_at > count:
+            return True
+        changed_at = self.changed_at
+        for key in keys:
+            if changed_at.get(key, 0) > count:
+                return True
+        return False
+
+
+class GameVariables(Dict[str, Any]):
+    """
+    Dictionary of game variables, which reports the names that change.
+
+    Parameters:
+        data: Initial variables.
+        on_change: Function called with the name of a changed variable.
+
+    """
+
+    def __init__(
+        self,
+        data: Any = (),
+        on_change: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        super().__init__(data)
+        self.on_change = on_change
+
+    def changed(self, key: str) -> None:
+        if self.on_change is not None:
+            self.on_change(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        super().__setitem__(key, value)
+        self.changed(key)
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self.changed(key)
+
+    def pop(self, key: str, *default: Any) -> Any:
+        exists = key in self
+        value = super().pop(key, *default)
+        if exists:
+            self.changed(key)
+        return value
+
+    def popitem(self) -> Tuple[str, Any]:
+        key, value = super().popitem()
+        self.changed(key)
+        return key, value
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self) -> None:
+        keys = list(self)
+        super().clear()
+        for key in keys:
+            self.changed(key)
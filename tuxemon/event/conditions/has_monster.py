@@ -22,6 +22,7 @@ from __future__ import annotations
 from tuxemon.event.eventcondition import EventCondition
 from tuxemon.session import Session
 from tuxemon.event import MapCondition
+from tuxemon.event.changes import PARTY
 
 
 class HasMonsterCondition(EventCondition):
@@ -39,6 +40,7 @@ class HasMonsterCondition(EventCondition):
     """
 
     name = "has_monster"
+    depends = frozenset({PARTY})
 
     def test(self, session: Session, condition: MapCondition) -> bool:
         """
@@ -22,6 +22,8 @@ from __future__ import annotations
 from tuxemon.event import get_npc, MapCondition
 from tuxemon.event.eventcondition import EventCondition
 from tuxemon.session import Session
+from tuxemon.event.changes import npc_key
+from typing import AbstractSet, Hashable
 
 
 class NPCAtCondition(EventCondition):
@@ -40,6 +42,12 @@ class NPCAtCondition(EventCondition):
 
     name = "npc_at"
 
+    def get_dependencies(
+        self,
+        condition: MapCondition,
+    ) -> AbstractSet[Hashable]:
+        return {npc_key(condition.parameters[0])}
+
     def test(self, session: Session, condition: MapCondition) -> bool:
         """
         Check to see if a character is at the condition position on the map.
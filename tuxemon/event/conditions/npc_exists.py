@@ -23,6 +23,8 @@ from tuxemon.event import get_npc, MapCondition
 from tuxemon.event.eventcondition import EventCondition
 from tuxemon.states.world.worldstate import WorldState
 from tuxemon.session import Session
+from tuxemon.event.changes import npc_key
+from typing import AbstractSet, Hashable
 
 
 class NPCExistsCondition(EventCondition):
@@ -41,6 +43,12 @@ class NPCExistsCondition(EventCondition):
 
     name = "npc_exists"
 
+    def get_dependencies(
+        self,
+        condition: MapCondition,
+    ) -> AbstractSet[Hashable]:
+        return {npc_key(condition.parameters[0])}
+
     def test(self, session: Session, condition: MapCondition) -> bool:
         """
         Check to see if a particular character exists.
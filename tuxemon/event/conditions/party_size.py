@@ -24,6 +24,7 @@ import logging
 from tuxemon.event.eventcondition import EventCondition
 from tuxemon.session import Session
 from tuxemon.event import MapCondition
+from tuxemon.event.changes import PARTY
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +45,7 @@ class PartySizeCondition(EventCondition):
     """
 
     name = "party_size"
+    depends = frozenset({PARTY})
 
     def test(self, session: Session, condition: MapCondition) -> bool:
         """
@@ -22,6 +22,7 @@ from __future__ import annotations
 from tuxemon.event.eventcondition import EventCondition
 from tuxemon.session import Session
 from tuxemon.event import MapCondition
+from tuxemon.event.changes import npc_key
 
 
 class PlayerAtCondition(EventCondition):
@@ -36,6 +37,8 @@ class PlayerAtCondition(EventCondition):
     """
 
     name = "player_at"
+    area = True
+    depends = frozenset({npc_key("player")})
 
     def test(self, session: Session, condition: MapCondition) -> bool:
         """
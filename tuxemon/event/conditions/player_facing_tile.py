@@ -40,6 +40,7 @@ class PlayerFacingTileCondition(EventCondition):
     """
 
     name = "player_facing_tile"
+    area = True
 
     def test(self, session: Session, condition: MapCondition) -> bool:
         """
@@ -22,11 +22,53 @@ from __future__ import annotations
 from tuxemon.event.eventcondition import EventCondition
 from tuxemon.session import Session
 from tuxemon.event import MapCondition
-from tuxemon.npc import NPC
-from typing import Tuple
+from typing import Any, Dict, Hashable, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from tuxemon.npc import NPC
 
 
 # TODO: move to some other place?
+def get_condition_key(
+    condition: MapCondition,
+    persist: Dict[Hashable, Any],
+) -> Hashable:
+    """
+    Get the key of the state of a condition, migrating older keys.
+
+    Conditions loaded from a map are numbered, and their number is the key.
+    The state used to be keyed by the text of the condition, so such a key
+    is moved to the number the first time the condition is tested.
+
+    Parameters:
+        condition: The map condition object.
+        persist: State of the conditions.
+
+    Returns:
+        The key of the condition.
+
+    """
+    if condition.id is None:
+        return get_legacy_key(condition)
+
+    key = condition.id
+    if key not in persist:
+        legacy_key = get_legacy_key(condition)
+        if legacy_key in persist:
+            persist[key] = persist.pop(legacy_key)
+    return key
+
+
+def get_legacy_key(condition: MapCondition) -> str:
+    """Get the text of a condition, as formatted before it had a number."""
+    values = ", ".join(
+        f"{field}={value!r}"
+        for field, value in zip(condition._fields, condition)
+        if field != "id"
+    )
+    return f"{type(condition).__name__}({values})"
+
+
 def collide(condition: MapCondition, tile_position: Tuple[int, int]) -> bool:
     """
     Check collision of a tile position with the map condition position.
@@ -69,6 +111,7 @@ class PlayerMovedCondition(EventCondition):
     """
 
     name = "player_moved"
+    area = True
 
     def test(self, session: Session, condition: MapCondition) -> bool:
         """
@@ -85,6 +128,18 @@ class PlayerMovedCondition(EventCondition):
         # TODO: Eventually generalize command for checking players and npcs
         return self.generic_test(session, condition, session.player)
 
+    def reset(self, session: Session, condition: MapCondition) -> None:
+        """
+        Forget the last destination recorded for this condition.
+
+        Parameters:
+            session: The session object
+            condition: The map condition object.
+
+        """
+        persist = self.get_persist(session)
+        persist.pop(get_condition_key(condition, persist), None)
+
     def generic_test(
         self,
         session: Session,
@@ -106,22 +161,22 @@ class PlayerMovedCondition(EventCondition):
         # check where the npc is going, not where it is
         move_destination = npc.move_destination
 
+        # persist is data shared for all player_moved EventConditions
+        persist = self.get_persist(session)
+
         # a hash/id of sorts for the condition
-        condition_str = str(condition)
+        condition_key = get_condition_key(condition, persist)
 
         stopped = move_destination is None
         collide_next = False
         if move_destination is not None:
             collide_next = collide(condition, move_destination)
 
-        # persist is data shared for all player_moved EventConditions
-        persist = self.get_persist(session)
-
         # only test if tile was moved into
         # get previous destination for this particular condition
-        last_destination = persist.get(condition_str)
+        last_destination = persist.get(condition_key)
         if last_destination is None and (stopped or collide_next):
-            persist[condition_str] = move_destination
+            persist[condition_key] = move_destination
 
         # has the npc moved onto or away from the event?
         # Check to see if the npc's "move destination" has changed since the
@@ -134,10 +189,10 @@ class PlayerMovedCondition(EventCondition):
         # Update the current npc's last move destination
         # TODO: some sort of global tracking of player instead of recording it
         # in conditions
-        persist[condition_str] = move_destination
+        persist[condition_key] = move_destination
 
         # determine if the tile has truly changed
         if collided and moved and last_destination is not None:
-            persist[condition_str] = None
+            persist[condition_key] = None
             return True
         return False
@@ -38,6 +38,7 @@ class ToUseTileCondition(EventCondition):
     """
 
     name = "to_use_tile"
+    area = True
 
     def test(self, session: Session, condition: MapCondition) -> bool:
         """
@@ -25,6 +25,8 @@ from tuxemon.event.eventcondition import EventCondition
 from tuxemon.tools import number_or_variable
 from tuxemon.session import Session
 from tuxemon.event import MapCondition
+from tuxemon.event.changes import variable_key
+from typing import AbstractSet, Hashable
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +49,17 @@ class VariableIsCondition(EventCondition):
 
     name = "variable_is"
 
+    def get_dependencies(
+        self,
+        condition: MapCondition,
+    ) -> AbstractSet[Hashable]:
+        operands = condition.parameters[0], condition.parameters[2]
+        return {
+            variable_key(operand)
+            for operand in operands
+            if not operand.isdigit()
+        }
+
     def test(self, session: Session, condition: MapCondition) -> bool:
         """
         Check an operation over a variable.
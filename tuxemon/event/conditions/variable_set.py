@@ -22,7 +22,8 @@ from __future__ import annotations
 from tuxemon.event.eventcondition import EventCondition
 from tuxemon.session import Session
 from tuxemon.event import MapCondition
-from typing import Optional
+from tuxemon.event.changes import variable_key
+from typing import AbstractSet, Hashable, Optional
 
 
 class VariableSetCondition(EventCondition):
@@ -44,6 +45,12 @@ class VariableSetCondition(EventCondition):
 
     name = "variable_set"
 
+    def get_dependencies(
+        self,
+        condition: MapCondition,
+    ) -> AbstractSet[Hashable]:
+        return {variable_key(condition.parameters[0].split(":")[0])}
+
     def test(self, session: Session, condition: MapCondition) -> bool:
         """
         Check to see if a player game variable has a particular value.
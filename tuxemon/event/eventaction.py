@@ -100,6 +100,8 @@ class EventAction(ABC, Generic[ParameterClass]):
     Parameters:
         session: Object containing the session information.
         parameters: Parameters of the action.
+        parsed_parameters: Result of ``parse_parameters`` for the
+            parameters, if already known.
 
     """
 
@@ -110,6 +112,7 @@ class EventAction(ABC, Generic[ParameterClass]):
         self,
         session: Session,
         parameters: Sequence[Any],
+        parsed_parameters: Optional[Any] = None,
     ) -> None:
 
         self.session = session
@@ -118,25 +121,41 @@ class EventAction(ABC, Generic[ParameterClass]):
         self.raw_parameters = parameters
 
         # parse parameters
+        if parsed_parameters is None:
+            parsed_parameters = self.parse_parameters(parameters)
+        self.parameters = parsed_parameters
+
+        self._done = False
+
+    @classmethod
+    def parse_parameters(cls, parameters: Sequence[Any]) -> Optional[Any]:
+        """
+        Cast the parameters of the map to the types of ``param_class``.
+
+        Parameters:
+            parameters: Parameters of the action.
+
+        Returns:
+            The parsed parameters, or ``None`` if they are not valid.
+
+        """
         try:
-            if self.param_class._fields:
+            if cls.param_class._fields:
 
                 # cast the parameters to the correct type, as defined in cls.valid_parameters
-                self.parameters = cast_parameters_to_namedtuple(
+                return cast_parameters_to_namedtuple(
                     parameters,
-                    self.param_class,
+                    cls.param_class,
                 )
             else:
-                self.parameters = parameters
+                return parameters
 
         except ValueError:
-            logger.warning(f"error while parsing for {self.name}")
+            logger.warning(f"error while parsing for {cls.name}")
             logger.warning(f"cannot parse parameters: {parameters}")
-            logger.warning(self.param_class)
+            logger.warning(cls.param_class)
             logger.warning("please check the parameters and verify they are correct")
-            self.parameters = None
-
-        self._done = False
+            return None
 
     def __enter__(self) -> None:
         """
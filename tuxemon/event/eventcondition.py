@@ -27,11 +27,20 @@
 from __future__ import annotations
 from tuxemon.session import Session
 from tuxemon.event import MapCondition
-from typing import Any, ClassVar, Dict
+from typing import AbstractSet, Any, ClassVar, Dict, Hashable, Optional
 
 
 class EventCondition:
     name: ClassVar[str] = "GenericCondition"
+    # Whether the condition can only be satisfied while the player is inside
+    # or next to the area of the condition.  Events with such a condition
+    # are not tested while the player is away.
+    area: ClassVar[bool] = False
+    # Keys of the inputs the condition reads, from tuxemon.event.changes.
+    # ``None`` means the condition may change at any time, so it is tested
+    # every frame.  Otherwise it is only tested again after a failure once
+    # one of these inputs changed.
+    depends: ClassVar[Optional[AbstractSet[Hashable]]] = None
 
     def __init__(self) -> None:
         pass
@@ -49,7 +58,39 @@ class EventCondition:
 
         """
 
-    def get_persist(self, session: Session) -> Dict[str, Any]:
+    def get_dependencies(
+        self,
+        condition: MapCondition,
+    ) -> Optional[AbstractSet[Hashable]]:
+        """
+        Get the keys of the inputs a condition reads.
+
+        Override this when the inputs depend on the parameters.
+
+        Parameters:
+            condition: Condition defined in the map.
+
+        Returns:
+            Keys of the inputs, or ``None`` if the condition must be tested
+            every frame.
+
+        """
+        return self.depends
+
+    def reset(self, session: Session, condition: MapCondition) -> None:
+        """
+        Forget the state kept about a condition.
+
+        Called for area conditions when the player goes away from their
+        area, as they stop being tested until the player comes back.
+
+        Parameters:
+            session: Object containing the session information.
+            condition: Condition defined in the map.
+
+        """
+
+    def get_persist(self, session: Session) -> Dict[Hashable, Any]:
         """
         Return dictionary for this event class's data.
 
@@ -65,7 +106,7 @@ class EventCondition:
         try:
             return session.client.event_persist[self.name]
         except KeyError:
-            persist: Dict[str, Any] = {}
+            persist: Dict[Hashable, Any] = {}
             session.client.event_persist[self.name] = persist
             return persist
 
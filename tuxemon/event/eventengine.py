@@ -35,19 +35,26 @@ from tuxemon import plugin
 from tuxemon import prepare
 from tuxemon.platform.const import buttons
 from typing import (
+    AbstractSet,
     Any,
     Dict,
     Generator,
+    Hashable,
     Iterable,
     List,
+    NamedTuple,
     Optional,
     Sequence,
+    Set,
     Tuple,
     Type,
     Union,
 )
+from tuxemon.event.changes import ChangeLog
 from tuxemon.event.eventcondition import EventCondition
 from tuxemon.event.eventaction import EventAction
+from tuxemon.event.eventindex import EventIndex
+from tuxemon.event.eventprofiler import EventProfiler
 from tuxemon.platform.events import PlayerInput
 from tuxemon.session import Session
 from tuxemon.map import TuxemonMap
@@ -55,6 +62,115 @@ from tuxemon.map import TuxemonMap
 logger = logging.getLogger(__name__)
 
 
+class CompiledCondition:
+    """
+    Condition of a map event, bound to the condition that tests it.
+
+    Parameters:
+        map_condition: Condition defined in the map.
+        condition: Shared instance of the condition, if it is loaded.
+
+    """
+
+    __slots__ = ("map_condition", "condition", "test", "expected", "depends")
+
+    def __init__(
+        self,
+        map_condition: MapCondition,
+        condition: Optional[EventCondition],
+    ) -> None:
+        self.map_condition = map_condition
+        self.condition = condition
+        self.test = None if condition is None else condition.test
+        self.expected = map_condition.operator == "is"
+        # A condition which isn't loaded never passes, so it doesn't need
+        # to be tested again.
+        self.depends: Optional[AbstractSet[Hashable]] = frozenset()
+        if condition is not None:
+            try:
+                self.depends = condition.get_dependencies(map_condition)
+            except (IndexError, ValueError):
+                # malformed, so test it every frame and let it fail there
+                self.depends = None
+
+    def check(self, session: Session) -> bool:
+        """
+        Check if the condition is met.
+
+        Parameters:
+            session: Object containing the session information.
+
+        Returns:
+            The value of the condition, or ``False`` if it is not loaded.
+
+        """
+        if self.test is None:
+            return False
+        return self.test(session, self.map_condition) == self.expected
+
+
+class CompiledAction:
+    """
+    Action of a map event, with its class and parameters resolved.
+
+    Actions keep state while running, so a new instance is still made for
+    every run, but the parameters are only parsed once when their values
+    can be shared.
+
+    Parameters:
+        map_action: Action defined in the map.
+        action_class: Class of the action, if it is loaded.
+
+    """
+
+    __slots__ = ("map_action", "action_class", "parameters")
+
+    def __init__(
+        self,
+        map_action: MapAction,
+        action_class: Optional[Type[EventAction[Any]]],
+    ) -> None:
+        self.map_action = map_action
+        self.action_class = action_class
+        self.parameters = None
+        if action_class is not None:
+            parameters = action_class.parse_parameters(map_action.parameters)
+            if is_immutable(parameters):
+                self.parameters = parameters
+
+    def create(self, session: Session) -> Optional[EventAction[Any]]:
+        """
+        Make a new instance of the action.
+
+        Parameters:
+            session: Object containing the session information.
+
+        Returns:
+            The action, or ``None`` if it is not loaded.
+
+        """
+        if self.action_class is None:
+            return None
+        return self.action_class(
+            session,
+            self.map_action.parameters,
+            self.parameters,
+        )
+
+
+class CompiledEvent(NamedTuple):
+    map_event: EventObject
+    conditions: Sequence[CompiledCondition]
+    actions: Sequence[CompiledAction]
+
+
+def is_immutable(value: Any) -> bool:
+    """Check if parsed parameters can be shared between action instances."""
+    if isinstance(value, tuple):
+        return all(is_immutable(item) for item in value)
+    return value is None or isinstance(value, (str, int, float))
+
+
 class RunningEvent:
     """
     Manage MapEvents that are used during gameplay.
@@ -74,29 +190,38 @@ class RunningEvent:
     Parameters:
         map_event: Event defined in the map containing the information
             about the actions.
+        actions: Compiled actions of the event.  The actions of the map
+            event are used if not given.
 
     """
 
     __slots__ = (
         "map_event",
+        "actions",
         "context",
         "action_index",
         "current_action",
         "current_map_action",
     )
 
-    def __init__(self, map_event: EventObject) -> None:
+    def __init__(
+        self,
+        map_event: EventObject,
+        actions: Optional[Sequence[CompiledAction]] = None,
+    ) -> None:
         self.map_event = map_event
+        self.actions = map_event.acts if actions is None else actions
         self.context: Dict[str, Any] = dict()
         self.action_index = 0
         self.current_action: Optional[EventAction[Any]] = None
         self.current_map_action = None
 
-    def get_next_action(self) -> Optional[MapAction]:
+    def get_next_action(self) -> Optional[Union[MapAction, CompiledAction]]:
         """
         Get the next action to execute, if any.
 
-        Returns MapActions, which are just data from the map, not live objects.
+        Returns MapActions or CompiledActions, which are just data from the
+        map, not live objects.
 
         ``None`` will be returned if the MapEvent is finished.
 
@@ -106,7 +231,7 @@ class RunningEvent:
         """
         # if None, then make a new one
         try:
-            action = self.map_event.acts[self.action_index]
+            action = self.actions[self.action_index]
 
         except IndexError:
             # reached end of list, remove event and move on
@@ -148,6 +273,21 @@ class EventEngine:
 
         # debug
         self.partial_events: List[Sequence[Tuple[bool, MapCondition]]] = list()
+        self.event_index: Optional[EventIndex] = None
+        # compiled events, by id of the map event
+        self.compiled_events: Dict[int, CompiledEvent] = {}
+        # shared instances of the conditions, by name
+        self.condition_instances: Dict[str, EventCondition] = {}
+        # changes of the inputs of the conditions
+        self.changes = ChangeLog()
+        # timings of the conditions, actions and events, when profiling
+        self.profiler: Optional[EventProfiler] = None
+        # events which failed on a condition, as the inputs of that
+        # condition and the number of the last change when it was tested,
+        # by id of the map event
+        self.waiting_events: Dict[int, Tuple[AbstractSet[Hashable], int]] = {}
+        # indexes of the area events which were near the player last frame
+        self.nearby_events: Set[int] = set()
 
         self.conditions = plugin.load_plugins(
             paths.CONDITIONS_PATH,
@@ -167,12 +307,59 @@ class EventEngine:
 
     def reset(self) -> None:
         """Clear out running events.  Use when changing maps."""
+        # the player leaves the areas of the conditions of the map, and
+        # their numbers will be reused by the next map.  The events are
+        # read from the map, as not all of them may be compiled.
+        previous_map = self.current_map
+        if previous_map is not None:
+            for events in (
+                previous_map.events,
+                previous_map.inits,
+                previous_map.interacts,
+            ):
+                self.reset_area_conditions(events)
+
         self.running_events = dict()
         self.current_map = None
+        self.event_index = None
+        self.compiled_events = {}
+        self.waiting_events = {}
+        self.nearby_events = set()
         self.timer = 0.0
         self.wait = 0.0
         self.button = None
 
+    def reset_area_conditions(self, events: Iterable[EventObject]) -> None:
+        """
+        Reset the area conditions of events, as if the player went away.
+
+        Parameters:
+            events: Events of the map.
+
+        """
+        for map_event in events:
+            for cond in map_event.conds:
+                condition_class = self.conditions.get(cond.type)
+                if condition_class is None or not condition_class.area:
+                    continue
+                condition = self.condition_instances.get(cond.type)
+                if condition is None:
+                    condition = condition_class()
+                condition.reset(self.session, cond)
+
+    def load_map(self, map_data: TuxemonMap) -> None:
+        """
+        Leave the current map, and compile the events of a new one.
+
+        Parameters:
+            map_data: The map to load.
+
+        """
+        self.reset()
+        self.current_map = map_data
+        for events in (map_data.events, map_data.inits, map_data.interacts):
+            self.compile_events(events)
+
     def get_action(
         self,
         name: str,
@@ -207,7 +394,7 @@ class EventEngine:
             return None
 
         else:
-            return action(self.session, parameters)
+            return self.instrument_action(action(self.session, parameters))
 
     def get_actions(self) -> List[Type[EventAction]]:
         """
@@ -251,6 +438,62 @@ class EventEngine:
         """
         return list(self.conditions.values())
 
+    def compile_events(self, events: Iterable[EventObject]) -> None:
+        """
+        Compile the events of a map ahead of time.
+
+        Parameters:
+            events: Events of the map.
+
+        """
+        for map_event in events:
+            self.compile_event(map_event)
+
+    def compile_event(self, map_event: EventObject) -> CompiledEvent:
+        """
+        Bind the conditions and actions of an event to their classes.
+
+        Compiled events are kept until the engine is reset, so checking an
+        event again doesn't create any object.
+
+        Parameters:
+            map_event: Event defined in the map.
+
+        Returns:
+            The compiled event.
+
+        """
+        compiled = self.compiled_events.get(id(map_event))
+        if compiled is not None and compiled.map_event is map_event:
+            return compiled
+
+        conditions = []
+        for cond_data in map_event.conds:
+            condition = self.condition_instances.get(cond_data.type)
+            if condition is None:
+                condition = self.get_condition(cond_data.type)
+                if condition is not None:
+                    self.condition_instances[cond_data.type] = condition
+            compiled_condition = CompiledCondition(cond_data, condition)
+            if self.profiler is not None and compiled_condition.test is not None:
+                compiled_condition.test = self.profiler.wrap(
+                    "condition",
+                    cond_data.type,
+                    compiled_condition.test,
+                )
+            conditions.append(compiled_condition)
+
+        actions = []
+        for act_data in map_event.acts:
+            action_class = self.actions.get(act_data.type)
+            if action_class is None:
+                logger.warning(f'Error: EventAction "{act_data.type}" not implemented')
+            actions.append(CompiledAction(act_data, action_class))
+
+        compiled = CompiledEvent(map_event, tuple(conditions), tuple(actions))
+        self.compiled_events[id(map_event)] = compiled
+        return compiled
+
     def check_condition(
         self,
         cond_data: MapCondition,
@@ -272,7 +515,10 @@ class EventEngine:
             logger.debug(f'map condition "{cond_data.type}" is not loaded')
             return False
 
-        result = map_condition.test(self.session, cond_data) == (cond_data.operator == "is")
+        test = map_condition.test
+        if self.profiler is not None:
+            test = self.profiler.wrap("condition", cond_data.type, test)
+        result = test(self.session, cond_data) == (cond_data.operator == "is")
         logger.debug(f'map condition "{map_condition.name}": {result} ({cond_data})')
         return result
 
@@ -317,7 +563,8 @@ class EventEngine:
             logger.debug(f"starting map event: {map_event}")
             logger.debug("Executing action list")
             logger.debug(map_event)
-            token = RunningEvent(map_event)
+            compiled = self.compile_event(map_event)
+            token = RunningEvent(map_event, compiled.actions)
             self.running_events[map_event.id] = token
 
     def process_map_event(self, map_event: EventObject) -> None:
@@ -332,26 +579,46 @@ class EventEngine:
         """
         # debugging mode is slower and will check all conditions
         if prepare.CONFIG.collision_map:
+            compiled = self.compile_event(map_event)
+            session = self.session
             # less optimal, debug
             started = 0
             conds = list()
-            for cond in map_event.conds:
+            for cond in compiled.conditions:
                 # TODO: wrap with add_error_context
-                if self.check_condition(cond):
-                    conds.append((True, cond))
+                if cond.check(session):
+                    conds.append((True, cond.map_condition))
                     started += 1
                 else:
-                    conds.append((False, cond))
+                    conds.append((False, cond.map_condition))
 
-            if started == len(map_event.conds):
+            if started == len(compiled.conditions):
                 self.start_event(map_event)
 
             self.partial_events.append(conds)
 
         else:
             # optimal, less debug
-            if all(self.check_condition(cond) for cond in map_event.conds):
-                self.start_event(map_event)
+            # events which failed stay false until the inputs of the failed
+            # condition change
+            key = id(map_event)
+            waiting = self.waiting_events.get(key)
+            if waiting is not None:
+                if not self.changes.changed_since(*waiting):
+                    return
+                del self.waiting_events[key]
+
+            compiled = self.compile_event(map_event)
+            session = self.session
+            for cond in compiled.conditions:
+                if not cond.check(session):
+                    if cond.depends is not None:
+                        self.waiting_events[key] = (
+                            cond.depends,
+                            self.changes.count,
+                        )
+                    return
+            self.start_event(map_event)
 
     def process_map_events(self, events: Iterable[EventObject]) -> None:
         """
@@ -363,8 +630,66 @@ class EventEngine:
             events: Iterable of events to process.
 
         """
+        profiler = self.profiler
+        if profiler is None:
+            for event in events:
+                self.process_map_event(event)
+            return
+
+        clock = profiler.clock
         for event in events:
+            start = clock()
             self.process_map_event(event)
+            name = event.name or f"event {event.id}"
+            profiler.record("event", name, clock() - start)
+
+    def set_profiler(self, profiler: Optional[EventProfiler]) -> None:
+        """
+        Start or stop profiling the conditions, actions and events.
+
+        Compiled events are dropped, so their conditions are compiled again
+        with or without timing.  Nothing is timed when not profiling.
+
+        Parameters:
+            profiler: Profiler recording the timings, or ``None`` to stop.
+
+        """
+        self.profiler = profiler
+        self.compiled_events = {}
+        self.waiting_events = {}
+
+    def instrument_action(
+        self,
+        action: EventAction[Any],
+    ) -> EventAction[Any]:
+        """
+        Time the steps of an action, when profiling.
+
+        Parameters:
+            action: New instance of the action.
+
+        Returns:
+            The same action.
+
+        """
+        profiler = self.profiler
+        if profiler is not None:
+            action.start = profiler.wrap(  # type: ignore[assignment]
+                "action.start",
+                action.name,
+                action.start,
+            )
+            action.update = profiler.wrap(  # type: ignore[assignment]
+                "action.update",
+                action.name,
+                action.update,
+            )
+            action.cleanup = profiler.wrap(  # type: ignore[assignment]
+                "action.cleanup",
+                action.name,
+                action.cleanup,
+            )
+        return action
 
     def update(self, dt: float) -> None:
         """
@@ -394,8 +719,63 @@ class EventEngine:
             self.process_map_events(self.session.client.inits)
             self.session.client.inits = list()
 
-        # process any other events
-        self.process_map_events(self.session.client.events)
+        # process any other events, skipping the ones which can only start
+        # in an area away from the player
+        events = self.session.client.events
+        event_index = self.get_event_index(events)
+        player = self.session.player
+        position = None if player is None else player.tile_pos
+        indexes = event_index.query(position)
+        self.leave_events(event_index, indexes)
+        self.process_map_events(events[index] for index in indexes)
+
+    def get_event_index(self, events: Sequence[EventObject]) -> EventIndex:
+        """
+        Get the spatial index of the events, building it if needed.
+
+        Parameters:
+            events: Events of the map.
+
+        Returns:
+            The index of the events.
+
+        """
+        if self.event_index is None or self.event_index.events is not events:
+            area_types = {
+                name
+                for name, condition in self.conditions.items()
+                if condition.area
+            }
+            self.event_index = EventIndex(events, area_types)
+            self.nearby_events = set()
+        return self.event_index
+
+    def leave_events(
+        self,
+        event_index: EventIndex,
+        indexes: Iterable[int],
+    ) -> None:
+        """
+        Reset the area conditions of the events the player went away from.
+
+        Parameters:
+            event_index: The index of the events.
+            indexes: Indexes of the events near the player.
+
+        """
+        nearby = {
+            index
+            for index in indexes
+            if event_index.area_conditions[index]
+        }
+        for index in self.nearby_events - nearby:
+            for cond in event_index.area_conditions[index]:
+                condition = self.condition_instances.get(cond.type)
+                if condition is None:
+                    condition = self.get_condition(cond.type)
+                if condition is not None:
+                    condition.reset(self.session, cond)
+        self.nearby_events = nearby
 
     def update_running_events(self, dt: float) -> None:
         """
@@ -439,10 +819,15 @@ class EventEngine:
 
                     else:
                         # got an action, so start it
-                        action = self.get_action(
-                            next_action.type,
-                            next_action.parameters,
-                        )
+                        if isinstance(next_action, CompiledAction):
+                            action = next_action.create(self.session)
+                            if action is not None:
+                                self.instrument_action(action)
+                        else:
+                            action = self.get_action(
+                                next_action.type,
+                                next_action.parameters,
+                            )
 
                         if action is None:
                             # action was not loaded, so, break?  raise
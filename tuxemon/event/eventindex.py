@@ -0,0 +1,151 @@
+#
+# Tuxemon
+# Copyright (C) 2014, William Edwards <shadowapex@gmail.com>,
+#                     Benjamin Bean <superman2k5@gmail.com>
+#
+# This file is part of Tuxemon.
+#
+# Tuxemon is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tuxemon is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tuxemon.  If not, see <http://www.gnu.org/licenses/>.
+#
+#
+# eventindex Spatial index of the events of a map.
+#
+#
+
+
+from __future__ import annotations
+import logging
+from typing import (
+    AbstractSet,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from tuxemon.event import EventObject, MapCondition
+
+logger = logging.getLogger(__name__)
+
+# Side of the square groups of tiles the events are bucketed in.
+BUCKET_SIZE = 8
+
+
+class EventIndex:
+    """
+    Spatial index of the events of a map.
+
+    Events with an area condition can only start while the player is inside
+    or next to the area of that condition.  They are bucketed by the tiles
+    around their area, so only the ones near the player are tested.  Other
+    events are always returned.
+
+    Parameters:
+        events: Events of the map.
+        area_types: Names of the area conditions.
+
+    """
+
+    def __init__(
+        self,
+        events: Sequence[EventObject],
+        area_types: AbstractSet[str],
+    ) -> None:
+        self.events = events
+        # Tiles around the area of each event, as (left, top, right, bottom),
+        # by index.  ``None`` for the events which are always tested.
+        self.bounds: List[Optional[Tuple[int, int, int, int]]] = []
+        # Conditions of each event which depend on the area.
+        self.area_conditions: List[Sequence[MapCondition]] = []
+
+        always = []
+        buckets: Dict[Tuple[int, int], List[int]] = {}
+        for index, event in enumerate(events):
+            conditions = [
+                cond
+                for cond in event.conds
+                if cond.type in area_types and cond.operator == "is"
+            ]
+            bounds = get_bounds(conditions[0]) if conditions else None
+            self.bounds.append(bounds)
+            self.area_conditions.append(conditions if bounds else ())
+            if bounds is None:
+                always.append(index)
+                continue
+
+            left, top, right, bottom = bounds
+            for bucket_y in range(top // BUCKET_SIZE, bottom // BUCKET_SIZE + 1):
+                for bucket_x in range(left // BUCKET_SIZE, right // BUCKET_SIZE + 1):
+                    buckets.setdefault((bucket_x, bucket_y), []).append(index)
+
+        # Events keep their map order, so every bucket also holds the events
+        # which are always tested.
+        self.always = always
+        self.buckets = {
+            key: sorted(always + indexes)
+            for key, indexes in buckets.items()
+        }
+
+    def query(self, position: Optional[Tuple[float, float]]) -> List[int]:
+        """
+        Get the events to test for a player position.
+
+        Parameters:
+            position: Tile position of the player, or ``None`` to get all
+                the events.
+
+        Returns:
+            Indexes of the events, in map order.
+
+        """
+        if position is None:
+            return list(range(len(self.events)))
+
+        x = round(position[0])
+        y = round(position[1])
+        indexes = self.buckets.get((x // BUCKET_SIZE, y // BUCKET_SIZE))
+        if indexes is None:
+            return self.always
+
+        bounds = self.bounds
+        return [
+            index
+            for index in indexes
+            if bounds[index] is None or is_inside(bounds[index], x, y)
+        ]
+
+
+def get_bounds(condition: MapCondition) -> Optional[Tuple[int, int, int, int]]:
+    """
+    Get the tiles inside or next to the area of a condition.
+
+    Parameters:
+        condition: The condition.
+
+    Returns:
+        Left, top, right and bottom tile coordinates, all inclusive, or
+        ``None`` if the condition has no area.
+
+    """
+    x, y, width, height = condition.x, condition.y, condition.width, condition.height
+    if x is None or y is None or not width or not height:
+        return None
+
+    return x - 1, y - 1, x + width, y + height
+
+
+def is_inside(bounds: Tuple[int, int, int, int], x: int, y: int) -> bool:
+    left, top, right, bottom = bounds
+    return left <= x <= right and top <= y <= bottom
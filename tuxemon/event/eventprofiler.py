@@ -0,0 +1,197 @@
+#
+# Tuxemon
+# Copyright (C) 2014, William Edwards <shadowapex@gmail.com>,
+#                     Benjamin Bean <superman2k5@gmail.com>
+#
+# This file is part of Tuxemon.
+#
+# Tuxemon is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tuxemon is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tuxemon.  If not, see <http://www.gnu.org/licenses/>.
+#
+#
+# eventprofiler Timings of the conditions, actions and events of a map.
+#
+#
+
+
+from __future__ import annotations
+import json
+import time
+from collections import deque
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+# Number of recent calls kept to compute the percentiles.
+SAMPLE_COUNT = 1000
+
+T = TypeVar("T")
+
+
+class Timings:
+    """Durations of the calls to a condition, action or event."""
+
+    __slots__ = ("count", "total", "worst", "samples")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.worst = 0.0
+        self.samples: Deque[float] = deque(maxlen=SAMPLE_COUNT)
+
+    def add(self, duration: float) -> None:
+        self.count += 1
+        self.total += duration
+        if duration > self.worst:
+            self.worst = duration
+        self.samples.append(duration)
+
+    def percentile(self, fraction: float) -> float:
+        """
+        Get a percentile of the recent durations.
+
+        Parameters:
+            fraction: Fraction of the calls which are faster, from 0 to 1.
+
+        Returns:
+            The duration, in seconds.
+
+        """
+        if not self.samples:
+            return 0.0
+        samples = sorted(self.samples)
+        index = min(len(samples) - 1, int(fraction * len(samples)))
+        return samples[index]
+
+
+class EventProfiler:
+    """
+    Record the time spent in the conditions, actions and events of a map.
+
+    Calls are grouped by category and name:
+
+    * ``condition``: condition type
+    * ``action.start``, ``action.update``, ``action.cleanup``: action type
+    * ``event``: name of the map event, for all its conditions
+
+    Parameters:
+        clock: Function returning the current time, in seconds.
+
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        self.clock = clock
+        self.timings: Dict[Tuple[str, str], Timings] = {}
+
+    def record(self, category: str, name: str, duration: float) -> None:
+        """
+        Record the duration of a call.
+
+        Parameters:
+            category: Kind of the call.
+            name: Name of the condition, action or event.
+            duration: Duration of the call, in seconds.
+
+        """
+        key = (category, name)
+        timings = self.timings.get(key)
+        if timings is None:
+            timings = Timings()
+            self.timings[key] = timings
+        timings.add(duration)
+
+    def wrap(
+        self,
+        category: str,
+        name: str,
+        function: Callable[..., T],
+    ) -> Callable[..., T]:
+        """
+        Make a function which records the duration of each call.
+
+        Parameters:
+            category: Kind of the call.
+            name: Name of the condition, action or event.
+            function: Function to time.
+
+        Returns:
+            The timed function.
+
+        """
+        clock = self.clock
+        record = self.record
+
+        def timed(*args: Any, **kwargs: Any) -> T:
+            start = clock()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                record(category, name, clock() - start)
+
+        return timed
+
+    def reset(self) -> None:
+        """Forget all the timings."""
+        self.timings.clear()
+
+    def get_report(
+        self,
+        category: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the timings, slowest first.
+
+        Parameters:
+            category: Only get the timings of this kind of call, if given.
+
+        Returns:
+            For each condition, action or event, its category, name,
+            number of calls, and total, mean, 95th percentile and worst
+            durations in milliseconds.
+
+        """
+        report = []
+        for (kind, name), timings in self.timings.items():
+            if category is not None and kind != category:
+                continue
+            report.append(
+                {
+                    "category": kind,
+                    "name": name,
+                    "count": timings.count,
+                    "total_ms": timings.total * 1000,
+                    "mean_ms": timings.total / timings.count * 1000,
+                    "p95_ms": timings.percentile(0.95) * 1000,
+                    "max_ms": timings.worst * 1000,
+                }
+            )
+        report.sort(key=lambda entry: entry["total_ms"], reverse=True)
+        return report
+
+    def dump(self, path: str) -> None:
+        """
+        Save the timings as JSON.
+
+        Parameters:
+            path: Path of the file.
+
+        """
+        with open(path, "w") as fp:
+            json.dump(self.get_report(), fp, indent=2)
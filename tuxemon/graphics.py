@@ -8,6 +8,8 @@ from __future__ import annotations
 import logging
 import os
 import re
+import threading
+from collections import OrderedDict
 
 import pygame
 from pytmx.util_pygame import smart_convert, handle_transformation
@@ -18,7 +20,7 @@ from tuxemon.surfanim import SurfaceAnimation
 from tuxemon.sprite import Sprite
 from tuxemon.tools import transform_resource_filename, scale_sequence
 from typing import Tuple, Sequence, Any, Iterable, Generator, Union, Optional,\
-    Protocol, TYPE_CHECKING
+    Protocol, TYPE_CHECKING, Dict
 from tuxemon.session import Session
 
 if TYPE_CHECKING:
@@ -385,6 +387,229 @@ def convert_alpha_to_colorkey(
     return image
 
 
+TileKey = Tuple[
+    Optional[Tuple[int, int, int, int]],
+    Optional[TileFlags],
+]
+
+
+def surface_bytes(surface: pygame.surface.Surface) -> int:
+    """Memory used by the pixels of a surface, in bytes."""
+    return surface.get_pitch() * surface.get_height()
+
+
+class Tileset:
+    """
+    Scaled tileset image and the tiles converted from it.
+
+    Parameters:
+        filename: Path of the image.
+        image: The scaled image.
+        colorkey: Transparency color.
+        pixelalpha: Whether to use per-pixel alpha transparency or not.
+
+    """
+
+    __slots__ = (
+        "filename",
+        "image",
+        "colorkey",
+        "pixelalpha",
+        "tiles",
+        "size",
+        "cache_key",
+    )
+
+    def __init__(
+        self,
+        filename: str,
+        image: pygame.surface.Surface,
+        colorkey: Optional[pygame.color.Color],
+        pixelalpha: bool,
+    ) -> None:
+        self.filename = filename
+        self.image = image
+        self.colorkey = colorkey
+        self.pixelalpha = pixelalpha
+        self.tiles: Dict[TileKey, pygame.surface.Surface] = {}
+        self.size = surface_bytes(image)
+        # key in the cache, or None once evicted
+        self.cache_key: Optional[Tuple[Any, ...]] = None
+
+    def make_tile(
+        self,
+        rect: Optional[Tuple[int, int, int, int]],
+        flags: Optional[TileFlags],
+    ) -> pygame.surface.Surface:
+        """
+        Cut and convert a tile of the tileset.
+
+        Parameters:
+            rect: Area of the tile in the unscaled image, or ``None`` for
+                the whole image.
+            flags: Transformations of the tile.
+
+        Returns:
+            The converted tile.
+
+        """
+        if rect:
+            # scale the rect to match the scaled image
+            rect = scale_sequence(rect)
+            try:
+                tile = self.image.subsurface(rect)
+            except ValueError:
+                logger.error("Tile bounds outside bounds of tileset image")
+                raise
+        else:
+            tile = self.image.copy()
+
+        if flags:
+            tile = handle_transformation(tile, flags)
+
+        return smart_convert(tile, self.colorkey, self.pixelalpha)
+
+
+class TilesetCache:
+    """
+    Least recently used cache of tilesets, shared by all the maps.
+
+    Tilesets are kept until the memory used by their images and converted
+    tiles goes over the budget.  The tileset being used is never evicted.
+
+    Parameters:
+        budget: Memory allowed for the cached tilesets, in bytes.
+
+    """
+
+    def __init__(self, budget: int) -> None:
+        self.budget = budget
+        self.size = 0
+        self.tilesets: OrderedDict[Tuple[Any, ...], Tileset] = OrderedDict()
+        # maps can be loaded from several threads at once
+        self.lock = threading.RLock()
+
+    def get_tileset(
+        self,
+        filename: str,
+        colorkey: Optional[pygame.color.Color],
+        pixelalpha: bool,
+    ) -> Tileset:
+        """
+        Get a tileset, loading and scaling its image if it isn't cached.
+
+        Parameters:
+            filename: Path of the image.
+            colorkey: Transparency color.
+            pixelalpha: Whether to use per-pixel alpha transparency or not.
+
+        Returns:
+            The tileset.
+
+        """
+        key = (
+            os.path.abspath(filename),
+            # edited images are loaded again
+            os.stat(filename).st_mtime_ns,
+            prepare.SCALE,
+            None if colorkey is None else tuple(colorkey),
+            pixelalpha,
+        )
+        with self.lock:
+            tileset = self.tilesets.get(key)
+            if tileset is not None:
+                self.tilesets.move_to_end(key)
+                return tileset
+
+            # load the tileset image
+            image = pygame.image.load(filename)
+
+            # scale the tileset image to match game scale
+            scaled_size = scale_sequence(image.get_size())
+            image = pygame.transform.scale(image, scaled_size)
+
+            tileset = Tileset(key[0], image, colorkey, pixelalpha)
+            tileset.cache_key = key
+            self.tilesets[key] = tileset
+            self.size += tileset.size
+            self.evict()
+            return tileset
+
+    def get_tile(
+        self,
+        tileset: Tileset,
+        rect: Optional[Tuple[int, int, int, int]],
+        flags: Optional[TileFlags],
+    ) -> pygame.surface.Surface:
+        """
+        Get a converted tile of a tileset, converting it if needed.
+
+        Parameters:
+            tileset: The tileset.
+            rect: Area of the tile in the unscaled image, or ``None`` for
+                the whole image.
+            flags: Transformations of the tile.
+
+        Returns:
+            The converted tile.
+
+        """
+        key = (rect, flags)
+        with self.lock:
+            tile = tileset.tiles.get(key)
+            if tile is None:
+                tile = tileset.make_tile(rect, flags)
+                tileset.tiles[key] = tile
+                tile_size = surface_bytes(tile)
+                tileset.size += tile_size
+                if tileset.cache_key is not None:
+                    # the tileset being used must not be evicted
+                    self.tilesets.move_to_end(tileset.cache_key)
+                    self.size += tile_size
+                    self.evict()
+            return tile
+
+    def evict(self) -> None:
+        """Drop the least recently used tilesets until under the budget."""
+        while self.size > self.budget and len(self.tilesets) > 1:
+            _, tileset = self.tilesets.popitem(last=False)
+            tileset.cache_key = None
+            self.size -= tileset.size
+            logger.debug(
+                f"Evicted tileset {tileset.filename} ({tileset.size} bytes)",
+            )
+
+    def memory_usage(self) -> Dict[str, int]:
+        """
+        Get the memory held by each cached tileset.
+
+        Returns:
+            Bytes used by the image and tiles of each tileset, by path.
+
+        """
+        with self.lock:
+            usage: Dict[str, int] = {}
+            for tileset in self.tilesets.values():
+                usage[tileset.filename] = (
+                    usage.get(tileset.filename, 0) + tileset.size
+                )
+            return usage
+
+    def clear(self) -> None:
+        """Forget all the cached tilesets."""
+        with self.lock:
+            for tileset in self.tilesets.values():
+                tileset.cache_key = None
+            self.tilesets.clear()
+            self.size = 0
+
+
+# Memory allowed for the tilesets shared by all the maps, in bytes.
+TILESET_CACHE_BUDGET = 64 * 1024 * 1024
+
+tileset_cache = TilesetCache(TILESET_CACHE_BUDGET)
+
+
 def scaled_image_loader(
     filename: str,
     colorkey: Optional[str],
@@ -395,7 +620,8 @@ def scaled_image_loader(
     """
     Pytmx image loader for pygame.
 
-    Modified to load images at a scaled size.
+    Modified to load images at a scaled size.  The scaled images and their
+    converted tiles are cached in ``tileset_cache``.
 
     Parameters:
         filename: Path of the image.
@@ -409,33 +635,14 @@ def scaled_image_loader(
     """
     colorkey_color = pygame.Color(f"#{colorkey}") if colorkey else None
 
-    # load the tileset image
-    image = pygame.image.load(filename)
-
-    # scale the tileset image to match game scale
-    scaled_size = scale_sequence(image.get_size())
-    image = pygame.transform.scale(image, scaled_size)
+    # tilesets and their tiles are shared with the other maps using them
+    tileset = tileset_cache.get_tileset(filename, colorkey_color, pixelalpha)
 
     def load_image(
         rect: Optional[Tuple[int, int, int, int]] = None,
         flags: Optional[TileFlags] = None,
     ) -> pygame.surface.Surface:
-        if rect:
-            # scale the rect to match the scaled image
-            rect = scale_sequence(rect)
-            try:
-                tile = image.subsurface(rect)
-            except ValueError:
-                logger.error("Tile bounds outside bounds of tileset image")
-                raise
-        else:
-            tile = image.copy()
-
-        if flags:
-            tile = handle_transformation(tile, flags)
-
-        tile = smart_convert(tile, colorkey_color, pixelalpha)
-        return tile
+        return tileset_cache.get_tile(tileset, rect, flags)
 
     return load_image
 
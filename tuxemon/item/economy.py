@@ -31,8 +31,9 @@
 
 from __future__ import annotations
 import logging
+from typing import Dict, Iterable, Mapping, Optional, Sequence
 
-from tuxemon.db import db
+from tuxemon.db import JSONEconomyItem, db
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +47,10 @@ class Economy:
         slug: Optional[str] = None
     ) -> None:
 
+        self._items: Sequence[JSONEconomyItem] = []
+        # Fields of each item, by item slug, for constant time lookups.
+        self._fields: Dict[str, Dict[str, int]] = {}
+
         # Auto-load the economy from the economy database.
         if slug:
             self.load(slug)
@@ -68,7 +73,23 @@ class Economy:
         self.slug = results["slug"]
         self.items = results["items"]
 
-    def lookup_item_field(self, item_slug: str, field: str) -> int:
+    @property
+    def items(self) -> Sequence[JSONEconomyItem]:
+        """Items of this economy, with their price and cost."""
+        return self._items
+
+    @items.setter
+    def items(self, items: Sequence[JSONEconomyItem]) -> None:
+        self._items = items
+        self._fields = {}
+        for item in items:
+            fields = self._fields.setdefault(item["item_name"], {})
+            for field, value in item.items():
+                # The first entry defining a field wins, like a linear scan.
+                if field != "item_name":
+                    fields.setdefault(field, value)
+
+    def lookup_item_field(self, item_slug: str, field: str) -> Optional[int]:
         """Looks up the item's field from this economy.
 
         The item and field is looked up by its slug.
@@ -81,12 +102,58 @@ class Economy:
         Returns:
             Field of item for this economy.
         """
-        for item in self.items:
-            if item["item_name"] == item_slug and field in item:
-                value = item[field]
-                return value
+        fields = self._fields.get(item_slug)
+        if fields is None:
+            return None
+
+        return fields.get(field)
+
+    def lookup_items_field(
+        self,
+        item_slugs: Iterable[str],
+        field: str,
+    ) -> Mapping[str, int]:
+        """Looks up a field of many items from this economy at once.
+
+        Items without the field in this economy are left out of the result,
+        so a whole inventory can be priced in one call.
+
+        Parameters:
+            item_slugs: The item slugs to look up in this economy.
+            field: The field on items to get the value of.
+
+        Returns:
+            Field of each item for this economy, by item slug.
+        """
+        values = {}
+        for item_slug in item_slugs:
+            value = self.lookup_item_field(item_slug, field)
+            if value is not None:
+                values[item_slug] = value
+
+        return values
+
+    def lookup_item_prices(self, item_slugs: Iterable[str]) -> Mapping[str, int]:
+        """Looks up the prices of many items from this economy at once.
+
+        Parameters:
+            item_slugs: The item slugs to look up in this economy.
+
+        Returns:
+            Price of each item having one in this economy, by item slug.
+        """
+        return self.lookup_items_field(item_slugs, "price")
 
-        return None
+    def lookup_item_costs(self, item_slugs: Iterable[str]) -> Mapping[str, int]:
+        """Looks up the costs of many items from this economy at once.
+
+        Parameters:
+            item_slugs: The item slugs to look up in this economy.
+
+        Returns:
+            Cost of each item having one in this economy, by item slug.
+        """
+        return self.lookup_items_field(item_slugs, "cost")
 
     def lookup_item_price(self, item_slug: str) -> int:
         """Looks up the item price from this economy.
@@ -30,22 +30,29 @@
 
 from __future__ import annotations
 import logging
+import threading
+from array import array
 from itertools import product
 from math import pi, atan2
 from typing import Optional, Literal, Generator, Tuple, TypeVar, Mapping,\
-    Sequence, List, Set, TypedDict, Union
+    Sequence, List, Set, TypedDict, Union, Any, Dict, Iterable, Iterator,\
+    TYPE_CHECKING
 
 import pyscroll
 from pytmx import pytmx
 
 from tuxemon.compat import ReadOnlyRect
 from tuxemon import prepare
-from tuxemon.graphics import scaled_image_loader
+from tuxemon.graphics import scaled_image_loader, tileset_cache
 from tuxemon.math import Vector2, Vector3
+from tuxemon.pathfinding import FlowField
 from tuxemon.tools import round_to_divisible
 from tuxemon.event import EventObject
 from pytmx.pytmx import TiledMap
 
+if TYPE_CHECKING:
+    from tuxemon.entity import Entity
+
 logger = logging.getLogger(__name__)
 
 RectTypeVar = TypeVar("RectTypeVar", bound=ReadOnlyRect)
@@ -86,6 +93,18 @@ short_dirs = {d[0]: dirs2[d] for d in dirs2}
 # complimentary directions
 pairs = {"up": "down", "down": "up", "left": "right", "right": "left"}
 
+# exit mask bit and tile offset of each direction, in the order exits are
+# reported by the world
+exit_bits: Sequence[Tuple[Direction, int, int, int]] = (
+    ("down", 1, 0, 1),
+    ("right", 2, 1, 0),
+    ("up", 4, 0, -1),
+    ("left", 8, -1, 0),
+)
+direction_bits: Mapping[Direction, int] = {
+    direction: bit for direction, bit, dx, dy in exit_bits
+}
+
 # what directions entities can face
 facing = "front", "back", "left", "right"
 
@@ -343,39 +362,548 @@ def extract_region_properties(
         return None
 
 
-class PathfindNode:
-    """Used in path finding search."""
+def compute_exit_masks(
+    size: Tuple[int, int],
+    collision_map: Mapping[Tuple[int, int], Optional[RegionProperties]],
+    collision_lines_map: Set[Tuple[Tuple[int, int], Direction]],
+) -> bytearray:
+    """
+    Compute which neighbors can be moved into from each tile of a map.
+
+    Only the static geometry is considered: map bounds, walls, the region
+    properties of the neighbors ("enter") and the explicit exits of the
+    tile itself ("continue" and "exit").  Entities are not.
+
+    Parameters:
+        size: Width and height of the map, in tiles.
+        collision_map: Region properties of the map, by tile position.
+        collision_lines_map: Walls between tiles.
+
+    Returns:
+        One mask per tile, indexed by y * width + x, with the bits of
+        ``exit_bits`` set for the directions that can be moved in.
+
+    """
+    width, height = size
+    masks = bytearray(width * height)
+    for y in range(height):
+        for x in range(width):
+            position = (x, y)
+
+            # does the tile define the only ways to exit it?
+            allowed = 15
+            tile_data = collision_map.get(position)
+            if tile_data:
+                if tile_data.get("continue") in direction_bits:
+                    allowed = direction_bits[tile_data["continue"]]
+                elif tile_data.get("exit"):
+                    # a value which is not a direction, such as "same",
+                    # makes the exits of the tile ignored, as they used to
+                    # be when they were checked one tile at a time
+                    explicit = 0
+                    for direction in tile_data["exit"]:
+                        if direction not in direction_bits:
+                            break
+                        explicit |= direction_bits[direction]
+                    else:
+                        allowed = explicit
+
+            mask = 0
+            for direction, bit, dx, dy in exit_bits:
+                if not allowed & bit:
+                    continue
+
+                neighbor = (x + dx, y + dy)
+                if not (0 <= neighbor[0] < width and 0 <= neighbor[1] < height):
+                    continue
+
+                # is this tile separated by a wall?
+                if (position, direction) in collision_lines_map:
+                    continue
+
+                # None means the tile is blocked, else it must be enterable
+                # from this side
+                if neighbor in collision_map:
+                    neighbor_data = collision_map[neighbor]
+                    if neighbor_data is None:
+                        continue
+                    enter = neighbor_data.get("enter")
+                    if enter is None or pairs[direction] not in enter:
+                        continue
+
+                mask |= bit
+
+            masks[y * width + x] = mask
+
+    return masks
+
+
+class Reachability:
+    """
+    Which tiles of a map can be walked to from which.
+
+    Only the static exits of the tiles are considered, so one-way tiles are
+    honored, but entities are not: a tile that can't be reached here can
+    never be reached, whatever the entities do.
+
+    Tiles are labelled with their strongly connected component, inside
+    which all the tiles can reach each other.  The components reachable
+    from each component are kept as bitsets, so queries take constant time.
+
+    Parameters:
+        size: Width and height of the map, in tiles.
+        exit_masks: Static exits of each tile, see ``compute_exit_masks``.
+
+    """
+
+    __slots__ = ("width", "height", "components", "bits", "reach")
+
+    def __init__(self, size: Tuple[int, int], exit_masks: bytearray) -> None:
+        self.width, self.height = size
+        self.components = find_components(size, exit_masks)
+
+        # Components are numbered in reverse topological order, so the
+        # components reachable from another always have smaller numbers.
+        components = self.components
+        offsets = [(bit, dy * self.width + dx) for _, bit, dx, dy in exit_bits]
+        successors: Dict[int, Set[int]] = {}
+        for index, mask in enumerate(exit_masks):
+            if not mask:
+                continue
+            component = components[index]
+            for bit, offset in offsets:
+                if mask & bit:
+                    other = components[index + offset]
+                    if other != component:
+                        successors.setdefault(component, set()).add(other)
+
+        # Only the components entered from another one need a bit.
+        entered = sorted(set().union(*successors.values()))
+        self.bits = {component: bit for bit, component in enumerate(entered)}
+        self.reach: Dict[int, int] = {}
+        for component in sorted(successors):
+            reach = 0
+            for other in successors[component]:
+                reach |= (1 << self.bits[other]) | self.reach.get(other, 0)
+            self.reach[component] = reach
+
+    def can_reach(
+        self,
+        start: Tuple[int, int],
+        dest: Tuple[int, int],
+    ) -> bool:
+        """
+        Check if a tile can be walked to from another.
+
+        Parameters:
+            start: Initial tile position.
+            dest: Target tile position.
+
+        Returns:
+            Whether a path may exist.  ``False`` if either tile is outside
+            the map.
+
+        """
+        width, height = self.width, self.height
+        if not (0 <= start[0] < width and 0 <= start[1] < height):
+            return False
+        if not (0 <= dest[0] < width and 0 <= dest[1] < height):
+            return False
+
+        start_component = self.components[start[1] * width + start[0]]
+        dest_component = self.components[dest[1] * width + dest[0]]
+        if start_component == dest_component:
+            return True
+
+        bit = self.bits.get(dest_component)
+        if bit is None:
+            return False
+        return bool(self.reach.get(start_component, 0) >> bit & 1)
+
+
+def find_components(size: Tuple[int, int], exit_masks: bytearray) -> array:
+    """
+    Label the tiles of a map with their strongly connected component.
+
+    Uses an iterative version of Tarjan's algorithm, which numbers the
+    components in reverse topological order.
+
+    Parameters:
+        size: Width and height of the map, in tiles.
+        exit_masks: Static exits of each tile, see ``compute_exit_masks``.
+
+    Returns:
+        Component of each tile, indexed by y * width + x.
+
+    """
+    width, height = size
+    count = width * height
+    offsets = [(bit, dy * width + dx) for _, bit, dx, dy in exit_bits]
+    order = array("l", [-1]) * count
+    low = array("l", [0]) * count
+    on_stack = bytearray(count)
+    components = array("l", [-1]) * count
+    stack: List[int] = []
+    counter = 0
+    component = 0
+
+    for root in range(count):
+        if order[root] != -1:
+            continue
+
+        order[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+        # tiles being visited, with the next exit to look at
+        work = [(root, 0)]
+        while work:
+            node, position = work[-1]
+            mask = exit_masks[node]
+            while position < 4:
+                bit, offset = offsets[position]
+                position += 1
+                if not mask & bit:
+                    continue
+                other = node + offset
+                if order[other] == -1:
+                    # visit the neighbor, then come back to this tile
+                    work[-1] = (node, position)
+                    order[other] = low[other] = counter
+                    counter += 1
+                    stack.append(other)
+                    on_stack[other] = 1
+                    work.append((other, 0))
+                    break
+                elif on_stack[other] and order[other] < low[node]:
+                    low[node] = order[other]
+            else:
+                # all the exits of this tile were visited
+                work.pop()
+                if low[node] == order[node]:
+                    while True:
+                        other = stack.pop()
+                        on_stack[other] = 0
+                        components[other] = component
+                        if other == node:
+                            break
+                    component += 1
+                if work:
+                    parent = work[-1][0]
+                    if low[node] < low[parent]:
+                        low[parent] = low[node]
+
+    return components
+
+
+class CollisionGrid(Mapping[Tuple[int, int], Any]):
+    """
+    Collision map of a loaded map, including the tiles taken by entities.
+
+    Behaves like the mapping of tile positions to region properties of the
+    map, where tiles taken by an entity map to ``{"entity": entity}``.
+    Region properties take precedence over entities.
+
+    The region properties never change once the map is loaded.  Entities
+    are tracked incrementally as they are added, moved and removed, and the
+    number of entities on each tile is kept in a flat array sized to the
+    map, so nothing has to be rebuilt when querying collisions.
+
+    When the exit masks of the map are given, the exits of a tile are
+    its static exits minus the neighbors taken by entities.
+
+    The version is increased whenever a tile becomes free or taken, so
+    results derived from the collisions can tell when they are outdated.
+
+    Parameters:
+        size: Width and height of the map, in tiles.
+        collision_map: Region properties of the map, by tile position.
+        exit_masks: Static exits of each tile, see ``compute_exit_masks``.
+
+    """
 
     def __init__(
         self,
-        value: Tuple[int, int],
-        parent: Optional[PathfindNode] = None,
+        size: Tuple[int, int],
+        collision_map: Mapping[Tuple[int, int], Optional[RegionProperties]],
+        exit_masks: Optional[bytearray] = None,
     ) -> None:
-        self.parent = parent
-        self.value = value
-        if self.parent:
-            self.depth: int = self.parent.depth + 1
-        else:
-            self.depth = 0
+        self.width, self.height = size
+        self.static = collision_map
+        self.exit_masks = exit_masks
+        # Whether each tile has region properties, which take precedence
+        # over the entities on it.
+        self.static_tiles = bytearray(self.width * self.height)
+        for x, y in collision_map:
+            if 0 <= x < self.width and 0 <= y < self.height:
+                self.static_tiles[y * self.width + x] = 1
+        # Number of entities on each tile, indexed by y * width + x.
+        self.occupancy = bytearray(self.width * self.height)
+        self.positions: Dict[Entity[Any], Tuple[int, int]] = {}
+        # Collision data of the entities on each tile, last added last.
+        self.occupants: Dict[Tuple[int, int], List[Mapping[str, Any]]] = {}
+        self.collisions: Dict[Entity[Any], Mapping[str, Any]] = {}
+        self.version = 0
+        self._snapshot: Optional[CollisionSnapshot] = None
+
+    def __getitem__(self, position: Tuple[int, int]) -> Any:
+        try:
+            return self.static[position]
+        except KeyError:
+            return self.occupants[position][-1]
+
+    def __contains__(self, position: object) -> bool:
+        return position in self.static or position in self.occupants
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        yield from self.static
+        for position in self.occupants:
+            if position not in self.static:
+                yield position
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def is_occupied(self, position: Tuple[int, int]) -> bool:
+        """
+        Check if an entity is on a tile.
 
-    def get_parent(self) -> Optional[PathfindNode]:
-        return self.parent
+        Parameters:
+            position: Tile position.
+
+        Returns:
+            Whether at least one entity is on the tile.
+
+        """
+        x, y = position
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self.occupancy[y * self.width + x] > 0
+        return position in self.occupants
+
+    def get_exit_mask(self, position: Tuple[int, int]) -> int:
+        """
+        Get the directions that can be moved in from a tile.
+
+        Requires the exit masks of the map.
 
-    def set_parent(self, parent: PathfindNode) -> None:
-        self.parent = parent
-        self.depth = parent.depth + 1
+        Parameters:
+            position: Tile position, inside the map.
+
+        Returns:
+            Mask with the bits of ``exit_bits`` set for the directions
+            that can be moved in.
 
-    def get_value(self) -> Tuple[int, int]:
-        return self.value
+        """
+        assert self.exit_masks is not None
+        return get_exit_mask(
+            self.exit_masks,
+            self.static_tiles,
+            self.occupancy,
+            self.width,
+            position[1] * self.width + position[0],
+        )
 
-    def get_depth(self) -> int:
-        return self.depth
+    def snapshot(self) -> CollisionSnapshot:
+        """
+        Get the exits of the tiles as they are now.
 
-    def __str__(self) -> str:
-        s = str(self.value)
-        if self.parent is not None:
-            s += str(self.parent)
-        return s
+        Requires the exit masks of the map.  The snapshot is reused until
+        the version changes.
+
+        Returns:
+            Snapshot of the grid.
+
+        """
+        snapshot = self._snapshot
+        if snapshot is None or snapshot.version != self.version:
+            snapshot = CollisionSnapshot(self)
+            self._snapshot = snapshot
+        return snapshot
+
+    def add_entity(self, entity: Entity[Any]) -> None:
+        """
+        Start tracking the tile taken by an entity.
+
+        Parameters:
+            entity: The entity, at its current tile position.
+
+        """
+        if entity in self.positions:
+            return
+
+        self.collisions[entity] = {"entity": entity}
+        self._occupy(entity, entity.tile_pos)
+
+    def remove_entity(self, entity: Entity[Any]) -> None:
+        """
+        Stop tracking the tile taken by an entity.
+
+        Parameters:
+            entity: The entity.
+
+        """
+        if entity not in self.positions:
+            return
+
+        self._vacate(entity)
+        del self.collisions[entity]
+
+    def move_entity(self, entity: Entity[Any], position: Tuple[int, int]) -> None:
+        """
+        Update the tile taken by an entity.
+
+        Entities which are not tracked are ignored.
+
+        Parameters:
+            entity: The entity.
+            position: Its new tile position.
+
+        """
+        old_position = self.positions.get(entity)
+        if old_position is None or old_position == position:
+            return
+
+        self._vacate(entity)
+        self._occupy(entity, position)
+
+    def reset_entities(self, entities: Iterable[Entity[Any]]) -> None:
+        """
+        Replace all the tracked entities.
+
+        Parameters:
+            entities: The entities to track.
+
+        """
+        for entity in list(self.positions):
+            self.remove_entity(entity)
+        for entity in entities:
+            self.add_entity(entity)
+
+    def _occupy(self, entity: Entity[Any], position: Tuple[int, int]) -> None:
+        self.positions[entity] = position
+        occupants = self.occupants.setdefault(position, [])
+        occupants.append(self.collisions[entity])
+        self._count(position, len(occupants))
+
+    def _vacate(self, entity: Entity[Any]) -> None:
+        position = self.positions.pop(entity)
+        occupants = self.occupants[position]
+        occupants.remove(self.collisions[entity])
+        if not occupants:
+            del self.occupants[position]
+        self._count(position, len(occupants))
+
+    def _count(self, position: Tuple[int, int], count: int) -> None:
+        x, y = position
+        if 0 <= x < self.width and 0 <= y < self.height:
+            index = y * self.width + x
+            if bool(self.occupancy[index]) != bool(count):
+                self.version += 1
+            self.occupancy[index] = min(count, 255)
+
+
+class CollisionSnapshot:
+    """
+    Immutable copy of the exits of a collision grid.
+
+    The occupancy of the tiles is copied, and the static data of the map
+    is shared, so the snapshot can be searched from other threads whilst
+    the entities keep moving.  Searches to the same destination share a
+    flow field.
+
+    Parameters:
+        grid: The collision grid, with exit masks.
+
+    """
+
+    def __init__(self, grid: CollisionGrid) -> None:
+        assert grid.exit_masks is not None
+        self.width = grid.width
+        self.height = grid.height
+        self.version = grid.version
+        self.exit_masks = grid.exit_masks
+        self.static_tiles = grid.static_tiles
+        self.occupancy = bytes(grid.occupancy)
+        self.flow_fields: Dict[Tuple[int, int], FlowField] = {}
+        self.lock = threading.Lock()
+
+    def get_exits(self, position: Tuple[int, int]) -> List[Tuple[int, int]]:
+        """
+        Get the tiles which can be moved into from a tile.
+
+        Parameters:
+            position: Tile position, inside the map.
+
+        Returns:
+            Positions of the adjacent tiles that can be moved into.
+
+        """
+        x, y = position
+        mask = get_exit_mask(
+            self.exit_masks,
+            self.static_tiles,
+            self.occupancy,
+            self.width,
+            y * self.width + x,
+        )
+        return [(x + dx, y + dy) for direction, bit, dx, dy in exit_bits if mask & bit]
+
+    def find_path(
+        self,
+        start: Tuple[int, int],
+        dest: Tuple[int, int],
+    ) -> Optional[List[Tuple[int, int]]]:
+        """
+        Find a shortest path between two tiles.
+
+        Parameters:
+            start: Initial tile position.
+            dest: Target tile position.
+
+        Returns:
+            Tile positions of the steps, from the destination back to the
+            first step (the start is not included), or ``None`` if there
+            is no path.
+
+        """
+        with self.lock:
+            field = self.flow_fields.get(dest)
+            if field is None:
+                field = FlowField(dest, (self.width, self.height), self.get_exits)
+                self.flow_fields[dest] = field
+            return field.find_path(start)
+
+
+def get_exit_mask(
+    exit_masks: Union[bytes, bytearray],
+    static_tiles: Union[bytes, bytearray],
+    occupancy: Union[bytes, bytearray],
+    width: int,
+    index: int,
+) -> int:
+    """
+    Remove the exits to tiles taken by entities from a static exit mask.
+
+    Parameters:
+        exit_masks: Static exits of each tile.
+        static_tiles: Whether each tile has region properties.
+        occupancy: Number of entities on each tile.
+        width: Width of the map, in tiles.
+        index: Index of the tile.
+
+    Returns:
+        Mask with the bits of ``exit_bits`` set for the directions that
+        can be moved in.
+
+    """
+    mask = exit_masks[index]
+    for direction, bit, dx, dy in exit_bits:
+        if mask & bit:
+            # the static exits never leave the map
+            neighbor = index + dy * width + dx
+            if occupancy[neighbor] and not static_tiles[neighbor]:
+                mask &= ~bit
+    return mask
 
 
 class TuxemonMap:
@@ -395,6 +923,8 @@ class TuxemonMap:
         tiled_map: TiledMap,
         edges: str,
         filename: str,
+        exit_masks: Optional[bytearray] = None,
+        reachability: Optional[Reachability] = None,
     ) -> None:
         """Constructor
 
@@ -419,6 +949,10 @@ class TuxemonMap:
             tiled_map: Original tiled map.
             edges: Behaviour at the edges.
             filename: Path of the map.
+            exit_masks: Exits of each tile, computed from the collisions
+                if not given.
+            reachability: Reachability between the tiles, computed from
+                the exits if not given.
 
         """
         self.interacts = interacts
@@ -432,6 +966,37 @@ class TuxemonMap:
         self.data = tiled_map
         self.sprite_layer = 2
         self.filename = filename
+        if exit_masks is None:
+            exit_masks = compute_exit_masks(
+                self.size,
+                collision_map,
+                collisions_lines_map,
+            )
+        self.exit_masks = exit_masks
+        if reachability is None:
+            reachability = Reachability(self.size, exit_masks)
+        self.reachability = reachability
+
+    def load_images(self) -> None:
+        """
+        Load the tile images, if the map was loaded without them.
+
+        The images are converted for the display, which is only safe on
+        the main thread.
+
+        """
+        if self.data.image_loader is scaled_image_loader:
+            return
+        self.data.image_loader = scaled_image_loader
+        self.data.reload_images()
+
+        usage = tileset_cache.memory_usage()
+        logger.debug(
+            f"Tileset cache after loading {self.filename}: "
+            f"{sum(usage.values()) / 1024:.0f} KiB",
+        )
+        for path, size in sorted(usage.items()):
+            logger.debug(f"  {path}: {size / 1024:.0f} KiB")
 
     def initialize_renderer(self) -> None:
         """
@@ -0,0 +1,225 @@
+#
+# Tuxemon
+# Copyright (C) 2014, William Edwards <shadowapex@gmail.com>,
+#                     Benjamin Bean <superman2k5@gmail.com>
+#
+# This file is part of Tuxemon.
+#
+# Tuxemon is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tuxemon is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tuxemon.  If not, see <http://www.gnu.org/licenses/>.
+#
+#
+# map_cache Cache of loaded maps, with background preloading.
+#
+#
+
+
+from __future__ import annotations
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+)
+
+from tuxemon.event import EventObject
+
+if TYPE_CHECKING:
+    from tuxemon.map import TuxemonMap
+
+logger = logging.getLogger(__name__)
+
+# Actions whose first parameter is the name of the map to teleport to.
+TELEPORT_ACTIONS = frozenset(
+    ("teleport", "transition_teleport", "delayed_teleport"),
+)
+
+
+def get_teleport_targets(events: Iterable[EventObject]) -> List[str]:
+    """
+    Get the names of the maps that events can teleport the player to.
+
+    Parameters:
+        events: Events of a map.
+
+    Returns:
+        Map names, without duplicates, in the order they appear.
+
+    """
+    targets: Dict[str, None] = {}
+    for event in events:
+        for act in event.acts:
+            if act.type in TELEPORT_ACTIONS and act.parameters:
+                targets[act.parameters[0]] = None
+    return list(targets)
+
+
+class MapCache:
+    """
+    Least recently used cache of loaded maps, keyed by path.
+
+    Maps can also be preloaded on a worker thread, so that they are
+    already in the cache when they are needed.  A map requested while it
+    is being preloaded is waited for instead of being loaded twice.
+
+    Converting images for the display is not thread safe, so maps are
+    loaded without their images.  They are loaded when the map is got,
+    on the thread getting it.
+
+    Parameters:
+        load_map: Function loading a map from its path, without images.
+        size: Maximum number of maps kept in the cache.
+
+    """
+
+    def __init__(
+        self,
+        load_map: Callable[[str], TuxemonMap],
+        size: int = 8,
+    ) -> None:
+        self.load_map = load_map
+        self.size = size
+        self.maps: OrderedDict[str, TuxemonMap] = OrderedDict()
+        self.pending: Dict[str, Future[TuxemonMap]] = {}
+        self.lock = threading.Lock()
+        self.executor: Optional[ThreadPoolExecutor] = None
+
+    def __contains__(self, path: object) -> bool:
+        return path in self.maps
+
+    def __len__(self) -> int:
+        return len(self.maps)
+
+    def get(self, path: str) -> TuxemonMap:
+        """
+        Get a map, loading it if it isn't cached.
+
+        Must be called from the main thread, as the images of the map are
+        loaded if needed.
+
+        Parameters:
+            path: Path of the map.
+
+        Returns:
+            The loaded map.
+
+        """
+        map_data = self._get(path)
+        map_data.load_images()
+        return map_data
+
+    def _get(self, path: str) -> TuxemonMap:
+        with self.lock:
+            map_data = self.maps.get(path)
+            if map_data is not None:
+                self.maps.move_to_end(path)
+                return map_data
+            future = self.pending.get(path)
+
+        if future is not None:
+            try:
+                return future.result()
+            except Exception:
+                # the error is raised again by the load below
+                pass
+
+        logger.debug("Map was not preloaded. Loading from disk.")
+        map_data = self.load_map(path)
+        self.store(path, map_data)
+        return map_data
+
+    def store(self, path: str, map_data: TuxemonMap) -> None:
+        """
+        Add a map to the cache, evicting the least recently used maps.
+
+        Parameters:
+            path: Path of the map.
+            map_data: The loaded map.
+
+        """
+        if self.size <= 0:
+            return
+
+        with self.lock:
+            self.maps[path] = map_data
+            self.maps.move_to_end(path)
+            while len(self.maps) > self.size:
+                evicted, _ = self.maps.popitem(last=False)
+                logger.debug(f"Evicted map {evicted} from the cache")
+
+    def preload(self, path: str) -> Optional[Future[TuxemonMap]]:
+        """
+        Start loading a map on the worker thread, without its images.
+
+        Parameters:
+            path: Path of the map.
+
+        Returns:
+            Future of the loaded map, or ``None`` if the map is already
+            cached or caching is disabled.
+
+        """
+        if self.size <= 0:
+            return None
+
+        with self.lock:
+            if path in self.maps:
+                return None
+            future = self.pending.get(path)
+            if future is not None:
+                return future
+
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(
+                    max_workers=1,
+                    thread_name_prefix="map_preload",
+                )
+            future = self.executor.submit(self._preload, path)
+            self.pending[path] = future
+            return future
+
+    def _preload(self, path: str) -> TuxemonMap:
+        try:
+            map_data = self.load_map(path)
+        except Exception:
+            logger.exception(f"Failed to preload map {path}")
+            raise
+        else:
+            self.store(path, map_data)
+            logger.debug(f"Preloaded map {path}")
+            return map_data
+        finally:
+            with self.lock:
+                self.pending.pop(path, None)
+
+    def clear(self) -> None:
+        """Forget all the cached maps."""
+        with self.lock:
+            self.maps.clear()
+
+    def shutdown(self) -> None:
+        """Stop the worker thread, abandoning the maps not started yet."""
+        with self.lock:
+            executor = self.executor
+            self.executor = None
+            for future in self.pending.values():
+                future.cancel()
+            self.pending.clear()
+        if executor is not None:
+            executor.shutdown(wait=False)
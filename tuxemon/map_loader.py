@@ -24,9 +24,26 @@
 # Leif Theden <leif.theden@gmail.com>
 #
 
+import hashlib
 import logging
+import os
+import pickle
+import tempfile
 from math import cos, sin, pi
-from typing import Iterator, Tuple, Generator, Optional, Mapping, Any
+from xml.etree import ElementTree
+from typing import (
+    Any,
+    Dict,
+    Generator,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
 import pytmx
 import yaml
@@ -34,10 +51,13 @@ from natsort import natsorted
 
 from tuxemon.compat import Rect
 from tuxemon import prepare
+from tuxemon.db import FileSignature, file_signature, strip_mtimes
 from tuxemon.event import EventObject, MapAction, MapCondition
 from tuxemon.graphics import scaled_image_loader
 from tuxemon.map import (
+    Reachability,
     TuxemonMap,
+    compute_exit_masks,
     tiles_inside_rect,
     snap_rect,
     point_to_grid,
@@ -63,6 +83,10 @@ RegionTile = Tuple[
     Optional[Mapping[str, Any]],
 ]
 
+# Version of the compiled map format.  Increase it whenever the compiled
+# data or the way it is derived changes, so that older files are ignored.
+COMPILED_MAP_VERSION = 3
+
 # TODO: standardize and document these values
 region_properties = [
     "enter",
@@ -122,6 +146,62 @@ class YAMLEventLoader:
             yield EventObject(None, name, x, y, w, h, conds, acts)
 
 
+def assign_condition_ids(*groups: List[EventObject]) -> None:
+    """
+    Number the conditions of the events of a map, in map order.
+
+    Conditions which keep state between frames use the number as key, as
+    it is cheaper than formatting the condition.
+
+    Parameters:
+        groups: Lists of events of the map, changed in place.
+
+    """
+    condition_id = 0
+    for events in groups:
+        for index, event in enumerate(events):
+            conds = []
+            for cond in event.conds:
+                conds.append(cond._replace(id=condition_id))
+                condition_id += 1
+            events[index] = event._replace(conds=conds)
+
+
+def get_map_sources(filename: str) -> List[str]:
+    """
+    Get the paths of the files the collisions and events of a map come from.
+
+    The tile properties, which hold collisions and exits, can be stored in
+    external tilesets.
+
+    Parameters:
+        filename: The path to the tmx map file.
+
+    Returns:
+        The tmx map file, followed by its external tilesets.
+
+    """
+    sources = [filename]
+    dirname = os.path.dirname(filename)
+    for node in ElementTree.parse(filename).getroot().findall("tileset"):
+        source = node.get("source")
+        if source is not None:
+            sources.append(os.path.normpath(os.path.join(dirname, source)))
+    return sources
+
+
+class CompiledMap(NamedTuple):
+    """Map data derived from the map files, without any graphics."""
+
+    events: Sequence[EventObject]
+    inits: Sequence[EventObject]
+    interacts: Sequence[EventObject]
+    collision_map: Mapping[Tuple[int, int], Optional[RegionProperties]]
+    collision_lines_map: Set[Tuple[Tuple[int, int], Direction]]
+    exit_masks: bytearray
+    reachability: Reachability
+
+
 class TMXMapLoader:
     """Maps are loaded from standard tmx files created from a map editor like Tiled. Events and
     collision regions are loaded and put in the appropriate data structures for the game to
@@ -129,9 +209,33 @@ class TMXMapLoader:
 
     **Tiled:** http://www.mapeditor.org/
 
+    The collisions and events derived from the map files can be kept in a
+    cache directory.  They are then reused as long as the files keep the
+    same contents, and only the graphics are loaded again.
+
+    Parameters:
+        cache_dir: Directory of the compiled maps.  ``None`` disables the
+            cache.
+        image_loader: Pytmx image loader of the tilesets.  Tools which
+            don't draw the maps, and loads off the main thread, can use
+            ``pytmx.pytmx.default_image_loader`` to skip loading images.
+            They can be loaded later with ``TuxemonMap.load_images``.
+
     """
 
-    def load(self, filename: str) -> TuxemonMap:
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        image_loader: Any = scaled_image_loader,
+    ) -> None:
+        self.cache_dir = cache_dir
+        self.image_loader = image_loader
+
+    def load(
+        self,
+        filename: str,
+        yaml_path: Optional[str] = None,
+    ) -> TuxemonMap:
         """Load map data from a tmx map file.
 
         Loading the map data is done using the pytmx library.
@@ -156,20 +260,75 @@ class TMXMapLoader:
 
         Parameters:
             filename: The path to the tmx map file to load.
+            yaml_path: Path of a YAML file with more events for the map.
 
         Returns:
             The loaded map.
 
         """
-        data = pytmx.TiledMap(filename, image_loader=scaled_image_loader, pixelalpha=True)
+        data = pytmx.TiledMap(filename, image_loader=self.image_loader, pixelalpha=True)
         tile_size = (data.tilewidth, data.tileheight)
         data.tilewidth, data.tileheight = prepare.TILE_SIZE
+        edges = data.properties.get("edges")
+
+        compiled = None
+        if self.cache_dir is not None:
+            sources = get_map_sources(filename)
+            if yaml_path is not None:
+                sources.append(yaml_path)
+            cache_path = self.get_cache_path(filename)
+            known, compiled = self.read_compiled(cache_path)
+            signatures = {
+                path: file_signature(path, known.get(path))
+                for path in sources
+            }
+            if compiled is None or strip_mtimes(known) != strip_mtimes(signatures):
+                compiled = None
+            elif known != signatures:
+                # only the modification times changed
+                self.write_compiled(cache_path, signatures, compiled)
+
+        if compiled is None:
+            compiled = self.compile(data, tile_size, yaml_path)
+            if self.cache_dir is not None:
+                self.write_compiled(cache_path, signatures, compiled)
+
+        return TuxemonMap(
+            compiled.events,
+            compiled.inits,
+            compiled.interacts,
+            compiled.collision_map,
+            compiled.collision_lines_map,
+            data,
+            edges,
+            filename,
+            compiled.exit_masks,
+            compiled.reachability,
+        )
+
+    def compile(
+        self,
+        data: pytmx.TiledMap,
+        tile_size: Tuple[int, int],
+        yaml_path: Optional[str] = None,
+    ) -> CompiledMap:
+        """
+        Derive the collisions and events of a map.
+
+        Parameters:
+            data: The parsed tmx map.
+            tile_size: Size of the tiles in the tmx map.
+            yaml_path: Path of a YAML file with more events for the map.
+
+        Returns:
+            The derived map data.
+
+        """
         events = list()
         inits = list()
         interacts = list()
         collision_map: Mapping[Tuple[int, int], Optional[RegionProperties]] = {}
         collision_lines_map = set()
-        edges = data.properties.get("edges")
 
         # get all tiles which have properties and/or collisions
         gids_with_props = dict()
@@ -214,17 +373,112 @@ class TMXMapLoader:
             elif obj.type == "interact":
                 interacts.append(self.load_event(obj, tile_size))
 
-        return TuxemonMap(
+        # TODO: merge the events from both sources
+        if yaml_path is not None:
+            events.extend(YAMLEventLoader().load_events(yaml_path))
+        assign_condition_ids(events, inits, interacts)
+
+        exit_masks = compute_exit_masks(
+            (data.width, data.height),
+            collision_map,
+            collision_lines_map,
+        )
+        return CompiledMap(
             events,
             inits,
             interacts,
             collision_map,
             collision_lines_map,
-            data,
-            edges,
-            filename,
+            exit_masks,
+            Reachability((data.width, data.height), exit_masks),
         )
 
+    def get_cache_path(self, filename: str) -> str:
+        """
+        Get the path of the compiled version of a map.
+
+        Parameters:
+            filename: The path to the tmx map file.
+
+        Returns:
+            Path of the compiled map in the cache directory.
+
+        """
+        assert self.cache_dir is not None
+        path = os.path.abspath(filename)
+        digest = hashlib.sha1(path.encode()).hexdigest()[:16]
+        name = os.path.splitext(os.path.basename(path))[0]
+        return os.path.join(self.cache_dir, f"{name}-{digest}.map")
+
+    def read_compiled(
+        self,
+        cache_path: str,
+    ) -> Tuple[Dict[str, FileSignature], Optional[CompiledMap]]:
+        """
+        Read a compiled map.
+
+        Missing, unreadable or outdated files are treated as empty.
+
+        Parameters:
+            cache_path: Path of the compiled map.
+
+        Returns:
+            Signatures of the files the map was compiled from, by path, and
+            the compiled map.
+
+        """
+        try:
+            with open(cache_path, "rb") as fp:
+                cached = pickle.load(fp)
+        except FileNotFoundError:
+            return {}, None
+        except Exception:
+            logger.warning("Ignoring unreadable compiled map %s", cache_path)
+            return {}, None
+
+        if cached.get("version") != COMPILED_MAP_VERSION:
+            return {}, None
+
+        return cached["sources"], cached["map"]
+
+    def write_compiled(
+        self,
+        cache_path: str,
+        signatures: Mapping[str, FileSignature],
+        compiled: CompiledMap,
+    ) -> None:
+        """
+        Write a compiled map.
+
+        The file is replaced atomically so a crash never leaves a partially
+        written file behind.
+
+        Parameters:
+            cache_path: Path of the compiled map.
+            signatures: Signatures of the files the map was compiled from,
+                by path.
+            compiled: The compiled map.
+
+        """
+        cached = {
+            "version": COMPILED_MAP_VERSION,
+            "sources": dict(signatures),
+            "map": compiled,
+        }
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        # maps can be loaded from several threads at once
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path))
+        try:
+            with os.fdopen(fd, "wb") as fp:
+                pickle.dump(cached, fp, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, cache_path)
+        except OSError:
+            logger.warning("Could not write compiled map %s", cache_path)
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        else:
+            logger.debug("wrote compiled map: %s", cache_path)
+
     def extract_tile_collisions(
         self,
         tiled_object: pytmx.TiledObject,
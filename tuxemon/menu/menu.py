@@ -14,7 +14,7 @@ from tuxemon.sprite import RelativeGroup, VisualSpriteList, SpriteGroup,\
 from tuxemon.ui.draw import GraphicBox
 from tuxemon.ui.text import TextArea
 from typing import Any, Callable, Optional, Literal, Dict, Sequence, Tuple,\
-    Iterable, TypeVar, Generic
+    Iterable, TypeVar, Generic, List
 from tuxemon.graphics import ColorLike
 from tuxemon.platform.events import PlayerInput
 from tuxemon.animation import Animation
@@ -77,6 +77,7 @@ class Menu(Generic[T], state.State):
         self.state: MenuState = "closed"  # closed, opening, normal, disabled, closing
         self._show_contents = False  # draw menu items, or not
         self._needs_refresh = False  # refresh layout on next draw
+        self._drawn_layout: Optional[Tuple[pygame.rect.Rect, bool]] = None  # for dirty rects
         self._anchors: Dict[str, Tuple[int, int]] = {}  # used to position the menu/state
         self.__dict__.update(kwargs)  # may be removed in the future
 
@@ -422,6 +423,24 @@ class Menu(Generic[T], state.State):
 
         self.sprites.draw(surface)
 
+    def get_dirty_rects(self) -> Optional[List[pygame.rect.Rect]]:
+        # menus which draw more than their sprites can't be tracked
+        if type(self).draw is not Menu.draw:
+            return None
+
+        dirty = []
+        for group in (self.menu_items, self.menu_sprites, self.sprites):
+            dirty.extend(group.get_dirty_rects())
+
+        # the window is drawn again when it moves, or the layout changes
+        layout = (self.rect.copy(), self._show_contents)
+        if self._needs_refresh or layout != self._drawn_layout:
+            if self._drawn_layout is not None:
+                dirty.append(self._drawn_layout[0])
+            dirty.append(layout[0])
+        self._drawn_layout = layout
+        return dirty
+
     def set_font(
         self,
         size: int = 5,
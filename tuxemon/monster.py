@@ -312,7 +312,7 @@ class Monster:
         self.name = T.translate(results["slug"])  # translated name
         self.description = T.translate("{}_description".format(results["slug"]))  # translated description
         self.category = T.translate(results["category"])  # translated category
-        self.shape = results.get("shape", "landrace").lower()
+        self.shape = results["shape"]
         types = results.get("types")
         if types:
             self.type1 = results["types"][0].lower()
@@ -320,27 +320,15 @@ class Monster:
                 self.type2 = results["types"][1].lower()
 
         self.weight = results["weight"]
-        self.catch_rate = results.get(
-            "catch_rate",
-            TuxemonConfig().default_monster_catch_rate,
-        )
-        self.upper_catch_resistance = results.get(
-            "upper_catch_resistance",
-            TuxemonConfig().default_upper_monster_catch_resistance,
-        )
-        self.lower_catch_resistance = results.get(
-            "lower_catch_resistance",
-            TuxemonConfig().default_lower_monster_catch_resistance,
-        )
+        self.catch_rate = results["catch_rate"]
+        self.upper_catch_resistance = results["upper_catch_resistance"]
+        self.lower_catch_resistance = results["lower_catch_resistance"]
 
         # Look up the moves that this monster can learn AND LEARN THEM.
-        moveset = results.get("moveset")
-        if moveset:
-            for move in moveset:
-                self.moveset.append(move)
-                if move["level_learned"] <= self.level:
-                    technique = Technique(move["technique"])
-                    self.learn(technique)
+        self.moveset.extend(results.get("moveset") or ())
+        for move in db.learnset(slug, max_level=self.level):
+            technique = Technique(move["technique"])
+            self.learn(technique)
 
         # Look up the evolutions for this monster.
         evolutions = results.get("evolutions")
@@ -33,7 +33,7 @@ import logging
 import os
 from math import hypot
 from typing import List, Optional, Mapping, Any, Sequence, TYPE_CHECKING, Tuple,\
-    TypedDict, Dict, Iterable, Union
+    TypedDict, Dict, Iterable, Union, Hashable
 import uuid
 
 from tuxemon.ai import AI
@@ -41,6 +41,7 @@ from tuxemon.compat import Rect
 from tuxemon import surfanim
 from tuxemon.db import db
 from tuxemon.entity import Entity
+from tuxemon.event.changes import GameVariables, PARTY, npc_key, variable_key
 from tuxemon.item.item import Item, InventoryItem
 from tuxemon.item.item import decode_inventory, encode_inventory
 from tuxemon.locale import T
@@ -65,6 +66,11 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Seconds to wait before looking for a path again after failing to find
+# one.  The wait doubles after each failure, up to the maximum.
+PATHFIND_RETRY_DELAY = 0.25
+PATHFIND_RETRY_MAX_DELAY = 4.0
+
 
 class NPCState(TypedDict):
     current_map: str
@@ -140,9 +146,9 @@ class NPC(Entity[NPCState]):
 
         # general
         self.behavior = "wander"  # not used for now
-        self.game_variables: Dict[str, Any] = {}  # Tracks the game state
-        self.interactions: Sequence[str] = []  # List of ways player can interact with the Npc
         self.isplayer = False  # used for various tests, idk
+        self.game_variables = {}  # Tracks the game state
+        self.interactions: Sequence[str] = []  # List of ways player can interact with the Npc
         self.monsters: List[Monster] = []  # This is a list of tuxemon the npc has. Do not modify directly
         self.inventory: Dict[str, InventoryItem] = {}  # The Player's inventory.
         # Variables for long-term item and monster storage
@@ -159,6 +165,9 @@ class NPC(Entity[NPCState]):
         # pathfinding and waypoint related
         self.pathfinding: Optional[Tuple[int, int]] = None
         self.path: List[Tuple[int, int]] = []
+        # failed attempts to find a path, and seconds until the next one
+        self.pathfind_failures = 0
+        self.pathfind_delay = 0.0
         self.final_move_dest = [0, 0]  # Stores the final destination sent from a client
 
         # This is used to 'set back' when lost, and make movement robust.
@@ -192,6 +201,38 @@ class NPC(Entity[NPCState]):
             self.playerHeight),
         )  # Collision rect
 
+    @property
+    def game_variables(self) -> Dict[str, Any]:
+        """Variables tracking the game state, which report their changes."""
+        return self._game_variables
+
+    @game_variables.setter
+    def game_variables(self, game_variables: Mapping[str, Any]) -> None:
+        self._game_variables = GameVariables(
+            game_variables,
+            self.notify_variable_change,
+        )
+        # the conditions only read the variables of the player, which may
+        # all have changed
+        if self.isplayer:
+            self.world.notify_change()
+
+    def notify_variable_change(self, name: str) -> None:
+        """
+        Tell the event engine that a game variable changed.
+
+        Parameters:
+            name: Name of the variable.
+
+        """
+        if self.isplayer:
+            self.world.notify_change(variable_key(name))
+
+    def get_position_keys(self) -> Tuple[Hashable, ...]:
+        if self.isplayer:
+            return npc_key(self.slug), npc_key("player")
+        return super().get_position_keys()
+
     def get_state(self, session: Session) -> NPCState:
         """
         Prepares a dictionary of the npc to be saved to a file.
@@ -334,19 +375,66 @@ class NPC(Entity[NPCState]):
         * reaches the destination
         * NPC.cancel_movement() is called
 
-        If blocked, the NPC will wait until it is able to move.
+        If blocked, the NPC will wait until it is able to move, looking for
+        a path less and less often.
 
-        Queries the world for a valid path.
+        The path is searched in the background, and followed once the
+        world gives it to ``apply_path`` on a later frame.
 
         Parameters:
             destination: Desired final position.
 
         """
+        if destination != self.pathfinding:
+            self.pathfind_failures = 0
         self.pathfinding = destination
-        path = self.world.pathfind(self.tile_pos, destination)
+        self.world.request_path(self, destination)
+
+    @property
+    def pathfind_pending(self) -> bool:
+        """Whether a path was requested, and wasn't given yet."""
+        return self.world.pathfinder.is_pending(self)
+
+    def apply_path(
+        self,
+        start: Tuple[int, int],
+        destination: Tuple[int, int],
+        path: Optional[List[Tuple[int, int]]],
+    ) -> None:
+        """
+        Start following a path found in the background.
+
+        Paths which no longer match the position or the destination of
+        the NPC are looked for again.
+
+        Parameters:
+            start: Tile position the path was searched from.
+            destination: Destination of the path.
+            path: Steps of the path, or ``None`` if there is none.
+
+        """
+        if destination != self.pathfinding:
+            return
+        if start != self.tile_pos:
+            self.pathfind(destination)
+            return
+
         if path:
+            self.pathfind_failures = 0
+            self.pathfind_delay = 0.0
             self.path = path
             self.next_waypoint()
+        else:
+            self.pathfind_delay = min(
+                PATHFIND_RETRY_DELAY * 2 ** self.pathfind_failures,
+                PATHFIND_RETRY_MAX_DELAY,
+            )
+            self.pathfind_failures += 1
+
+    def retry_pathfind(self) -> None:
+        """Look for a path again, unless waiting for one or after failures."""
+        if self.pathfinding and self.pathfind_delay <= 0 and not self.pathfind_pending:
+            self.pathfind(self.pathfinding)
 
     def check_continue(self) -> None:
         try:
@@ -378,6 +466,9 @@ class NPC(Entity[NPCState]):
         self.path = []
         self.pathfinding = None
         self.path_origin = None
+        self.pathfind_failures = 0
+        self.pathfind_delay = 0.0
+        self.world.cancel_path_request(self)
 
     def cancel_movement(self) -> None:
         """
@@ -436,9 +527,12 @@ class NPC(Entity[NPCState]):
         self.update_physics(time_delta)
         self.surface_animations.update(time_delta)
 
+        if self.pathfind_delay > 0:
+            self.pathfind_delay -= time_delta
+
         if self.pathfinding and not self.path:
             # wants to pathfind, but there was no path last check
-            self.pathfind(self.pathfinding)
+            self.retry_pathfind()
             return
 
         if self.path:
@@ -533,8 +627,9 @@ class NPC(Entity[NPCState]):
 
             if self.pathfinding:
                 # since we are pathfinding, just try a new path
-                logger.error(f"{self.slug} finding new path!")
-                self.pathfind(self.pathfinding)
+                if self.pathfind_delay <= 0:
+                    logger.error(f"{self.slug} finding new path!")
+                self.retry_pathfind()
 
             else:
                 # give up and wait until the target is clear again
@@ -601,6 +696,7 @@ class NPC(Entity[NPCState]):
         else:
             self.monsters.append(monster)
             self.set_party_status()
+            self.world.notify_change(PARTY)
 
     def find_monster(self, monster_slug: str) -> Optional[Monster]:
         """
@@ -671,6 +767,7 @@ class NPC(Entity[NPCState]):
         if monster in self.monsters:
             self.monsters.remove(monster)
             self.set_party_status()
+            self.world.notify_change(PARTY)
 
     def remove_monster_from_storage(self, monster: Monster) -> None:
         """
@@ -705,7 +802,7 @@ class NPC(Entity[NPCState]):
         self.monsters = []
 
         # Look up the NPC's details from our NPC database
-        npc_details = db.database["npc"][self.slug]
+        npc_details = db.lookup(self.slug, table="npc")
         npc_party = npc_details.get("monsters") or []
         for npc_monster_details in npc_party:
             monster = Monster(save_data=npc_monster_details)
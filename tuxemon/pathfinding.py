@@ -0,0 +1,403 @@
+#
+# Tuxemon
+# Copyright (C) 2014, William Edwards <shadowapex@gmail.com>,
+#                     Benjamin Bean <superman2k5@gmail.com>
+#
+# This file is part of Tuxemon.
+#
+# Tuxemon is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tuxemon is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tuxemon.  If not, see <http://www.gnu.org/licenses/>.
+#
+#
+# pathfinding Path searches over the tile grid of a map.
+#
+#
+
+from __future__ import annotations
+import logging
+import time
+from array import array
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from heapq import heapify, heappop, heappush
+from typing import Callable, Dict, Hashable, Iterable, List, NamedTuple,\
+    Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Get the tiles which can be moved into from a tile.
+ExitsFunction = Callable[[Tuple[int, int]], Iterable[Tuple[int, int]]]
+
+
+def find_path(
+    start: Tuple[int, int],
+    dest: Tuple[int, int],
+    size: Tuple[int, int],
+    get_exits: ExitsFunction,
+) -> Optional[List[Tuple[int, int]]]:
+    """
+    Find a shortest path between two tiles with A*.
+
+    Every step costs the same, and the Manhattan distance to the destination
+    is used as heuristic.  Tiles are identified by their index in the grid,
+    and the search keeps flat arrays of costs and parents instead of node
+    objects.
+
+    Parameters:
+        start: Initial tile position.
+        dest: Target tile position.
+        size: Width and height of the map, in tiles.
+        get_exits: Function returning the tiles which can be moved into
+            from a tile.
+
+    Returns:
+        Tile positions of the steps, from the destination back to the first
+        step (the start is not included), or ``None`` if there is no path.
+
+    """
+    width, height = size
+    if not (0 <= start[0] < width and 0 <= start[1] < height):
+        return None
+    if not (0 <= dest[0] < width and 0 <= dest[1] < height):
+        return None
+
+    dest_x, dest_y = dest
+    start_index = start[1] * width + start[0]
+    dest_index = dest_y * width + dest_x
+
+    # -1 means the tile was never reached.
+    costs = array("l", [-1]) * (width * height)
+    parents = array("l", [-1]) * (width * height)
+    costs[start_index] = 0
+
+    # Entries are (estimated total cost, estimated remaining cost, index).
+    # Ties favor the entries closer to the destination.
+    heuristic = abs(start[0] - dest_x) + abs(start[1] - dest_y)
+    open_set = [(heuristic, heuristic, start_index)]
+    while open_set:
+        total, remaining, index = heappop(open_set)
+        if index == dest_index:
+            break
+
+        cost = total - remaining
+        if cost > costs[index]:
+            # A shorter way to this tile was found after this entry was made.
+            continue
+
+        cost += 1
+        for exit_x, exit_y in get_exits((index % width, index // width)):
+            exit_x = int(exit_x)
+            exit_y = int(exit_y)
+            exit_index = exit_y * width + exit_x
+            exit_cost = costs[exit_index]
+            if exit_cost == -1 or cost < exit_cost:
+                costs[exit_index] = cost
+                parents[exit_index] = index
+                remaining = abs(exit_x - dest_x) + abs(exit_y - dest_y)
+                heappush(open_set, (cost + remaining, remaining, exit_index))
+    else:
+        return None
+
+    path = []
+    index = dest_index
+    while index != start_index:
+        path.append((index % width, index // width))
+        index = parents[index]
+
+    return path
+
+
+class FlowField:
+    """
+    Shortest paths from any tile to a single destination.
+
+    Paths are searched backwards from the destination with A*, and the
+    search is resumed for every new start tile, so many entities heading
+    to the same tile share one search.  Once a tile has been reached, the
+    next step from it is read in constant time.
+
+    The field is only valid as long as the exits don't change.
+
+    Parameters:
+        dest: Target tile position.
+        size: Width and height of the map, in tiles.
+        get_exits: Function returning the tiles which can be moved into
+            from a tile.
+
+    """
+
+    def __init__(
+        self,
+        dest: Tuple[int, int],
+        size: Tuple[int, int],
+        get_exits: ExitsFunction,
+    ) -> None:
+        self.dest = dest
+        self.width, self.height = size
+        self.get_exits = get_exits
+        count = self.width * self.height
+
+        # -1 means the tile was never reached.
+        self.costs = array("l", [-1]) * count
+        # Next tile on the way to the destination.
+        self.parents = array("l", [-1]) * count
+        # Whether the cost of a tile is final.
+        self.closed = bytearray(count)
+        # Exits of the tiles looked at so far, by index.
+        self.exits: Dict[int, Set[int]] = {}
+
+        # Entries are (estimated total cost, estimated remaining cost, index),
+        # estimated towards the start of the last search.
+        self.open_set: List[Tuple[int, int, int]] = []
+        self.target: Optional[int] = None
+
+        if 0 <= dest[0] < self.width and 0 <= dest[1] < self.height:
+            dest_index = dest[1] * self.width + dest[0]
+            self.costs[dest_index] = 0
+            self.open_set.append((0, 0, dest_index))
+
+    def next_step(self, position: Tuple[int, int]) -> Optional[Tuple[int, int]]:
+        """
+        Get the next step from a tile, if it was already reached.
+
+        Parameters:
+            position: Tile position.
+
+        Returns:
+            Position of the next step, or ``None`` if the tile wasn't
+            reached yet or is the destination.
+
+        """
+        index = position[1] * self.width + position[0]
+        if not self.closed[index]:
+            return None
+        parent = self.parents[index]
+        if parent == -1:
+            return None
+        return parent % self.width, parent // self.width
+
+    def find_path(
+        self,
+        start: Tuple[int, int],
+    ) -> Optional[List[Tuple[int, int]]]:
+        """
+        Find a shortest path from a tile to the destination.
+
+        Parameters:
+            start: Initial tile position.
+
+        Returns:
+            Tile positions of the steps, from the destination back to the
+            first step (the start is not included), or ``None`` if there
+            is no path.
+
+        """
+        width, height = self.width, self.height
+        if not (0 <= start[0] < width and 0 <= start[1] < height):
+            return None
+
+        start_index = start[1] * width + start[0]
+        if not self.closed[start_index] and not self.search(start_index):
+            return None
+
+        path = []
+        index = self.parents[start_index]
+        while index != -1:
+            path.append((index % width, index // width))
+            index = self.parents[index]
+        path.reverse()
+        return path
+
+    def search(self, start_index: int) -> bool:
+        """
+        Resume the search until a tile is reached.
+
+        Parameters:
+            start_index: Index of the tile.
+
+        Returns:
+            Whether the tile can reach the destination.
+
+        """
+        width = self.width
+        start_x = start_index % width
+        start_y = start_index // width
+        costs = self.costs
+        closed = self.closed
+        open_set = self.open_set
+
+        if self.target != start_index:
+            # Closed tiles keep their final cost, and the open ones are
+            # estimated again towards the new start.
+            self.target = start_index
+            entries = {}
+            for total, remaining, index in open_set:
+                if not closed[index]:
+                    entries[index] = costs[index]
+            open_set[:] = []
+            for index, cost in entries.items():
+                remaining = abs(index % width - start_x) + abs(index // width - start_y)
+                open_set.append((cost + remaining, remaining, index))
+            heapify(open_set)
+
+        while open_set:
+            total, remaining, index = heappop(open_set)
+            if closed[index]:
+                continue
+
+            cost = total - remaining
+            if cost > costs[index]:
+                # A shorter way to this tile was found after this entry was made.
+                continue
+
+            closed[index] = 1
+            x = index % width
+            y = index // width
+            cost += 1
+            for other_x, other_y in ((x, y - 1), (x - 1, y), (x, y + 1), (x + 1, y)):
+                if not (0 <= other_x < width and 0 <= other_y < self.height):
+                    continue
+                other = other_y * width + other_x
+                if closed[other]:
+                    continue
+                other_cost = costs[other]
+                if other_cost != -1 and other_cost <= cost:
+                    continue
+                if index not in self.get_tile_exits(other):
+                    continue
+                costs[other] = cost
+                self.parents[other] = index
+                remaining = abs(other_x - start_x) + abs(other_y - start_y)
+                heappush(open_set, (cost + remaining, remaining, other))
+
+            # Expanded before returning, so the search can be resumed.
+            if index == start_index:
+                return True
+
+        return False
+
+    def get_tile_exits(self, index: int) -> Set[int]:
+        """Get the indices of the tiles which can be moved into from a tile."""
+        exits = self.exits.get(index)
+        if exits is None:
+            width = self.width
+            exits = {
+                int(exit_y) * width + int(exit_x)
+                for exit_x, exit_y in self.get_exits((index % width, index // width))
+            }
+            self.exits[index] = exits
+        return exits
+
+
+class PathRequest(NamedTuple):
+    dest: Tuple[int, int]
+    future: Future
+    apply: Callable[[Tuple[int, int], Optional[List[Tuple[int, int]]]], None]
+
+
+class PathfindingService:
+    """
+    Search paths in worker threads, and deliver them on later frames.
+
+    Each owner, usually an entity, has at most one request in flight.  The
+    searches must only use data which doesn't change whilst they run, such
+    as a snapshot of the collisions.
+
+    Parameters:
+        workers: Number of worker threads.
+        budget: Seconds that may be spent applying results in a frame.
+
+    """
+
+    def __init__(self, workers: int = 1, budget: float = 0.002) -> None:
+        self.executor = ThreadPoolExecutor(max(1, workers))
+        self.budget = budget
+        # Requests in the order they were made, by owner.
+        self.requests: Dict[Hashable, PathRequest] = OrderedDict()
+
+    def submit(
+        self,
+        owner: Hashable,
+        dest: Tuple[int, int],
+        search: Callable[[], Optional[List[Tuple[int, int]]]],
+        apply: Callable[[Tuple[int, int], Optional[List[Tuple[int, int]]]], None],
+    ) -> None:
+        """
+        Start searching a path, replacing the request of the owner.
+
+        Parameters:
+            owner: Who asked for the path.
+            dest: Target tile position.
+            search: Function searching the path, run in a worker thread.
+            apply: Function receiving the destination and the path, run by
+                ``deliver``.
+
+        """
+        self.cancel(owner)
+        future = self.executor.submit(search)
+        self.requests[owner] = PathRequest(dest, future, apply)
+
+    def cancel(self, owner: Hashable) -> None:
+        """
+        Forget the request of an owner, so its result is never applied.
+
+        Parameters:
+            owner: Who asked for the path.
+
+        """
+        request = self.requests.pop(owner, None)
+        if request is not None:
+            request.future.cancel()
+
+    def is_pending(self, owner: Hashable) -> bool:
+        """Check if an owner is waiting for a path."""
+        return owner in self.requests
+
+    def deliver(self) -> int:
+        """
+        Apply the results of the finished searches, oldest first.
+
+        Stops once the budget of the frame is spent, but always applies at
+        least one result so no request is starved.
+
+        Returns:
+            Number of results applied.
+
+        """
+        start = time.perf_counter()
+        applied = 0
+        for owner, request in list(self.requests.items()):
+            if not request.future.done():
+                continue
+            if applied and time.perf_counter() - start > self.budget:
+                break
+            del self.requests[owner]
+            try:
+                path = request.future.result()
+            except Exception:
+                logger.exception(f"Pathfinding to {request.dest} failed")
+                path = None
+            request.apply(request.dest, path)
+            applied += 1
+        return applied
+
+    def clear(self) -> None:
+        """Forget all the requests."""
+        for request in self.requests.values():
+            request.future.cancel()
+        self.requests.clear()
+
+    def shutdown(self) -> None:
+        """Forget all the requests, and stop the workers."""
+        self.clear()
+        self.executor.shutdown(wait=False)
@@ -139,7 +139,10 @@ def pygame_init() -> None:
     # Configure databases
     from tuxemon.db import db
 
-    db.load()
+    snapshot_path = None
+    if CONFIG.db_snapshot:
+        snapshot_path = os.path.join(paths.CACHE_DIR, "db.snapshot")
+    db.load(snapshot_path=snapshot_path)
 
     logger.debug("pygame init")
     pg.init()
@@ -38,7 +38,7 @@ from tuxemon.surfanim import SurfaceAnimation
 from tuxemon import graphics
 from tuxemon.tools import scale as tuxemon_scale
 from typing import Optional, Callable, Any, Sequence, List, Union, TYPE_CHECKING,\
-    TypeVar, Generic, Iterator, overload, Final, Literal, Container
+    TypeVar, Generic, Iterator, overload, Final, Literal, Container, Dict, Tuple
 from tuxemon.platform.events import PlayerInput
 
 if TYPE_CHECKING:
@@ -305,6 +305,8 @@ class SpriteGroup(pygame.sprite.LayeredUpdates, Generic[_GroupElement]):
 
     def __init__(self, *, default_layer: int = 0) -> None:
         super().__init__(default_layer=default_layer)
+        # Screen rect and image of each sprite at the last dirty check.
+        self._drawn: Dict[Sprite, Tuple[pygame.rect.Rect, pygame.surface.Surface]] = {}
 
     def add(self, *sprites: pygame.sprite.Sprite, **kwargs: Any) -> None:
         return pygame.sprite.LayeredUpdates.add(self, *sprites, **kwargs)
@@ -348,6 +350,46 @@ class SpriteGroup(pygame.sprite.LayeredUpdates, Generic[_GroupElement]):
         else:
             return sprites[0].rect.unionall([s.rect for s in sprites[1:]])
 
+    def get_dirty_rects(self) -> List[pygame.rect.Rect]:
+        """
+        Get the areas of the screen that changed since the last call.
+
+        A sprite changed if it was added, removed or moved, if its image
+        was replaced, or if its ``dirty`` flag was set after drawing into
+        its image.  Both the old and the new area of a changed sprite are
+        returned.
+
+        Returns:
+            Changed areas.
+
+        """
+        offset = self.get_screen_offset()
+        previous = self._drawn
+        drawn = {}
+        dirty = []
+        for sprite in self.sprites():
+            rect = sprite.rect.move(offset)
+            image = sprite.image
+            flag = getattr(sprite, "dirty", 0)
+            last = previous.pop(sprite, None)
+            if last is None:
+                dirty.append(rect)
+            elif flag or last[0] != rect or last[1] is not image:
+                dirty.append(last[0])
+                dirty.append(rect)
+            if flag == 1:
+                sprite.dirty = 0
+            drawn[sprite] = (rect, image)
+
+        # the sprites left were removed
+        dirty.extend(rect for rect, image in previous.values())
+        self._drawn = drawn
+        return dirty
+
+    def get_screen_offset(self) -> Tuple[int, int]:
+        """Position of the origin of the sprite rects on the screen."""
+        return 0, 0
+
 
 _MenuElement = TypeVar("_MenuElement", bound="MenuItem[Any]")
 
@@ -440,6 +482,10 @@ class RelativeGroup(MenuSpriteGroup[_MenuElement]):
         else:
             self.rect = pygame.rect.Rect(self.parent.rect)
 
+    def get_screen_offset(self) -> Tuple[int, int]:
+        self.update_rect_from_parent()
+        return self.rect.topleft
+
     def draw(
         self,
         surface: pygame.surface.Surface,
@@ -531,6 +577,11 @@ class VisualSpriteList(RelativeGroup[_MenuElement]):
             self.arrange_menu_items()
         super().draw(surface)
 
+    def get_dirty_rects(self) -> List[pygame.rect.Rect]:
+        if self._needs_arrange:
+            self.arrange_menu_items()
+        return super().get_dirty_rects()
+
     def arrange_menu_items(self) -> None:
         """
         Iterate through menu items and position them in the menu.
@@ -234,6 +234,20 @@ class State:
 
         """
 
+    def get_dirty_rects(self) -> Optional[List[Rect]]:
+        """
+        Get the areas of the screen that changed since the last call.
+
+        Used when drawing only the dirty areas of the screen.  It is called
+        once per frame, before drawing.  States which don't keep track of
+        their changes return ``None``, and the whole screen is drawn.
+
+        Returns:
+            Changed areas, or ``None`` if unknown.
+
+        """
+        return None
+
     def startup(self, **kwargs: Any) -> None:
         """
         Called when scene is added to the state stack.
@@ -317,6 +331,8 @@ class StateManager:
         self._state_stack: List[State] = list()
         self._state_dict: Dict[str, Type[State]] = dict()
         self._resume_set: Set[State] = set()
+        # states drawn in the last frame, from the top
+        self._drawn_states: List[State] = []
 
     def auto_state_discovery(self) -> None:
         """
@@ -664,6 +680,38 @@ class StateManager:
         """
         return self._state_stack[:]
 
+    def get_dirty_rects(
+        self,
+        states: Sequence[State],
+        screen_rect: Rect,
+    ) -> Optional[List[Rect]]:
+        """
+        Get the areas of the screen that changed since the last frame.
+
+        Parameters:
+            states: States to be drawn, from the top.
+            screen_rect: Area of the screen.
+
+        Returns:
+            Changed areas, or ``None`` if the whole screen must be drawn.
+
+        """
+        # every state is asked, so they all remember what they drew
+        reports = [state.get_dirty_rects() for state in states]
+        if list(states) != self._drawn_states:
+            self._drawn_states = list(states)
+            return None
+
+        dirty = []
+        for report in reports:
+            if report is None:
+                return None
+            for rect in report:
+                rect = rect.clip(screen_rect)
+                if rect.width and rect.height:
+                    dirty.append(rect)
+        return dirty
+
     @property
     def queued_states(self) -> Sequence[Tuple[str, Mapping[str, Any]]]:
         """
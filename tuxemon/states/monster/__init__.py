@@ -201,6 +201,7 @@ class MonsterMenuState(Menu[Optional[Monster]]):
                 item.game_object,
                 item.in_focus,
             )
+            item.dirty = 1
 
     def draw_monster_info(
         self,
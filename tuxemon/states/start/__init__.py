@@ -34,9 +34,10 @@ from __future__ import annotations
 
 import logging
 from functools import partial
-from typing import Any, Callable, Union
+from typing import Any, Callable, List, Optional, Union
 
 import pygame
+from pygame.rect import Rect
 
 from tuxemon import prepare
 from tuxemon.locale import T
@@ -68,6 +69,10 @@ class BackgroundState(State):
     def draw(self, surface: pygame.surface.Surface) -> None:
         surface.fill((0, 0, 0, 0))
 
+    def get_dirty_rects(self) -> Optional[List[Rect]]:
+        # the fill never changes
+        return []
+
 class StartState(PopUpMenu[StartGameObj]):
     """The state responsible for the start menu."""
 
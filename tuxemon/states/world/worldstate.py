@@ -30,21 +30,27 @@ from __future__ import annotations
 import itertools
 import logging
 import os
+from functools import partial
 
 import pygame
+from pytmx.pytmx import default_image_loader
 
 from pygame.rect import Rect
 from tuxemon import prepare, state, networking
-from tuxemon.map import PathfindNode, dirs2, pairs, proj, RegionProperties,\
-    Direction, TuxemonMap
-from tuxemon.map_loader import TMXMapLoader, YAMLEventLoader
+from tuxemon.constants import paths
+from tuxemon.event.changes import npc_key
+from tuxemon.map import dirs2, pairs, proj, RegionProperties, Direction,\
+    TuxemonMap, CollisionGrid, Reachability, exit_bits
+from tuxemon.map_cache import MapCache, get_teleport_targets
+from tuxemon.map_loader import TMXMapLoader
+from tuxemon.pathfinding import PathfindingService
 from tuxemon.platform.const import intentions
 from tuxemon.platform.const import buttons, events
 from tuxemon.platform.events import PlayerInput
 from tuxemon.session import local_session
 from tuxemon.graphics import ColorLike
 from typing import Optional, Sequence, Mapping, Tuple, Union, TypedDict, Dict,\
-    List, Set, Any, Literal, TYPE_CHECKING
+    List, Set, Any, Literal, TYPE_CHECKING, Hashable
 from tuxemon.entity import Entity
 from tuxemon.surfanim import SurfaceAnimation
 from tuxemon.states.world.world_menus import WorldMenuState
@@ -83,17 +89,17 @@ class CinemaSurfaceInfo(TypedDict):
     position: List[int]
 
 
-CollisionDict = Dict[
-    Tuple[int, int],
-    Union[EntityCollision, RegionProperties, None],
-]
-
 CollisionMap = Mapping[
     Tuple[int, int],
     Union[EntityCollision, RegionProperties, None],
 ]
 
 
+def no_path() -> None:
+    """Path search for a tile which can't be reached."""
+    return None
+
+
 class WorldState(state.State):
     """The state responsible for the world game play"""
 
@@ -136,6 +142,15 @@ class WorldState(state.State):
         ######################################################################
 
         self.current_map: TuxemonMap
+        self.collision_grid = CollisionGrid((0, 0), {})
+        self.reachability: Optional[Reachability] = None
+        self.pathfinder = PathfindingService(
+            prepare.CONFIG.pathfind_workers,
+            prepare.CONFIG.pathfind_budget / 1000,
+        )
+        self.map_cache = MapCache(self.load_map, prepare.CONFIG.map_cache_size)
+        # what was drawn in the last frame, for dirty rects
+        self._drawn_view: Optional[Tuple[Any, ...]] = None
 
         ######################################################################
         #                            Transitions                             #
@@ -212,6 +227,11 @@ class WorldState(state.State):
         self.lock_controls()
         self.stop_player()
 
+    def shutdown(self) -> None:
+        """Called when the state is removed from the stack"""
+        self.map_cache.shutdown()
+        self.pathfinder.shutdown()
+
     def fade_and_teleport(self, duration: float = 2) -> None:
         """
         Fade out, teleport, fade in.
@@ -337,6 +357,7 @@ class WorldState(state.State):
 
         """
         super().update(time_delta)
+        self.pathfinder.deliver()
         self.update_npcs(time_delta)
         for anim_data in self.map_animations.values():
             anim_data["animation"].update(time_delta)
@@ -356,6 +377,48 @@ class WorldState(state.State):
         self.map_drawing(surface)
         self.fullscreen_animations(surface)
 
+    def get_dirty_rects(self) -> Optional[List[Rect]]:
+        # the world is drawn whole, but only when something on it changed,
+        # so menus and dialogs shown over a still world are cheap
+        view = self.get_view()
+        if view is None or view != self._drawn_view:
+            self._drawn_view = view
+            return None
+        return []
+
+    def get_view(self) -> Optional[Tuple[Any, ...]]:
+        """
+        Get what the world looks like, to tell if it must be drawn again.
+
+        Returns:
+            A value which changes with the camera, the sprites of the NPCs,
+            the map animations and the transition, or ``None`` if it
+            can't be known, as when the tiles of the map are animated.
+
+        """
+        renderer = self.current_map.renderer
+        if renderer is None or renderer.data._animation_queue:
+            return None
+
+        sprites = []
+        for npc in self.npcs.values():
+            for surface, position, layer in npc.get_sprites(self.current_map.sprite_layer):
+                sprites.append((surface, tuple(position), layer))
+        for anim_data in self.map_animations.values():
+            anim = anim_data["animation"]
+            if not anim.is_finished() and anim.visibility:
+                sprites.append(
+                    (
+                        anim.get_current_frame(),
+                        tuple(anim_data["position"]),
+                        anim_data["layer"],
+                    )
+                )
+
+        transition = self.transition_alpha if self.in_transition else None
+        camera = self.project(self.player.position3)
+        return self.current_map, camera, sprites, transition
+
     def translate_input_event(self, event: PlayerInput) -> PlayerInput:
         try:
             return PlayerInput(
@@ -560,7 +623,12 @@ class WorldState(state.State):
 
         # Maybe in the future the world should have a dict of entities instead?
         if isinstance(entity, NPC):
+            replaced = self.npcs.get(entity.slug)
+            if replaced is not None:
+                self.collision_grid.remove_entity(replaced)
             self.npcs[entity.slug] = entity
+            self.collision_grid.add_entity(entity)
+            self.notify_change(npc_key(entity.slug))
 
     def get_entity(self, slug: str) -> Optional[NPC]:
         """
@@ -580,7 +648,27 @@ class WorldState(state.State):
             slug: The entity slug.
 
         """
-        del self.npcs[slug]
+        npc = self.npcs.pop(slug)
+        self.collision_grid.remove_entity(npc)
+        self.pathfinder.cancel(npc)
+        self.notify_change(npc_key(slug))
+
+    def notify_change(self, *keys: Hashable) -> None:
+        """
+        Tell the event engine that inputs of the event conditions changed.
+
+        Parameters:
+            keys: Keys of the inputs, from ``tuxemon.event.changes``.  If
+                none is given, any input may have changed.
+
+        """
+        if self.client is None:
+            return
+        changes = self.client.event_engine.changes
+        if keys:
+            changes.notify(*keys)
+        else:
+            changes.notify_all()
 
     def get_all_entities(self) -> Sequence[NPC]:
         """
@@ -594,31 +682,22 @@ class WorldState(state.State):
 
     def get_collision_map(self) -> CollisionMap:
         """
-        Return dictionary for collision testing.
+        Return mapping for collision testing.
 
-        Returns a dictionary where keys are (x, y) tile tuples
-        and the values are tiles or NPCs.
+        Returns a mapping where keys are (x, y) tile tuples
+        and the values are tiles or NPCs.  Tile layout takes precedence.
+
+        The mapping is kept up to date as NPCs move, so it can be reused.
 
         # NOTE:
         This will not respect map changes to collisions
         after the map has been loaded!
 
         Returns:
-            A dictionary of collision tiles.
+            A mapping of collision tiles.
 
         """
-        # TODO: overlapping tiles/objects by returning a list
-        collision_dict: CollisionDict = {}
-
-        # Get all the NPCs' tile positions
-        for npc in self.get_all_entities():
-            pos = npc.tile_pos
-            collision_dict[pos] = {"entity": npc}
-
-        # tile layout takes precedence
-        collision_dict.update(self.collision_map)
-
-        return collision_dict
+        return self.collision_grid
 
     def pathfind(
         self,
@@ -637,22 +716,18 @@ class WorldState(state.State):
             ``None`` otherwise.
 
         """
-        pathnode = self.pathfind_r(
+        # Don't search the whole reachable area for a tile that can never
+        # be reached.
+        if self.reachability is not None and not self.reachability.can_reach(
+            start,
             dest,
-            [PathfindNode(start)],
-            set(),
-        )
-
-        if pathnode:
-            # traverse the node to get the path
-            path = []
-            while pathnode:
-                path.append(pathnode.get_value())
-                pathnode = pathnode.get_parent()
+        ):
+            logger.debug(f"Tile {dest} can't be reached from {start}")
+            return None
 
-            return path[:-1]
+        path = self.collision_grid.snapshot().find_path(start, dest)
 
-        else:
+        if path is None:
             # TODO: get current map name for a more useful error
             logger.error(
                 "Pathfinding failed to find a path from "
@@ -662,43 +737,48 @@ class WorldState(state.State):
                 + ". Are you sure that an obstacle-free path exists?"
             )
 
-            return None
+        return path
 
-    def pathfind_r(
+    def request_path(
         self,
+        npc: NPC,
         dest: Tuple[int, int],
-        queue: List[PathfindNode],
-        known_nodes: Set[Tuple[int, int]],
-    ) -> Optional[PathfindNode]:
+    ) -> None:
         """
-        Breadth first search algorithm.
+        Search a path in the background, and give it to the NPC later.
+
+        The search runs on a snapshot of the collisions, and its result is
+        passed to ``NPC.apply_path`` during a later update.
 
         Parameters:
+            npc: The NPC asking for the path.
             dest: Target tile position.
-            queue: Queue of nodes to explore.
-            known_nodes: Already explored nodes.
 
-        Returns:
-            A node with the path if it exist. ``None`` otherwise.
+        """
+        start = npc.tile_pos
+        if self.reachability is not None and not self.reachability.can_reach(
+            start,
+            dest,
+        ):
+            logger.debug(f"Tile {dest} can't be reached from {start}")
+            search = no_path
+        else:
+            search = partial(
+                self.collision_grid.snapshot().find_path,
+                start,
+                dest,
+            )
+        self.pathfinder.submit(npc, dest, search, partial(npc.apply_path, start))
 
+    def cancel_path_request(self, npc: NPC) -> None:
         """
-        # The collisions shouldn't have changed whilst we were calculating,
-        # so it saves time to reuse the map.
-        collision_map = self.get_collision_map()
-        while queue:
-            node = queue.pop(0)
-            if node.get_value() == dest:
-                return node
-            else:
-                for adj_pos in self.get_exits(
-                    node.get_value(),
-                    collision_map, known_nodes,
-                ):
-                    new_node = PathfindNode(adj_pos, node)
-                    known_nodes.add(new_node.get_value())
-                    queue.append(new_node)
+        Drop the path requested by an NPC, if it wasn't given yet.
 
-        return None
+        Parameters:
+            npc: The NPC.
+
+        """
+        self.pathfinder.cancel(npc)
 
     def get_explicit_tile_exits(
         self,
@@ -773,6 +853,23 @@ class WorldState(state.State):
         if skip_nodes is None:
             skip_nodes = set()
 
+        # use the exits precomputed at map load when possible
+        grid = self.collision_grid
+        if (
+            collision_map is grid
+            and grid.exit_masks is not None
+            and 0 <= position[0] < grid.width
+            and 0 <= position[1] < grid.height
+        ):
+            mask = grid.get_exit_mask(position)
+            exits = []
+            for direction, bit, dx, dy in exit_bits:
+                if mask & bit:
+                    neighbor = (position[0] + dx, position[1] + dy)
+                    if neighbor not in skip_nodes:
+                        exits.append(neighbor)
+            return exits
+
         # if there are explicit way to exit this position use that information,
         # handles 'continue' and 'exits'
         tile_data = collision_map.get(position)
@@ -1066,13 +1163,18 @@ class WorldState(state.State):
         # Set the currently loaded map. This is needed because the event
         # engine loads event conditions and event actions from the currently
         # loaded map. If we change maps, we need to update this.
-        logger.debug("Map was not preloaded. Loading from disk.")
-        map_data = self.load_map(map_name)
+        map_data = self.map_cache.get(map_name)
 
         self.current_map = map_data
         self.collision_map = map_data.collision_map
         self.collision_lines_map = map_data.collision_lines_map
         self.map_size = map_data.size
+        self.collision_grid = CollisionGrid(
+            self.map_size,
+            self.collision_map,
+            map_data.exit_masks,
+        )
+        self.reachability = map_data.reachability
 
         # The first coordinates that are out of bounds.
         self.invalid_x = (-1, self.map_size[0])
@@ -1080,7 +1182,8 @@ class WorldState(state.State):
 
         self.client.load_map(map_data)
 
-        # Clear out any existing NPCs
+        # Clear out any existing NPCs, and the paths they asked for
+        self.pathfinder.clear()
         self.npcs = {}
         self.npcs_off_map = {}
         self.add_player(local_session.player)
@@ -1094,6 +1197,25 @@ class WorldState(state.State):
             if eo.name.lower() == "player spawn":
                 self.player.set_position((eo.x, eo.y))
 
+        self.preload_teleport_targets(map_data)
+
+    def preload_teleport_targets(self, map_data: TuxemonMap) -> None:
+        """
+        Start loading the maps that the events of a map teleport to.
+
+        Parameters:
+            map_data: Map whose teleport destinations are preloaded.
+
+        """
+        for map_name in get_teleport_targets(map_data.events):
+            try:
+                path = prepare.fetch("maps", map_name)
+            except OSError:
+                logger.warning(f"Teleport to missing map {map_name}")
+                continue
+            if path != map_data.filename:
+                self.map_cache.preload(path)
+
     def load_map(self, path: str) -> TuxemonMap:
         """
         Returns map data as a dictionary to be used for map changing.
@@ -1105,14 +1227,16 @@ class WorldState(state.State):
             Loaded map.
 
         """
-        txmn_map = TMXMapLoader().load(path)
-        yaml_path = path[:-4] + ".yaml"
-        # TODO: merge the events from both sources
-        if os.path.exists(yaml_path):
-            new_events = list(txmn_map.events)
-            new_events.extend(YAMLEventLoader().load_events(yaml_path))
-            txmn_map.events = new_events
-        return txmn_map
+        yaml_path: Optional[str] = path[:-4] + ".yaml"
+        if not os.path.exists(yaml_path):
+            yaml_path = None
+        cache_dir = None
+        if prepare.CONFIG.compiled_maps:
+            cache_dir = os.path.join(paths.CACHE_DIR, "maps")
+        # maps can be preloaded on a worker thread, so their images are
+        # loaded by the map cache when they are used
+        loader = TMXMapLoader(cache_dir, default_image_loader)
+        return loader.load(path, yaml_path)
 
     def check_interactable_space(self) -> bool:
         """
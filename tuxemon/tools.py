@@ -38,7 +38,8 @@ if more appropriate.  Ideally this should be kept small.
 
 from __future__ import annotations
 from typing import (Any, Optional, Protocol, Sequence, Tuple, Type, TypeVar,
-    Union, Mapping, Iterable, TYPE_CHECKING, Callable, NoReturn)
+    Union, Mapping, Iterable, TYPE_CHECKING, Callable, NoReturn, Dict, Generic,
+    List)
 import typing
 from tuxemon.math import Vector2
 
@@ -297,17 +298,103 @@ def get_types_tuple(
         return (param_type,)
 
 
+class ParameterCaster(Generic[NamedTupleTypeVar]):
+    """
+    Cast parameters to a named tuple, with its type hints resolved once.
+
+    Resolving the type hints is slow, so a caster is made for each class
+    and reused.  Parameters which can't be cast go through ``cast_values``,
+    so the errors are the same.
+
+    Parameters:
+        namedtuple_class: Class of the parameters.
+
+    """
+
+    def __init__(self, namedtuple_class: Type[NamedTupleTypeVar]) -> None:
+        self.namedtuple_class = namedtuple_class
+        type_hints = typing.get_type_hints(namedtuple_class)
+        self.valid_parameters = [
+            (get_types_tuple(type_hints[f]), f)
+            for f in namedtuple_class._fields
+        ]
+        # For each field, whether it accepts None and its constructors.
+        self.fields: List[Tuple[bool, Sequence[Callable[[Any], Any]]]] = []
+        for types, name in self.valid_parameters:
+            nullable = None in types or type(None) in types
+            constructors = tuple(
+                constructor
+                for constructor in types
+                if constructor and constructor is not type(None)
+            )
+            self.fields.append((nullable, constructors))
+
+    def __call__(self, parameters: Sequence[Any]) -> NamedTupleTypeVar:
+        """
+        Cast the parameters.
+
+        Parameters:
+            parameters: Parameters passed to the scripted object.
+
+        Returns:
+            Parameters converted to their correct type.
+
+        """
+        count = len(parameters)
+        if count > len(self.fields):
+            return self.cast_slowly(parameters)
+
+        values = []
+        for index, (nullable, constructors) in enumerate(self.fields):
+            value = parameters[index] if index < count else None
+            if nullable and (value is None or value == ""):
+                values.append(None)
+                continue
+            for constructor in constructors:
+                try:
+                    values.append(constructor(value))
+                    break
+                except (ValueError, TypeError):
+                    pass
+            else:
+                return self.cast_slowly(parameters)
+
+        return self.namedtuple_class(*values)
+
+    def cast_slowly(self, parameters: Sequence[Any]) -> NamedTupleTypeVar:
+        values = cast_values(parameters, self.valid_parameters)
+        return self.namedtuple_class(*values)
+
+
+# Casters of the parameter classes, made when first used.
+parameter_casters: Dict[Type[Any], ParameterCaster[Any]] = {}
+
+
+def get_parameter_caster(
+    namedtuple_class: Type[NamedTupleTypeVar],
+) -> ParameterCaster[NamedTupleTypeVar]:
+    """
+    Get the caster of a parameter class, making it if needed.
+
+    Parameters:
+        namedtuple_class: Class of the parameters.
+
+    Returns:
+        The caster of the class.
+
+    """
+    caster = parameter_casters.get(namedtuple_class)
+    if caster is None:
+        caster = ParameterCaster(namedtuple_class)
+        parameter_casters[namedtuple_class] = caster
+    return caster
+
+
 def cast_parameters_to_namedtuple(
     parameters: Sequence[Any],
     namedtuple_class: Type[NamedTupleTypeVar],
 ) -> NamedTupleTypeVar:
-    valid_parameters = [
-        (get_types_tuple(typing.get_type_hints(namedtuple_class)[f]), f)
-        for f in namedtuple_class._fields
-    ]
-
-    values = cast_values(parameters, valid_parameters)
-    return namedtuple_class(*values)
+    return get_parameter_caster(namedtuple_class)(parameters)
 
 
 def show_item_result_as_dialog(
@@ -56,6 +56,7 @@ class TextArea(Sprite):
             try:
                 dest, scrap = next(self._iter)
                 self.image.blit(scrap, dest)
+                self.dirty = 1
             except StopIteration:
                 self.drawing_text = False
                 raise